@@ -0,0 +1,45 @@
+import pytest
+
+import caterpillar
+from caterpillar.context import O_CONTEXT_FACTORY
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    # The benchmark fixture is provided by pytest-benchmark, see README.md
+    collect_ignore_glob = ["test_*.py"]
+
+#: Number of records (or elements) used by every benchmark.
+SIZES = (16, 1024, 16384)
+
+
+@pytest.fixture(
+    params=[
+        "py",
+        pytest.param(
+            "c",
+            marks=pytest.mark.skipif(
+                not caterpillar.native_support(),
+                reason="C extension is not available",
+            ),
+        ),
+    ]
+)
+def backend(request: pytest.FixtureRequest):
+    """Runs a benchmark with the Python and (if available) the C context."""
+    if request.param == "c":
+        from caterpillar._C import c_Context
+
+        previous = O_CONTEXT_FACTORY.value
+        O_CONTEXT_FACTORY.value = c_Context
+        try:
+            yield request.param
+        finally:
+            O_CONTEXT_FACTORY.value = previous
+    else:
+        yield request.param
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: f"n={size}")
+def size(request: pytest.FixtureRequest) -> int:
+    return request.param
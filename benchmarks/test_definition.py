@@ -0,0 +1,47 @@
+import pytest
+
+from caterpillar.py import (
+    CString,
+    Bytes,
+    bitfield,
+    struct,
+    this,
+    uint8,
+    uint16,
+    uint32,
+)
+from caterpillar.shortcuts import f
+
+pytestmark = pytest.mark.benchmark(group="definition")
+
+
+def define_struct() -> type:
+    @struct
+    class Record:
+        length: f[int, uint8]
+        version: f[int, uint16]
+        values: f[list[int], uint32[4]]
+        payload: f[bytes, Bytes(this.length)]
+        name: f[str, CString(8)]
+        flags: f[int, uint8] = 0
+
+    return Record
+
+
+def define_bitfield() -> type:
+    @bitfield
+    class Flags:
+        enabled: 1
+        kind: 3
+        level: 4
+        value: 5 - uint16
+
+    return Flags
+
+
+def test_define_struct(benchmark):
+    assert benchmark(define_struct).__struct__ is not None
+
+
+def test_define_bitfield(benchmark):
+    assert benchmark(define_bitfield).__struct__ is not None
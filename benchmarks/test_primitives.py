@@ -0,0 +1,56 @@
+import pytest
+
+import caterpillar
+from caterpillar.py import pack, unpack, uint8, uint32, float64, vint
+
+pytestmark = pytest.mark.benchmark(group="primitives")
+
+
+def test_unpack_uint32_array(benchmark, backend, size):
+    field = uint32[size]
+    data = pack(list(range(size)), field)
+    assert benchmark(unpack, field, data) == list(range(size))
+
+
+def test_pack_uint32_array(benchmark, backend, size):
+    field = uint32[size]
+    values = list(range(size))
+    assert len(benchmark(pack, values, field)) == size * 4
+
+
+def test_unpack_float64_greedy(benchmark, backend, size):
+    data = pack([0.5] * size, float64[size])
+    assert len(benchmark(unpack, float64[...], data)) == size
+
+
+def test_unpack_varint_array(benchmark, backend, size):
+    field = vint[size]
+    values = [i * 997 for i in range(size)]
+    data = pack(values, field)
+    assert benchmark(unpack, field, data) == values
+
+
+def test_unpack_varint_greedy(benchmark, backend, size):
+    values = [i * 997 for i in range(size)]
+    data = pack(values, vint[size])
+    assert benchmark(unpack, vint[...], data) == values
+
+
+def test_unpack_varint_single(benchmark, backend):
+    data = pack(300, vint)
+    assert benchmark(unpack, vint, data) == 300
+
+
+def test_pack_varint_array(benchmark, backend, size):
+    field = vint[size]
+    values = [i * 997 for i in range(size)]
+    assert benchmark(pack, values, field)
+
+
+@pytest.mark.skipif(not caterpillar.native_support(), reason="C extension is not available")
+def test_unpack_uint8_repeated_c(benchmark, size):
+    from caterpillar._C import Repeated
+
+    atom = Repeated(uint8, size)
+    data = bytes(size)
+    assert len(benchmark(unpack, atom, data)) == size
@@ -0,0 +1,66 @@
+import typing
+
+import pytest
+
+from caterpillar.py import (
+    Bytes,
+    CString,
+    pack,
+    struct,
+    uint32,
+    unpack,
+    uintptr,
+    x86,
+)
+from caterpillar.fields.compression import ZLibCompressed
+from caterpillar.fields.digest import DigestField, Sha2_256_Algo, Sha2_256_Field
+from caterpillar.shortcuts import f
+
+pytestmark = pytest.mark.benchmark(group="special")
+
+
+@struct
+class Checked:
+    if not typing.TYPE_CHECKING:
+        _hash_begin: DigestField.begin("hash", Sha2_256_Algo)
+
+    payload: f[bytes, Bytes(64)]
+    hash: f[bytes, Sha2_256_Field("hash", verify=True)] = b""
+
+
+@struct
+class Named:
+    name: f[typing.Any, uintptr * CString()]
+
+
+def test_unpack_digest(benchmark, backend, size):
+    field = Checked[size]
+    data = pack([Checked(payload=bytes(64))] * size, field)
+    assert len(benchmark(unpack, field, data)) == size
+
+
+def test_unpack_pointers(benchmark, backend, size):
+    # pointer table (and some reserved space) followed by the string pool
+    table = 8 * size
+    pool = b"".join(f"name-{i}\x00".encode() for i in range(size))
+    offsets, pos = [], table
+    for i in range(size):
+        offsets.append(pos)
+        pos += len(f"name-{i}") + 1
+    data = pack(offsets, uint32[size]) + bytes(4 * size) + pool
+    field = Named[size]
+    # uintptr depends on the architecture, we use a fixed 32-bit layout here
+    assert len(benchmark(unpack, field, data, arch=x86)) == size
+
+
+def test_unpack_compressed(benchmark, backend, size):
+    field = ZLibCompressed(...)
+    payload = pack(list(range(size)), uint32[size])
+    data = pack(payload, field)
+    assert benchmark(unpack, field, data) == payload
+
+
+def test_pack_compressed(benchmark, backend, size):
+    field = ZLibCompressed(...)
+    payload = pack(list(range(size)), uint32[size])
+    assert benchmark(pack, payload, field)
@@ -0,0 +1,82 @@
+import pytest
+
+from caterpillar.py import (
+    CString,
+    Prefixed,
+    bitfield,
+    pack,
+    struct,
+    this,
+    uint8,
+    uint16,
+    uint32,
+    unpack,
+)
+from caterpillar.shortcuts import f
+
+pytestmark = pytest.mark.benchmark(group="structs")
+
+
+@bitfield
+class Flags:
+    enabled: 1
+    kind: 3
+    level: 4
+
+
+@struct
+class Header:
+    magic: f[int, uint32]
+    version: f[int, uint16]
+    flags: Flags
+
+
+@struct
+class Record:
+    header: Header
+    length: f[int, uint8]
+    values: f[list[int], uint16[this.length]]
+    name: f[str, CString()]
+    comment: f[bytes, Prefixed(uint8)]
+
+
+def make_records(size: int) -> list[Record]:
+    return [
+        Record(
+            header=Header(magic=0xCAFEBABE, version=i & 0xFFFF, flags=Flags(True, 3, 7)),
+            length=3,
+            values=[1, 2, 3],
+            name=f"record-{i}",
+            comment=b"comment",
+        )
+        for i in range(size)
+    ]
+
+
+def test_unpack_nested_structs(benchmark, backend, size):
+    field = Record[size]
+    data = pack(make_records(size), field)
+    assert len(benchmark(unpack, field, data)) == size
+
+
+def test_pack_nested_structs(benchmark, backend, size):
+    field = Record[size]
+    records = make_records(size)
+    assert benchmark(pack, records, field)
+
+
+def test_unpack_bitfields(benchmark, backend, size):
+    field = Flags[size]
+    data = pack([Flags(True, 3, 7)] * size, field)
+    assert len(benchmark(unpack, field, data)) == size
+
+
+def test_unpack_cstring_table(benchmark, backend, size):
+    names = [f"symbol_{i}" for i in range(size)]
+    data = b"\x00".join(name.encode() for name in names) + b"\x00"
+    assert benchmark(unpack, CString[size], data) == names
+
+
+def test_unpack_cstring_greedy(benchmark, backend, size):
+    data = b"symbol\x00" * size
+    assert len(benchmark(unpack, CString[...], data)) == size
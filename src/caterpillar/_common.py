@@ -14,7 +14,11 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # pyright: reportPrivateUsage=false, reportExplicitAny=false, reportCallIssue=false
 from collections.abc import Collection
+from io import BufferedRandom, BufferedReader, BytesIO, FileIO
+from mmap import mmap
+from stat import S_ISREG
 import itertools
+import os
 
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Callable
@@ -27,6 +31,7 @@ from caterpillar.abc import (
     _StreamType,
     _LengthT,
     _SupportsPack,
+    _ArrayFactoryLike,
 )
 from caterpillar.context import (
     CTX_PATH,
@@ -35,6 +40,8 @@ from caterpillar.context import (
     CTX_OBJECT,
     CTX_STREAM,
     CTX_SEQ,
+    CTX_STREAM_SIZE,
+    CTX_TUPLE,
     O_CONTEXT_FACTORY,
     Context,
 )
@@ -43,8 +50,11 @@ from caterpillar.exception import (
     StructException,
     InvalidValueError,
     ValidationError,
+    set_error_context,
 )
 from caterpillar.options import O_ARRAY_FACTORY
+from caterpillar.shared import ATTR_SKIP
+from caterpillar.stream import ReadAheadStream
 
 if TYPE_CHECKING:
     from caterpillar.fields import Field
@@ -118,6 +128,9 @@ def unpack_seq(
                 f"Prefix struct returned non-integer: {length!r}", context
             )
 
+    # The total length of the stream is resolved once, so that greedy
+    # sequences only compare positions instead of probing the stream.
+    end = context_stream_size(context, stream) if greedy else None
     for i in range(length) if not greedy else itertools.count():  # pyright: ignore[reportArgumentType]
         try:
             seq_context[CTX_PATH] = f"{base_path}.{i}"
@@ -125,20 +138,77 @@ def unpack_seq(
             values.append(unpack_one(seq_context))
             # NOTE: we introduce this check to reduce time when unpacking
             # a greedy range of elements.
-            if greedy and iseof(stream):
-                break
+            if greedy:
+                if end is not None:
+                    if stream.tell() >= end:
+                        break
+                elif iseof(stream):
+                    break
         except Stop:
             break
         except Exception as exc:
             if greedy:
                 break
-            raise StructException(str(exc), context) from exc
+            # errors are wrapped once by unpack(), which uses the recorded path
+            set_error_context(exc, seq_context)
+            raise
     # fmt: on
-    if O_ARRAY_FACTORY.value:
-        return O_ARRAY_FACTORY.value(values)
+    factory = array_factory(context)
+    if factory:
+        return factory(values)
     return values
 
 
+def skip_seq(
+    context: _ContextLike,
+    skip_one: Callable[[_ContextLike], None],
+    size: int | None = None,
+) -> None:
+    """Generic function to skip sequenced elements.
+
+    Sequences with a fixed number of elements that all have the same *size*
+    are skipped at once. All other sequences call *skip_one* for every
+    element, just like :func:`unpack_seq`.
+
+    .. versionadded:: 2.8.2
+
+    :param context: the current context
+    :type context: _ContextLike
+    :param skip_one: skips a single element
+    :type skip_one: Callable[[_ContextLike], None]
+    :param size: the static size of a single element, defaults to None
+    :type size: int | None, optional
+    """
+    if size is not None:
+        field: "Field[Any, Any]" = context[CTX_FIELD]  # pyright: ignore[reportAny]
+        length = field.length(context)
+        if isinstance(length, int):
+            skip_exact(context, length * size, f"{field.get_name()!r}")
+            return
+
+    _ = unpack_seq(context, skip_one)  # pyright: ignore[reportArgumentType]
+
+
+def skip_struct(struct: object, context: _ContextLike) -> None:
+    """Advances the stream past one value of the given struct.
+
+    Structs implementing :code:`__skip__` skip their data directly, all
+    others are unpacked and the result is discarded.
+
+    .. versionadded:: 2.8.2
+
+    :param struct: the struct to skip
+    :type struct: object
+    :param context: the current context
+    :type context: _ContextLike
+    """
+    skip = getattr(struct, ATTR_SKIP, None)
+    if skip is not None:
+        skip(context)
+    else:
+        _ = struct.__unpack__(context)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+
+
 def pack_seq(
     seq: Collection[_IT],
     context: _ContextLike,
@@ -203,12 +273,70 @@ def iseof(stream: _StreamType) -> bool:
     :return: True if the stream is at the end of the file, False otherwise.
     :rtype: bool
     """
+    if isinstance(stream, ReadAheadStream):
+        return stream.iseof()
+
+    size = stream_size(stream)
+    if size is not None:
+        return stream.tell() >= size
+
     pos = stream.tell()
     eof = not stream.read(1)
     stream.seek(pos)  # pyright: ignore[reportUnusedCallResult]
     return eof
 
 
+def stream_size(stream: _StreamType) -> int | None:
+    """
+    Return the total length of the stream if it can be determined without
+    reading from it.
+
+    Supported are in-memory streams (:class:`io.BytesIO`), memory maps and
+    streams backed by regular files.
+
+    :param _StreamType stream: The input stream.
+    :return: The length of the stream in bytes, or None if unknown.
+    :rtype: int | None
+    """
+    if isinstance(stream, BytesIO):
+        with stream.getbuffer() as view:
+            return view.nbytes
+
+    if isinstance(stream, mmap):
+        return len(stream)
+
+    if isinstance(stream, (FileIO, BufferedReader, BufferedRandom)):
+        try:
+            info = os.fstat(stream.fileno())
+        except (OSError, ValueError):
+            return None
+        if S_ISREG(info.st_mode):
+            return info.st_size
+    return None
+
+
+def context_stream_size(context: _ContextLike, stream: _StreamType) -> int | None:
+    # The size of the input stream is resolved once per unpack() or skip()
+    # call and cached in the root context. Other streams (e.g. of nested
+    # fields) are measured every time.
+    root = context._root
+    if stream is not root.get(CTX_STREAM):
+        return stream_size(stream)
+    if CTX_STREAM_SIZE in root:
+        return root[CTX_STREAM_SIZE]
+    size = root[CTX_STREAM_SIZE] = stream_size(stream)
+    return size
+
+
+def array_factory(context: _ContextLike) -> _ArrayFactoryLike | None:
+    # Arrays are created as tuples by unpack(..., as_tuple=True), unless a
+    # custom factory has been set globally.
+    factory = O_ARRAY_FACTORY.value
+    if factory is None and context._root.get(CTX_TUPLE):
+        return tuple
+    return factory
+
+
 def read_exact(context: _ContextLike, size: int, label: str) -> bytes:
     data: bytes = context[CTX_STREAM].read(size)
     if len(data) != size:
@@ -217,3 +345,21 @@ def read_exact(context: _ContextLike, size: int, label: str) -> bytes:
             context,
         )
     return data
+
+
+def skip_exact(context: _ContextLike, size: int, label: str) -> None:
+    # Same semantics as read_exact() without copying data if the stream
+    # size is known.
+    stream: _StreamType = context[CTX_STREAM]  # pyright: ignore[reportAny]
+    end = context_stream_size(context, stream)
+    if end is None:
+        _ = read_exact(context, size, label)
+        return
+
+    pos = stream.tell()
+    if pos + size > end:
+        raise ValidationError(
+            f"{label} requires {size} bytes. Got {max(end - pos, 0)}",
+            context,
+        )
+    _ = stream.seek(pos + size)
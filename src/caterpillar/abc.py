@@ -301,6 +301,25 @@ class _SupportsUnpack(Protocol[_OT_co]):
         ...
 
 
+@runtime_checkable
+class _SupportsSkip(Protocol):
+    """
+    An abstract base class for objects that can advance an input stream past their
+    data without deserializing it.
+
+    .. versionadded:: 2.8.2
+    """
+
+    def __skip__(self, context: _ContextLike) -> None:
+        """Called to skip the serialized data of this struct.
+
+        :param context: Contextual information or state needed for skipping, including
+                        additional parameters required by the implementation.
+        :type context: _ContextLike
+        """
+        ...
+
+
 @runtime_checkable
 class _SupportsSize(Protocol):
     """
@@ -581,6 +600,7 @@ __all__ = [
     "_SupportsActionPack",
     "_SupportsPack",
     "_SupportsUnpack",
+    "_SupportsSkip",
     "_SupportsSize",
     "_StructLike",
     "_SupportsType",
@@ -64,6 +64,18 @@ class ByteOrder:
 
     size: Size = Size.STANDARD
 
+    def getch(self, context: _ContextLike) -> str:  # pyright: ignore[reportUnusedParameter]
+        """
+        Returns the format character of this byte order. Static byte orders
+        don't depend on the context.
+
+        .. versionadded:: 2.8.2
+
+        :param context: the current context
+        :return: the struct format character
+        """
+        return self.ch
+
     def apply(self, other: object) -> None:
         """
         Applies the byte order information to another object.
@@ -226,6 +238,11 @@ class DynByteOrder:
         The value may change dynamically by inspecting the caller frame
         and extracting a local variable named context.
 
+        .. note::
+            Frame inspection is expensive. Code that has access to the
+            current context should use :meth:`getch` (or the module-level
+            :func:`getch`) instead.
+
         :return: Struct format character for byte order
         :rtype: str
         """
@@ -299,6 +316,28 @@ O_DEFAULT_ENDIAN: Final[Flag[_EndianLike]] = Flag("option.endian", value=None)
 """Default flag option representing an unspecified byte order."""
 
 
+def getch(order: _EndianLike | None, context: _ContextLike) -> str:
+    """
+    Resolve the format character of a static or dynamic byte order from the
+    given context, without inspecting the caller's frame.
+
+    If no byte order is given, the byte order of the current
+    :func:`~caterpillar.model.pack` or :func:`~caterpillar.model.unpack`
+    call is used (:code:`CTX_ORDER` of the root context).
+
+    .. versionadded:: 2.8.2
+
+    :param order: the byte order or None
+    :param context: the current context
+    :return: the struct format character
+    """
+    if order is None:
+        order = context._root.get(CTX_ORDER) or O_DEFAULT_ENDIAN.value or LittleEndian
+    if isinstance(order, DynByteOrder):
+        return order.getch(context)
+    return order.ch
+
+
 def byteorder(obj: object, default: _EndianLike | None = None) -> _EndianLike:
     """
     Get the byte order of an object, defaulting to SysNative if not explicitly set.
@@ -15,6 +15,7 @@
 # pyright: reportPrivateUsage=false, reportExplicitAny=false, reportAny=false
 from __future__ import annotations
 
+import keyword
 import operator
 import sys
 import typing
@@ -22,7 +23,7 @@ import warnings
 
 from typing import Annotated, Callable, Any, Generic, Protocol, get_args, get_origin
 from typing_extensions import Buffer, Final, Literal, Self, Sized, overload, override, TypeVar
-from types import FrameType, TracebackType
+from types import FrameType, NoneType, TracebackType
 from dataclasses import dataclass
 
 from caterpillar.exception import StructException
@@ -84,6 +85,15 @@ CTX_ORDER = "_order"
 CTX_ARCH = "_arch"
 """Stores the currently used architecture (only in root context)."""
 
+CTX_PROJECTION = "_projection"
+"""Stores the field paths selected for a projected unpack."""
+
+CTX_STREAM_SIZE = "_stream_size"
+"""Caches the total size of the input stream (only in root context)."""
+
+CTX_TUPLE = "_tuple"
+"""Stores whether records and arrays are unpacked as tuples (only in root context)."""
+
 
 class Context(dict[str, Any]):
     """Represents a context object with attribute-style access."""
@@ -510,8 +520,18 @@ class BinaryExpression(ExprMixin):
     def __post_init__(self) -> None:
         self._left_is_lambda: bool = callable(self.left)
         self._right_is_lambda: bool = callable(self.right)
+        self._compiled: _ContextLambda[bool] | None = None
 
     def __call__(self, context: _ContextLike) -> bool:
+        return (self._compiled or compile_expr(self))(context)
+
+    def __evaluate__(self, context: _ContextLike) -> bool:
+        """
+        Evaluates this expression without compiling it.
+
+        :param context: The context to evaluate against.
+        :return: The result of the binary operation.
+        """
         lhs = self.left(context) if self._left_is_lambda else self.left
         rhs = self.right(context) if self._right_is_lambda else self.right
         return self.operand(lhs, rhs)
@@ -547,8 +567,18 @@ class UnaryExpression:
 
     def __post_init__(self) -> None:
         self._value_is_lambda: bool = callable(self.value)
+        self._compiled: _ContextLambda[Any] | None = None
 
     def __call__(self, context: _ContextLike) -> Any:
+        return (self._compiled or compile_expr(self))(context)
+
+    def __evaluate__(self, context: _ContextLike) -> Any:
+        """
+        Evaluates this expression without compiling it.
+
+        :param context: The context to evaluate against.
+        :return: The result of the unary operation.
+        """
         value = self.value(context) if self._value_is_lambda else self.value
         return self.operand(value)
 
@@ -593,6 +623,7 @@ class ContextPath(Generic[_T], ExprMixin):
         self.path: str | None = path
         self._tokens: tuple[str, ...] = tuple(path.split(".")) if path else ()
         self._ops_ = list()
+        self._compiled: _ContextLambda[_T] | None = None
         self.call_kwargs: dict[str, Any] = dict()
         self.getitem_args: list[Any] = list()
 
@@ -604,6 +635,15 @@ class ContextPath(Generic[_T], ExprMixin):
         :param kwds: Additional keyword arguments.
         :return: The value retrieved from the Context based on the path.
         """
+        return (self._compiled or compile_expr(self))(context)
+
+    def __evaluate__(self, context: _ContextLike) -> _T:
+        """
+        Retrieves the value from a Context without compiling this path.
+
+        :param context: The Context from which to retrieve the value.
+        :return: The value retrieved from the Context based on the path.
+        """
         # REVISIT: find a way to implement calls
         # if context is None:
         #     self._ops_.append((operator.call, [], kwds))
@@ -612,10 +652,7 @@ class ContextPath(Generic[_T], ExprMixin):
         if not self._tokens:  # no path configured, just return the context itself
             return context  # pyright: ignore[reportReturnType]
 
-        if type(context) is Context:
-            value = context.__context_getattr_tokens__(self._tokens)
-        else:
-            value = context.__context_getattr__(self.path or "")
+        value = _resolve_tokens(self, context)
         for operation, args, kwargs in self._ops_:
             value = operation(value, *args, **kwargs)
         return value
@@ -728,6 +765,7 @@ class ContextPath(Generic[_T], ExprMixin):
 class ContextLength(ExprMixin):
     def __init__(self, path: ContextPath[Sized]) -> None:
         self.path: ContextPath[Sized] = path
+        self._compiled: _ContextLambda[int] | None = None
 
     def __call__(self, context: _ContextLike) -> int:
         """
@@ -737,6 +775,15 @@ class ContextLength(ExprMixin):
         :param kwds: Additional keyword arguments (ignored in this implementation).
         :return: The value retrieved from the Context based on the path.
         """
+        return (self._compiled or compile_expr(self))(context)
+
+    def __evaluate__(self, context: _ContextLike) -> int:
+        """
+        Retrieves the length without compiling this expression.
+
+        :param context: The Context from which to retrieve the value.
+        :return: The length of the value retrieved from the Context.
+        """
         return len(self.path(context))
 
     @override
@@ -744,6 +791,193 @@ class ContextLength(ExprMixin):
         return f"len({self.path!r})"
 
 
+def _resolve_tokens(path: ContextPath[Any], context: _ContextLike) -> Any:
+    # Resolves the path nodes without applying any further operations. This
+    # is not a method, because ContextPath creates sub-paths for every
+    # unknown attribute.
+    if type(context) is Context:
+        return context.__context_getattr_tokens__(path._tokens)
+    return context.__context_getattr__(path.path or "")
+
+
+_BINARY_OPERATORS: dict[Callable[..., Any], str] = {
+    operator.add: "{} + {}",
+    operator.sub: "{} - {}",
+    operator.mul: "{} * {}",
+    operator.floordiv: "{} // {}",
+    operator.truediv: "{} / {}",
+    operator.mod: "{} % {}",
+    operator.pow: "{} ** {}",
+    operator.xor: "{} ^ {}",
+    operator.and_: "{} & {}",
+    operator.or_: "{} | {}",
+    operator.rshift: "{} >> {}",
+    operator.lshift: "{} << {}",
+    operator.gt: "{} > {}",
+    operator.ge: "{} >= {}",
+    operator.lt: "{} < {}",
+    operator.le: "{} <= {}",
+    operator.eq: "{} == {}",
+    operator.ne: "{} != {}",
+    operator.contains: "{1} in {0}",
+}
+
+_UNARY_OPERATORS: dict[Callable[..., Any], str] = {
+    operator.neg: "-{}",
+    operator.pos: "+{}",
+    operator.invert: "~{}",
+    operator.not_: "not {}",
+}
+
+
+class _ExprCompiler:
+    # Translates a tree of context expressions into the source code of a single
+    # function. Context paths are resolved with direct dictionary lookups when
+    # operating on a Context instance and fall back to the generic attribute
+    # walk otherwise.
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {
+            "_Context": Context,
+            "_resolve_tokens": _resolve_tokens,
+        }
+        self.counter: int = 0
+
+    def name(self, prefix: str, value: Any | None = None) -> str:
+        self.counter += 1
+        name = f"_{prefix}{self.counter}"
+        if value is not None:
+            self.namespace[name] = value
+        return name
+
+    def emit(self, line: str, indent: int = 1) -> None:
+        self.lines.append("    " * indent + line)
+
+    def visit(self, expr: Any) -> str:
+        # returns a variable name or constant reference holding the result
+        if isinstance(expr, ContextPath):
+            return self.visit_path(expr)
+        if isinstance(expr, BinaryExpression):
+            lhs = self.visit(expr.left)
+            rhs = self.visit(expr.right)
+            template = _BINARY_OPERATORS.get(expr.operand)
+            if template is None:
+                template = f"{self.name('op', expr.operand)}({{}}, {{}})"
+            # operands are parenthesized, constants like -2 must not bind
+            # to the operator
+            return self.assign(template.format(f"({lhs})", f"({rhs})"))
+        if isinstance(expr, UnaryExpression):
+            value = self.visit(expr.value)
+            template = _UNARY_OPERATORS.get(expr.operand)
+            if template is None:
+                template = f"{self.name('op', expr.operand)}({{}})"
+            return self.assign(template.format(f"({value})"))
+        if isinstance(expr, ContextLength):
+            return self.assign(f"len({self.visit(expr.path)})")
+        if callable(expr):
+            return self.assign(f"{self.name('fn', expr)}(context)")
+        # constants are referenced directly
+        if type(expr) in (int, bool, str, bytes, NoneType):
+            return repr(expr)
+        name = self.name("c")
+        self.namespace[name] = expr
+        return name
+
+    def assign(self, source: str) -> str:
+        target = self.name("v")
+        self.emit(f"{target} = {source}")
+        return target
+
+    def visit_path(self, path: ContextPath[Any]) -> str:
+        tokens = path._tokens
+        target = self.name("v")
+        if not tokens:
+            # no path configured, the context itself is returned
+            self.emit(f"{target} = context")
+            return target
+        else:
+            # Mirrors Context.__context_getattr_tokens__: the first node is
+            # taken from the dictionary, all other nodes prefer attributes of
+            # the object. Missing keys are resolved by the generic path, which
+            # raises the appropriate error.
+            slow = f"_resolve_tokens({self.name('path', path)}, context)"
+            self.emit("if type(context) is _Context:")
+            self.emit("try:", 2)
+            self.emit(f"{target} = context[{tokens[0]!r}]", 3)
+            for token in tokens[1:]:
+                getter = (
+                    f"{target}.{token}"
+                    if token.isidentifier() and not keyword.iskeyword(token)
+                    else f"getattr({target}, {token!r})"
+                )
+                if hasattr(Context, token):
+                    self.emit(f"{target} = {getter}", 3)
+                else:
+                    self.emit(
+                        f"{target} = {target}[{token!r}] if type({target}) is _Context else {getter}",
+                        3,
+                    )
+            self.emit("except KeyError:", 2)
+            self.emit(f"{target} = {slow}", 3)
+            self.emit("else:")
+            self.emit(f"{target} = {slow}", 2)
+
+        for op, args, kwargs in path._ops_:
+            if op is operator.getitem and len(args) == 1 and not kwargs:
+                key = self.name("c", args[0])
+                self.emit(f"{target} = {target}[{key}]")
+            else:
+                func = self.name("op", op)
+                args_name = self.name("a", tuple(args))
+                kwargs_name = self.name("k", dict(kwargs))
+                self.emit(f"{target} = {func}({target}, *{args_name}, **{kwargs_name})")
+        return target
+
+    def compile(self, expr: Any) -> _ContextLambda[Any]:
+        result = self.visit(expr)
+        self.emit(f"return {result}")
+        source = "def __expr__(context):\n" + "\n".join(self.lines)
+        code = compile(source, f"<expression {expr!r}>", "exec")
+        exec(code, self.namespace)
+        func = self.namespace["__expr__"]
+        func.__source__ = source
+        return func
+
+
+def compile_expr(expr: Any) -> _ContextLambda[Any]:
+    """
+    Compiles a context expression into a single function.
+
+    Context paths, binary and unary expressions as well as :class:`ContextLength`
+    objects are translated into the source code of one function, which replaces
+    the recursive evaluation of the expression tree. Attribute walks over
+    :class:`Context` objects become direct dictionary lookups. Other callables
+    are embedded as is and constants are returned directly.
+
+    The result is cached on the expression, so repeated calls are cheap:
+
+    >>> length = compile_expr(this.length * 2 + 4)
+    >>> length(Context(_obj=Context(length=3)))
+    10
+
+    :param expr: The expression, callable or constant to compile.
+    :return: A function taking the context as its only argument.
+
+    .. versionadded:: 2.8.2
+    """
+    if isinstance(expr, (ContextPath, BinaryExpression, UnaryExpression, ContextLength)):
+        compiled = expr._compiled
+        if compiled is None:
+            compiled = _ExprCompiler().compile(expr)
+            expr._compiled = compiled
+        return compiled
+
+    if callable(expr):
+        return expr
+    return lambda _: expr
+
+
 # fmt: off
 this: Final[ContextPath[_ContextLike]] = ContextPath(CTX_OBJECT)
 """Context path pointing to the current object in the evaluation context.
@@ -783,3 +1017,50 @@ context hierarchy.
 
 .. versionadded:: 2.6.0
 """
+
+
+def expr_paths(expr: Any) -> set[str] | None:
+    """
+    Returns the context paths read by a context expression.
+
+    Paths are returned as dotted strings relative to the context the expression
+    is evaluated on. For instance, :code:`this.length` reads ``"_obj.length"``
+    and :code:`parent.count` reads ``"_parent._obj.count"``:
+
+    >>> sorted(expr_paths(this.length * 2 + ContextLength(parent.items)))
+    ['_obj.length', '_parent._obj.items']
+
+    Constants don't read anything. Other callables (e.g. lambda functions)
+    can't be inspected, in which case :code:`None` is returned.
+
+    :param expr: The expression, callable or constant to inspect.
+    :return: The paths read by the expression or :code:`None` if unknown.
+
+    .. versionadded:: 2.8.2
+    """
+    if isinstance(expr, ContextPath):
+        if not expr._tokens:
+            # the whole context is used
+            return None
+        paths = {expr.path}
+        for _, args, kwargs in expr._ops_:
+            for arg in (*args, *kwargs.values()):
+                arg_paths = expr_paths(arg)
+                if arg_paths is None:
+                    return None
+                paths |= arg_paths
+        return paths
+    if isinstance(expr, BinaryExpression):
+        left = expr_paths(expr.left)
+        right = expr_paths(expr.right)
+        if left is None or right is None:
+            return None
+        return left | right
+    if isinstance(expr, UnaryExpression):
+        return expr_paths(expr.value)
+    if isinstance(expr, ContextLength):
+        return expr_paths(expr.path)
+    if callable(expr) and not isinstance(expr, type):
+        return None
+    # constants don't depend on the context
+    return set()
@@ -28,6 +28,51 @@ class StructException(Exception):
             self.add_note(f"Context-Path: {context.__context_getattr__('_path')}")
 
 
+ATTR_ERROR_CONTEXT = "__struct_context__"
+"""Attribute of an exception that stores the context of the failing field."""
+
+
+def set_error_context(exc: BaseException, context: _ContextLike) -> None:
+    """
+    Stores the context of the failing field in the given exception.
+
+    Fields call this function while an error propagates. Only the first
+    (innermost) context is kept.
+
+    .. versionadded:: 2.8.2
+
+    :param exc: the raised exception
+    :param context: the context of the failing field
+    """
+    if getattr(exc, ATTR_ERROR_CONTEXT, None) is None:
+        try:
+            setattr(exc, ATTR_ERROR_CONTEXT, context)
+        except AttributeError:
+            # exceptions with __slots__ can't store the context
+            pass
+
+
+def error_context(
+    exc: BaseException, default: _ContextLike | None = None
+) -> _ContextLike | None:
+    """
+    Returns the innermost context that was active when the given exception
+    was raised.
+
+    Errors raised while packing or unpacking are not wrapped per field.
+    Instead, the context (and therefore the path) of the failing field is
+    stored in the exception as it propagates (see :func:`set_error_context`).
+
+    .. versionadded:: 2.8.2
+
+    :param exc: the raised exception
+    :param default: the context to use if none was recorded
+    :return: the innermost context or *default*
+    """
+    context = getattr(exc, ATTR_ERROR_CONTEXT, None)
+    return default if context is None else context
+
+
 class DynamicSizeError(StructException):
     """
     Exception raised for errors related to dynamic sizes in structs.
@@ -12,7 +12,7 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
-from ._base import Field, INVALID_DEFAULT, DEFAULT_OPTION, singleton
+from ._base import Field, INVALID_DEFAULT, DEFAULT_OPTION, SwitchTable, singleton
 from ._mixin import FieldMixin, FieldStruct, Chain, Operator, get_args, get_kwargs
 from .common import (
     PyStructFormattedField,
@@ -239,6 +239,7 @@ __all__ = [
     "Field",
     "INVALID_DEFAULT",
     "DEFAULT_OPTION",
+    "SwitchTable",
     "singleton",
     "FieldMixin",
     "FieldStruct",
@@ -14,7 +14,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # pyright: reportPrivateUsage=false, reportAny=false, reportExplicitAny=false
 from io import BytesIO
-from collections.abc import Collection
+from enum import Enum
+from collections.abc import Callable, Collection, Mapping
 from typing import Any, Generic, get_origin
 from typing_extensions import Self, override, TypeVar
 
@@ -38,22 +39,33 @@ from caterpillar.byteorder import (
     O_DEFAULT_ARCH,
     O_DEFAULT_ENDIAN,
     LittleEndian,
+    DynByteOrder,
+    getch,
     system_arch,
 )
 from caterpillar.exception import (
     DynamicSizeError,
-    StructException,
     OptionError,
     ValidationError,
     InvalidValueError,
+    set_error_context,
 )
 from caterpillar.options import (
     GLOBAL_FIELD_FLAGS,
     F_DYNAMIC,
+    _OptionSet,
 )
-from caterpillar.context import CTX_OFFSETS, CTX_STREAM, CTX_FIELD, CTX_VALUE, CTX_SEQ
-from caterpillar import registry
+from caterpillar.context import (
+    CTX_OFFSETS,
+    CTX_STREAM,
+    CTX_FIELD,
+    CTX_VALUE,
+    CTX_SEQ,
+    compile_expr,
+)
+from caterpillar import registry, options as _options
 from caterpillar.shared import getstruct, typeof, PackMixin, UnpackMixin
+from caterpillar._common import skip_struct
 
 
 _T = TypeVar("_T")
@@ -69,6 +81,51 @@ INVALID_DEFAULT: object = object()
 DEFAULT_OPTION: object = object()
 
 
+class SwitchTable(dict[Any, Any]):
+    """Precompiled switch-case mapping used by :class:`Field`.
+
+    All structs are resolved once and the entry for :data:`DEFAULT_OPTION`
+    is used as the fallback for missing keys, so a single lookup returns
+    the target struct. Keys that are :class:`~enum.Enum` members are stored
+    with their value as well, which lets raw tags hit directly. Likewise,
+    enum members are resolved through their value if they are not stored
+    as keys themselves.
+
+    >>> table = SwitchTable({Kind.A: uint8, DEFAULT_OPTION: uint16})
+    >>> table[Kind.A.value]
+    <uint8>
+    >>> table[0xFF]
+    <uint16>
+
+    Lookups of missing keys without a default raise :class:`KeyError`.
+
+    .. versionadded:: 2.8.2
+
+    :param options: the switch-case options
+    :type options: Mapping
+    """
+
+    __slots__: tuple[str, ...] = ("default",)
+
+    def __init__(self, options: Mapping[Any, Any]) -> None:
+        super().__init__()
+        self.default: Any = None
+        for key, struct in options.items():
+            struct = getstruct(struct) or struct
+            self[key] = struct
+            if key is DEFAULT_OPTION:
+                self.default = struct
+            elif isinstance(key, Enum):
+                _ = self.setdefault(key.value, struct)
+
+    def __missing__(self, key: Any) -> Any:
+        if isinstance(key, Enum) and key.value in self:
+            return self[key.value]
+        if self.default is None:
+            raise KeyError(key)
+        return self.default
+
+
 class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
     """Represents a field in a data structure.
 
@@ -82,8 +139,45 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
     :param arch: Architecture specification (default: system_arch).
     :param default: The default value (default: INVALID_DEFAULT).
     :param bits: Bit size if the field is bit-packed.
+
+    .. versionchanged:: 2.8.2
+        Fields now use ``__slots__``. Arbitrary attributes can no longer be
+        assigned to field instances.
+
+    .. versionchanged:: 2.8.2
+        The resolved byteorder character and the effective flags are frozen
+        into plain slots (see :meth:`freeze`). Global option changes
+        invalidate them through :func:`~caterpillar.options.invalidate_options`.
     """
 
+    __slots__: tuple[str, ...] = (
+        "__struct",
+        "__condition",
+        "__flags",
+        "__offset",
+        "__amount",
+        "__options",
+        "__order",
+        "__arch",
+        "__name__",
+        "bits",
+        "__default",
+        "_is_lambda",
+        "_has_cond",
+        "_cond_is_lambda",
+        "_is_seq",
+        "_keep_pos",
+        "_has_offset",
+        "_offset_is_lambda",
+        "_amount_is_lambda",
+        "_switch_is_lambda",
+        "_switch_has_default",
+        "_order_ch",
+        "_all_flags",
+        "_frozen_epoch",
+        "_revision",
+    )
+
     def __init__(
         self,
         struct: _StructLike[_IT, _OT] | _ContextLambda[_OT] | _ContainsStruct[_IT, _OT],
@@ -108,6 +202,12 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         self._amount_is_lambda: bool = False
         self._switch_is_lambda: bool = False
         self._switch_has_default: bool = False
+        # Frozen state derived from global options, see freeze()
+        self._order_ch: str | None = None
+        self._all_flags: frozenset[_OptionLike] = frozenset()
+        self._frozen_epoch: int = -1
+        # Incremented on every change, see specialize()
+        self._revision: int = 0
 
         # private variable initialization
         self.__struct = None
@@ -118,6 +218,7 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         self.__options = None  # Historically named; represents switch mappings
         self.__order = None
         self.__arch = None
+        self.__default = INVALID_DEFAULT
 
         # initialization via property setters
         self.struct = struct
@@ -132,7 +233,7 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
 
         # INVALID_DEFAULT indicates that no default was explicitly set;
         # allows None to be used as a valid default
-        self.default: object = default
+        self.default = default
 
     # -- Property Definitions (Input validation not enforced) --
 
@@ -152,6 +253,7 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         self.__struct = getstruct(value) or value
         # pre-computed state of this field
         self._is_lambda = callable(self.__struct)
+        self._touch()
     # fmt: on
 
     @property
@@ -164,17 +266,26 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
     @condition.setter
     def condition(self, value: _ContextLambda[bool] | bool):
         self.__condition = value
+        self._touch()
         self._cond_is_lambda = callable(value)
+        if self._cond_is_lambda:
+            _ = compile_expr(value)
         self._has_cond = self._cond_is_lambda or value not in (True, None)
 
     @property
     def flags(self) -> set[_OptionLike]:
-        """The set of flags associated with this field."""
+        """The set of flags associated with this field.
+
+        .. versionchanged:: 2.8.2
+            In-place changes (e.g. :code:`field.flags.add(...)`) invalidate the
+            frozen state of this field just like :meth:`add_flag`.
+        """
         return self.__flags  # pyright: ignore[reportReturnType]
 
     @flags.setter
     def flags(self, value: set[_OptionLike]) -> None:
-        self.__flags = value
+        self.__flags = _OptionSet(value, self._touch)
+        self._touch()
 
     def add_flag(self, flag: _OptionLike) -> None:
         """
@@ -194,7 +305,9 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         :return: true if this flag has been found
         :rtype: bool
         """
-        return flag in self.flags or flag in GLOBAL_FIELD_FLAGS
+        if self._frozen_epoch != _options._OPTIONS_EPOCH:
+            self.freeze()
+        return flag in self._all_flags
 
     def remove_flag(self, flag: _OptionLike) -> None:
         """
@@ -214,11 +327,14 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
     @offset.setter
     def offset(self, value: _ContextLambda[int] | int):
         self.__offset = value
+        self._touch()
         # _ContextLambda is ExprMixin so `__eq__` is overridden
         # and `Tuple.__contains__` isn't correct. If value is an
         # instance of _ContextLambda we may assume it is not
         # -1 or None
         self._offset_is_lambda = callable(value)
+        if self._offset_is_lambda:
+            _ = compile_expr(value)
         self._has_offset = self._offset_is_lambda or value not in (-1, None)
         self._keep_pos = not self._offset_is_lambda and value in (-1, None)
 
@@ -230,7 +346,11 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
     @amount.setter
     def amount(self, value: _LengthT | None):
         self.__amount = value
+        self._touch()
         self._amount_is_lambda = callable(value)
+        if self._amount_is_lambda:
+            # Context expressions are compiled once when the field is defined
+            _ = compile_expr(value)
         self._is_seq = self._amount_is_lambda or value is not None
 
     @property
@@ -241,16 +361,25 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
     @options.setter
     def options(self, value: _SwitchOptionsT | None):
         if value is not None and not callable(value):
-            value = {
-                key: (getstruct(struct) or struct) for key, struct in value.items()
-            }
+            value = SwitchTable(value)
 
         self.__options = value
+        self._touch()
         self._switch_is_lambda = callable(value)
         self._switch_has_default = (
             bool(value) and not self._switch_is_lambda and DEFAULT_OPTION in value  # pyright: ignore[reportOperatorIssue]
         )
 
+    @property
+    def default(self) -> object:
+        """The default value returned if this field fails to unpack."""
+        return self.__default
+
+    @default.setter
+    def default(self, value: object) -> None:
+        self.__default = value
+        self._touch()
+
     @property
     def order(self) -> _EndianLike:
         return self.__order or O_DEFAULT_ENDIAN.value or LittleEndian
@@ -261,10 +390,53 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         value: _EndianLike | None,  # pyright: ignore[reportPropertyTypeMismatch]
     ) -> None:
         self.__order: _EndianLike | None = value
+        self._touch()
 
     def has_order(self) -> bool:
         return bool(self.__order)
 
+    def _touch(self) -> None:
+        # Any change invalidates the frozen state and all specialized
+        # callables created by specialize()
+        self._revision += 1
+        self._frozen_epoch = -1
+
+    def freeze(self) -> None:
+        """Resolves option-dependent state into plain slots.
+
+        The byteorder character of a static byteorder assigned to this field is
+        stored in ``_order_ch``. It is ``None`` for dynamic byteorders and for
+        fields without a byteorder, which are resolved per operation (see
+        :meth:`getch`). The effective flags, including
+        :data:`~caterpillar.options.GLOBAL_FIELD_FLAGS`, are stored in
+        ``_all_flags``. The frozen state is re-resolved automatically once a
+        global option changes.
+
+        .. versionadded:: 2.8.2
+        """
+        order = self.__order
+        self._order_ch = (
+            None if order is None or isinstance(order, DynByteOrder) else order.ch
+        )
+        self._all_flags = frozenset(self.__flags or ()).union(GLOBAL_FIELD_FLAGS)
+        self._frozen_epoch = _options._OPTIONS_EPOCH
+
+    def getch(self, context: _ContextLike) -> str:
+        """Returns the byteorder format character for the current operation.
+
+        Fields without a byteorder use the byteorder of the current
+        :func:`~caterpillar.model.pack` or :func:`~caterpillar.model.unpack`
+        call.
+
+        .. versionadded:: 2.8.2
+
+        :param context: the current context
+        :type context: _ContextLike
+        :return: the struct format character
+        :rtype: str
+        """
+        return self._order_ch or getch(self.__order, context)
+
     @property
     def arch(self) -> _ArchLike:
         return self.__arch or O_DEFAULT_ARCH.value or system_arch
@@ -275,6 +447,7 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         value: _ArchLike | None,  # pyright: ignore[reportPropertyTypeMismatch]
     ) -> None:
         self.__arch = value
+        self._touch()
 
     def has_arch(self) -> bool:
         return self.__arch is not None
@@ -421,7 +594,7 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         if not self._has_cond:
             return True
 
-        return self.condition(context) if self._cond_is_lambda else self.condition
+        return self.__condition(context) if self._cond_is_lambda else self.__condition
 
     def has_condition(self) -> bool:
         """Returns whether this field is linked to a condition"""
@@ -437,7 +610,7 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         :rtype: Union[int, _GreedyType]
         """
         try:
-            return self.amount(context) if self._amount_is_lambda else self.amount
+            return self.__amount(context) if self._amount_is_lambda else self.__amount
         except Exception as exc:
             raise DynamicSizeError("Dynamic sized field!", context) from exc
 
@@ -453,12 +626,15 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         """
         # treat 'value' as the key of specified options
         if self._switch_is_lambda:
-            struct: _StructLike[_IT, _OT] = self.options(value, context)
+            struct: _StructLike[_IT, _OT] = self.__options(value, context)
         else:
-            if value not in self.options and not self._switch_has_default:
-                raise OptionError(f"Option {value!r} not found!", context)
-
-            struct = self.options.get(value) or self.options.get(DEFAULT_OPTION)
+            options: SwitchTable = self.__options  # pyright: ignore[reportAssignmentType]
+            try:
+                struct = options[value]
+            except KeyError:
+                raise OptionError(f"Option {value!r} not found!", context) from None
+            if struct is None:
+                struct = options.default
 
         if struct is None:
             # The struct must be non-null
@@ -470,7 +646,7 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
 
     def get_offset(self, context: _ContextLike) -> int:
         """Returns the offset position of this field"""
-        return self.offset(context) if self._offset_is_lambda else self.offset
+        return self.__offset(context) if self._offset_is_lambda else self.__offset
 
     def get_type(self) -> type:
         """Returns the annotation type for this field
@@ -511,10 +687,17 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         :type context: _ContextLike
         :return: the parsed data
         """
+        try:
+            return self._unpack_generic(context)
+        except Exception as exc:
+            set_error_context(exc, context)
+            raise
+
+    def _unpack_generic(self, context: _ContextLike) -> _OT:
         stream: _StreamType = context[CTX_STREAM]
         if self._has_cond and not self.is_enabled(context):
             # Disabled fields or context lambdas won't pack any data
-            return
+            return  # pyright: ignore[reportReturnType]
         # fmt: off
         # Using this inlined version of self.is_seq(), we reduce the amount of
         # calls made to the method and save A LOT of time.
@@ -527,29 +710,36 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
                 fallback: int = stream.tell()
 
             if self._has_offset:
-                offset: int = self.offset(context) if self._offset_is_lambda else self.offset
+                offset: int = self.__offset(context) if self._offset_is_lambda else self.__offset
                 stream.seek(offset)  # pyright: ignore[reportUnusedCallResult]
 
+            if self._frozen_epoch != _options._OPTIONS_EPOCH:
+                self.freeze()
             context[CTX_FIELD] = self
-            # Switch is applicable AFTER we parsed the first value
-            try:
-                value = self.struct.__unpack__(context)
+            # Switch is applicable AFTER we parsed the first value. Errors are
+            # only intercepted if this field defines a default value, all other
+            # errors are wrapped once by unpack().
+            if self.__default is INVALID_DEFAULT:
+                value = self.__struct.__unpack__(context)
                 if not keep_pos:
                     stream.seek(fallback)  # pyright: ignore[reportUnusedCallResult]
-            # pylint: disable-next=broad-exception-caught
-            except Exception as exc:
-                if not isinstance(exc, StructException):
-                    exc = StructException(str(exc), context)
-                # Any exception leads to a default value if configured
-                value = self.default
-                if value is INVALID_DEFAULT or isinstance(exc, ValidationError):
-                    raise exc
+            else:
+                try:
+                    value = self.__struct.__unpack__(context)
+                    if not keep_pos:
+                        stream.seek(fallback)  # pyright: ignore[reportUnusedCallResult]
+                except ValidationError:
+                    raise
+                # pylint: disable-next=broad-exception-caught
+                except Exception:
+                    # Any other exception leads to the default value
+                    value = self.__default
         else:
             # Context functions should be executed with top priority
-            value: _OT = self.struct(context)  # pyright: ignore[reportUnknownVariableType]
+            value: _OT = self.__struct(context)  # pyright: ignore[reportUnknownVariableType]
 
         # unpack using switch
-        if self.options:
+        if self.__options:
             struct = self.get_struct(value, context)
             # The "keep_position" flag is not applicable here. Configure a field to keep the
             # position afterward.
@@ -558,6 +748,147 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         # fmt; on
         return value
 
+    def __skip__(self, context: _ContextLike) -> None:
+        """Advances the stream past the data of this field without decoding it.
+
+        Switch fields, context lambdas and fields with a default value need the
+        parsed value and are therefore unpacked.
+
+        .. versionadded:: 2.8.2
+
+        :param context: the current context
+        :type context: _ContextLike
+        """
+        if self._is_lambda or self.__options or self.__default is not INVALID_DEFAULT:
+            _ = self.__unpack__(context)
+            return
+
+        if self._has_cond and not self.is_enabled(context):
+            return
+
+        stream: _StreamType = context[CTX_STREAM]
+        context[CTX_SEQ] = self._is_seq
+        keep_pos: bool = self._keep_pos
+        if not keep_pos:
+            fallback: int = stream.tell()
+        if self._has_offset:
+            offset: int = self.__offset(context) if self._offset_is_lambda else self.__offset
+            stream.seek(offset)  # pyright: ignore[reportUnusedCallResult]
+
+        if self._frozen_epoch != _options._OPTIONS_EPOCH:
+            self.freeze()
+        context[CTX_FIELD] = self
+        skip_struct(self.__struct, context)
+        if not keep_pos:
+            stream.seek(fallback)  # pyright: ignore[reportUnusedCallResult]
+
+    def specialize(
+        self,
+    ) -> tuple[Callable[[_ContextLike], _OT], Callable[[_IT, _ContextLike], None]]:
+        """Selects specialized unpack and pack callables for this field.
+
+        All per-call decisions of :meth:`__unpack__` and :meth:`__pack__` are
+        resolved once, so that the returned callables don't have to branch
+        on this field's configuration. The following kinds are used:
+
+        - *plain*: no condition, offset or switch. The struct is called directly.
+        - *conditional*: like *plain*, but the condition is evaluated first.
+        - *disabled*: the condition is a constant false value.
+        - *generic*: everything else, including lambda structs, offsets, switches
+          and subclasses that override :meth:`__unpack__` or :meth:`__pack__`.
+
+        Once this field is changed, the specialized callables fall back to the
+        generic implementation.
+
+        .. versionadded:: 2.8.2
+
+        :return: a tuple of ``(unpack, pack)``
+        :rtype: tuple[Callable, Callable]
+        """
+        self.freeze()
+        cls = type(self)
+        if (
+            cls.__unpack__ is not _FIELD_UNPACK
+            or cls.__pack__ is not _FIELD_PACK
+            or self._is_lambda
+            or self._has_offset
+            or self.__options
+        ):
+            return self.__unpack__, self.__pack__
+
+        field = self
+        revision = self._revision
+        is_seq = self._is_seq
+        condition = self.__condition
+        default = self.__default
+        struct_unpack = self.__struct.__unpack__
+        struct_pack = self.__struct.__pack__
+        if self._has_cond and not self._cond_is_lambda and not condition:
+
+            def unpack_disabled(context: _ContextLike) -> _OT:
+                if field._revision != revision:
+                    return field.__unpack__(context)
+                return None  # pyright: ignore[reportReturnType]
+
+            def pack_disabled(obj: _IT, context: _ContextLike) -> None:
+                if field._revision != revision:
+                    field.__pack__(obj, context)
+
+            return unpack_disabled, pack_disabled
+
+        if default is INVALID_DEFAULT:
+
+            def unpack_plain(context: _ContextLike) -> _OT:
+                if field._revision != revision:
+                    return field.__unpack__(context)
+                context[CTX_SEQ] = is_seq
+                context[CTX_FIELD] = field
+                try:
+                    return struct_unpack(context)
+                except Exception as exc:
+                    set_error_context(exc, context)
+                    raise
+
+        else:
+
+            def unpack_plain(context: _ContextLike) -> _OT:
+                if field._revision != revision:
+                    return field.__unpack__(context)
+                context[CTX_SEQ] = is_seq
+                context[CTX_FIELD] = field
+                try:
+                    return struct_unpack(context)
+                except ValidationError:
+                    raise
+                # pylint: disable-next=broad-exception-caught
+                except Exception:
+                    return default  # pyright: ignore[reportReturnType]
+
+        def pack_plain(obj: _IT, context: _ContextLike) -> None:
+            if field._revision != revision:
+                return field.__pack__(obj, context)
+            context[CTX_FIELD] = field
+            context[CTX_SEQ] = is_seq
+            struct_pack(obj, context)
+
+        if not self._cond_is_lambda:
+            return unpack_plain, pack_plain
+
+        def unpack_conditional(context: _ContextLike) -> _OT:
+            if field._revision != revision:
+                return field.__unpack__(context)
+            if not condition(context):
+                return None  # pyright: ignore[reportReturnType]
+            return unpack_plain(context)
+
+        def pack_conditional(obj: _IT, context: _ContextLike) -> None:
+            if field._revision != revision:
+                return field.__pack__(obj, context)
+            if condition(context):
+                pack_plain(obj, context)
+
+        return unpack_conditional, pack_conditional
+
     def __pack__(self, obj: _IT, context: _ContextLike) -> None:
         """Writes the given object to the provided stream.
 
@@ -584,6 +915,8 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         stream: _StreamType = context[CTX_STREAM]
         keep_pos = self._keep_pos
         has_offset = self._has_offset
+        if self._frozen_epoch != _options._OPTIONS_EPOCH:
+            self.freeze()
         context[CTX_FIELD] = self
         # pylint: disable-next=protected-access
         context[CTX_SEQ] = self._is_seq
@@ -595,26 +928,27 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
             # We write the current field into a temporary memory buffer
             # and add it after all processing hasbeen finished.
             offset: int = (
-                self.offset(context) if self._offset_is_lambda else self.offset
+                self.__offset(context) if self._offset_is_lambda else self.__offset
             )
             base_stream = stream
             stream = BytesIO()
             context[CTX_STREAM] = stream
 
-        if not self.options:
+        options = self.__options
+        if not options:
             _ = (
-                self.struct.__pack__(obj, context)
+                self.__struct.__pack__(obj, context)
                 if not self._is_lambda
-                else self.struct(context)
+                else self.__struct(context)
             )
         else:
             # Just hand over the input value if the struct is not a lambda
             context[CTX_VALUE] = obj
-            value = self.struct(context) if self._is_lambda else obj
+            value = self.__struct(context) if self._is_lambda else obj
             if not self._is_lambda:
                 # support for non-context lambdas with switch statements
-                self.struct.__pack__(value, context)
-            if self.options is not None:
+                self.__struct.__pack__(value, context)
+            if options is not None:
                 struct = self.get_struct(value, context)
                 struct.__pack__(obj, context)
 
@@ -676,6 +1010,9 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
             struct = self.get_struct(value, context)
 
         size = struct.__size__(context)
+        if not isinstance(size, int):
+            # e.g. greedy strings or byte sequences
+            raise DynamicSizeError("Dynamic sized field!", context)
         return count * size
 
     # representation, maybe revisit
@@ -694,6 +1031,11 @@ class Field(Generic[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         return self.__str__()
 
 
+# Used by Field.specialize() to detect overridden (or instrumented) methods
+_FIELD_UNPACK = Field.__unpack__
+_FIELD_PACK = Field.__pack__
+
+
 # --- private type converter ---
 @registry.TypeConverter(_StructLike)
 def _type_converter(annotation: _StructLike[_IT, _OT], kwargs: Any) -> Field[_IT, _OT]:
@@ -158,6 +158,39 @@ class FieldStruct(FieldMixin[_IT, _OT], PackMixin[_IT], UnpackMixin[_OT]):
         """
         return unpack_seq(context, self.unpack_single)
 
+    def skip_single(self, context: _ContextLike) -> None:
+        """
+        Skip a single element. Unpacks the element and discards it by default.
+
+        .. versionadded:: 2.8.2
+
+        :param context: The current operation context.
+        :type context: _ContextLike
+        """
+        _ = self.unpack_single(context)
+
+    def skip_seq(self, context: _ContextLike) -> None:
+        """
+        Skip a sequence of elements. Unpacks the sequence and discards it by default.
+
+        .. versionadded:: 2.8.2
+
+        :param context: The current operation context.
+        :type context: _ContextLike
+        """
+        _ = self.unpack_seq(context)
+
+    def __skip__(self, context: _ContextLike) -> None:
+        """
+        Skip data based on whether the field is sequential or not.
+
+        .. versionadded:: 2.8.2
+
+        :param context: The current operation context.
+        :type context: _ContextLike
+        """
+        (self.skip_seq if context[CTX_SEQ] else self.skip_single)(context)
+
     def __pack__(self, obj: _IT, context: _ContextLike) -> None:
         """
         Pack data based on whether the field is sequential or not.
@@ -32,7 +32,7 @@ from types import NoneType
 from functools import cached_property
 from enum import Enum as _EnumType
 from uuid import UUID
-from collections.abc import Collection
+from collections.abc import Collection, Hashable
 
 from caterpillar.abc import (
     _StructLike,
@@ -55,11 +55,17 @@ from caterpillar.context import CTX_FIELD, CTX_STREAM, CTX_SEQ
 from caterpillar.options import Flag, GLOBAL_FIELD_FLAGS
 from caterpillar.byteorder import (
     LITTLE_ENDIAN_FMT,
-    O_DEFAULT_ENDIAN,
-    LittleEndian,
+    getch,
 )
 from caterpillar import registry
-from caterpillar._common import WithoutContextVar, read_exact
+from caterpillar._common import (
+    WithoutContextVar,
+    array_factory,
+    context_stream_size,
+    read_exact,
+    skip_exact,
+    skip_seq,
+)
 from caterpillar.shared import getstruct, typeof
 
 from ._base import Field, INVALID_DEFAULT, singleton
@@ -168,9 +174,9 @@ class PyStructFormattedField(FieldStruct[_IT, _IT]):
 
         field = context.get(CTX_FIELD)
         order_ch = (
-            field.order.ch
+            (field._order_ch or field.getch(context))
             if field
-            else (self.__byteorder__ or O_DEFAULT_ENDIAN.value or LittleEndian).ch
+            else getch(self.__byteorder__, context)
         )
         context[CTX_STREAM].write(self._cached(order_ch).pack(obj))
 
@@ -192,7 +198,7 @@ class PyStructFormattedField(FieldStruct[_IT, _IT]):
         if not field:
             # just pack directly
             # WE LOSE SIZE CHECKING HERE!
-            ch = (self.__byteorder__ or O_DEFAULT_ENDIAN.value or LittleEndian).ch
+            ch = getch(self.__byteorder__, context)
             struct_ = self._cached(ch, target_length)
         else:
             length = field.length(context)
@@ -207,7 +213,8 @@ class PyStructFormattedField(FieldStruct[_IT, _IT]):
                         + f"{target_length} elements were provided!"
                     )
 
-            struct_ = self._cached(field.order.ch, target_length)
+            ch = field._order_ch or field.getch(context)
+            struct_ = self._cached(ch, target_length)
 
         context[CTX_STREAM].write(struct_.pack(*seq))
 
@@ -221,9 +228,9 @@ class PyStructFormattedField(FieldStruct[_IT, _IT]):
         """
         field = context.get(CTX_FIELD)
         order_ch = (
-            field.order.ch
+            (field._order_ch or field.getch(context))
             if field
-            else (self.__byteorder__ or O_DEFAULT_ENDIAN.value or LittleEndian).ch
+            else getch(self.__byteorder__, context)
         )
         struct_ = self._cached(order_ch)
         size = struct_.size
@@ -248,22 +255,44 @@ class PyStructFormattedField(FieldStruct[_IT, _IT]):
         # only possible when a Field has been configured
         field = context[CTX_FIELD]
         length = field.length(context)
-        if length == 0:
-            return []  # maybe add factory
-
         if length is Ellipsis:
             return super().unpack_seq(context)
 
-        struct_ = self._cached(field.order.ch, length)
-        size = struct_.size
-        data = context[CTX_STREAM].read(size)
-        if len(data) != size:
-            raise ValidationError(
-                f"unpack of {self.ty.__name__}{self.__bits__}[{length}] requires {size} bytes."
-                + f"Got {len(data)}",
-                context,
-            )
-        return list(struct_.unpack(data))
+        values: tuple[Any, ...] = ()
+        if length != 0:
+            struct_ = self._cached(field._order_ch or field.getch(context), length)
+            size = struct_.size
+            data = context[CTX_STREAM].read(size)
+            if len(data) != size:
+                raise ValidationError(
+                    f"unpack of {self.ty.__name__}{self.__bits__}[{length}] requires {size} bytes."
+                    + f"Got {len(data)}",
+                    context,
+                )
+            values = struct_.unpack(data)
+        factory = array_factory(context)
+        if factory:
+            return factory(values)
+        return list(values)
+
+    @override
+    def skip_single(self, context: _ContextLike) -> None:
+        """
+        Skip a single value without decoding it.
+
+        :param context: The current context.
+        """
+        label = f"unpack of {self.ty.__name__}{self.__bits__}"
+        skip_exact(context, self.__bits__ // 8, label)
+
+    @override
+    def skip_seq(self, context: _ContextLike) -> None:
+        """
+        Skip a sequence of values. Sequences of a fixed length are skipped at once.
+
+        :param context: The current context.
+        """
+        skip_seq(context, self.skip_single, self.__bits__ // 8)
 
 
 # Instances of FormatField with specific format specifiers
@@ -790,6 +819,10 @@ class Const(Transformer[NoneType, _IT, _IT, _IT]):
 _EnumT = TypeVar("_EnumT")
 
 
+# Default implementation of Enum._missing_, see Enum._lookup()
+_ENUM_MISSING = _EnumType._missing_.__func__  # pyright: ignore[reportFunctionMemberAccess]
+
+
 class Enum(Generic[_EnumT, _IT], Transformer[_EnumT, _IT, _EnumT | _IT, _IT]):
     """
     A specialized Transformer for encoding and decoding enumeration values.
@@ -821,9 +854,13 @@ class Enum(Generic[_EnumT, _IT], Transformer[_EnumT, _IT, _EnumT | _IT, _IT]):
 
     .. versionchanged:: 2.8.0
         Add new 'strict' option.
+
+    .. versionchanged:: 2.8.2
+        Values are decoded through a lookup table built once per instance and
+        sequences are decoded at once.
     """
 
-    __slots__: tuple[str, ...] = ("model", "default", "strict")
+    __slots__: tuple[str, ...] = ("model", "default", "strict", "_members", "_dynamic")
 
     def __init__(
         self,
@@ -836,6 +873,25 @@ class Enum(Generic[_EnumT, _IT], Transformer[_EnumT, _IT, _EnumT | _IT, _IT]):
         self.model: type[_EnumT] = model
         self.default: _EnumT | _IT | object | None = default
         self.strict: bool = strict
+        # value -> member lookup table. Enums that override _missing_ (e.g.
+        # flags) may create members dynamically and use the slow path on misses.
+        self._members: dict[Any, _EnumT] = dict(getattr(model, "_value2member_map_", {}))
+        missing = getattr(getattr(model, "_missing_", None), "__func__", None)
+        self._dynamic: bool = missing is not _ENUM_MISSING
+
+    def _lookup(self, parsed: _IT) -> _EnumT | None:
+        if self._dynamic:
+            try:
+                return self.model(parsed)  # pyright: ignore[reportCallIssue]
+            except (ValueError, TypeError):
+                pass
+        elif isinstance(parsed, Hashable) and parsed in self._members:
+            return self._members[parsed]
+
+        # members can be referenced by name as well
+        if isinstance(parsed, str):
+            return getattr(self.model, "_member_map_", {}).get(parsed)
+        return None
 
     @override
     def __type__(self) -> type[_EnumT] | type[_IT]:
@@ -890,17 +946,9 @@ class Enum(Generic[_EnumT, _IT], Transformer[_EnumT, _IT, _EnumT | _IT, _IT]):
         >>> unpack(1, cp_enum, as_field=True)
         Color.RED
         """
-        # fmt: off
-        value: _EnumT | None = None
-        try:
-            value = self.model(parsed)  # pyright: ignore[reportCallIssue]
-        except ValueError:
-            try:
-                value = self.model[parsed]  # pyright: ignore[reportInvalidTypeArguments]
-            except KeyError:
-                pass
-
-        # fmt: on
+        value = self._members.get(parsed) if type(parsed) is int else None
+        if value is None:
+            value = self._lookup(parsed)
         if value is not None:
             return value
 
@@ -917,6 +965,51 @@ class Enum(Generic[_EnumT, _IT], Transformer[_EnumT, _IT, _EnumT | _IT, _IT]):
             return parsed  # pyright: ignore[reportReturnType]
         return default  # pyright: ignore[reportReturnType]
 
+    @override
+    def unpack_seq(self, context: _ContextLike) -> Collection[_EnumT | _IT]:
+        """
+        Unpack all raw values at once using the wrapped struct and map them
+        through the lookup table.
+
+        Invalid values of strict enums are reported by the generic
+        implementation, which parses the sequence again element by element.
+        Hence, the error refers to the failing element and greedy sequences
+        stop before it. Strict enums on non-seekable streams always use the
+        generic implementation.
+
+        :param context: The current context.
+        :return: A list of decoded values.
+        """
+        field: Field = context[CTX_FIELD]
+        start: int | None = None
+        if (
+            (self.strict or field.has_flag(ENUM_STRICT))
+            and self.default is INVALID_DEFAULT
+            and field.default is INVALID_DEFAULT
+        ):
+            stream: _StreamType = context[CTX_STREAM]
+            if not stream.seekable():
+                return super().unpack_seq(context)
+            start = stream.tell()
+
+        values = self.struct.__unpack__(context)
+        get = self._members.get
+        try:
+            try:
+                result = [get(value) or self.decode(value, context) for value in values]
+            except TypeError:
+                # unhashable values
+                result = [self.decode(value, context) for value in values]
+        except InvalidValueError:
+            if start is None:
+                raise
+            _ = context[CTX_STREAM].seek(start)
+            return super().unpack_seq(context)
+        factory = array_factory(context)
+        if factory:
+            return factory(result)
+        return result
+
 
 class _EnumTypeConverter(registry.TypeConverter):
     @override
@@ -999,8 +1092,14 @@ class Memory(Generic[_MemoryIT, _MemoryOT], FieldStruct[_MemoryIT, _MemoryOT]):
 
         :param context: The current context.
         :return: The size of the field in bytes, or `Ellipsis` if the length is unspecified.
+        :raises DynamicSizeError: If the length can't be evaluated without parsing data.
         """
-        return self.length(context) if self._length_is_lambda else self.length
+        if not self._length_is_lambda:
+            return self.length
+        try:
+            return self.length(context)
+        except Exception as exc:
+            raise DynamicSizeError("Dynamic sized field!", context) from exc
 
     @override
     def pack_single(self, obj: _MemoryIT, context: _ContextLike) -> None:
@@ -1060,6 +1159,35 @@ class Memory(Generic[_MemoryIT, _MemoryOT], FieldStruct[_MemoryIT, _MemoryOT]):
 
         return memoryview(read_exact(context, size, "Memory field"))  # pyright: ignore[reportReturnType]
 
+    @override
+    def skip_single(self, context: _ContextLike) -> None:
+        """
+        Skip a single byte object without copying it.
+
+        :param context: The current context.
+        """
+        size: int | _GreedyType = self.__size__(context)
+        if size is Ellipsis:
+            stream: _StreamType = context[CTX_STREAM]
+            end = context_stream_size(context, stream)
+            if end is None:
+                _ = stream.read()
+            else:
+                _ = stream.seek(end)
+            return
+
+        skip_exact(context, size, "Memory field")  # pyright: ignore[reportArgumentType]
+
+    @override
+    def skip_seq(self, context: _ContextLike) -> None:
+        """
+        Skip a sequence of byte objects. Fixed lengths are skipped at once.
+
+        :param context: The current context.
+        """
+        length = None if self._length_is_lambda else self.length
+        skip_seq(context, self.skip_single, length if isinstance(length, int) else None)
+
 
 class Bytes(Memory[bytes, bytes]):
     """Byte sequences.
@@ -1229,9 +1357,14 @@ class CString(FieldStruct[str, str]):
 
         :param context: The context used to determine the size.
         :return: The length of the field in bytes.
+        :raises DynamicSizeError: If the length can't be evaluated without parsing data.
         """
-        # fmt: off
-        return self.length(context) if self._length_is_lambda else self.length  # pyright: ignore[reportReturnType]
+        if not self._length_is_lambda:
+            return self.length  # pyright: ignore[reportReturnType]
+        try:
+            return self.length(context)  # pyright: ignore[reportReturnType]
+        except Exception as exc:
+            raise DynamicSizeError("Dynamic sized field!", context) from exc
 
     def __type__(self) -> type:
         """
@@ -1291,29 +1424,7 @@ class CString(FieldStruct[str, str]):
         # fmt: off
         if self.length is Ellipsis:
             # Parse actual C-String
-            stream = context[CTX_STREAM]
-            if getattr(stream, "seekable", lambda: False)():
-                data = bytearray()
-                while True:
-                    chunk = stream.read(256)
-                    if not chunk:
-                        break
-                    index = chunk.find(self._raw_pad)
-                    if index >= 0:
-                        data.extend(chunk[:index])
-                        extra = len(chunk) - index - 1
-                        if extra:
-                            stream.seek(-extra, 1)
-                        break
-                    data.extend(chunk)
-            else:
-                data = bytearray()
-                while True:
-                    value = stream.read(1)
-                    if not value or value[0] == self._raw_pad[0]:
-                        break
-                    data.extend(value)
-            value = bytes(data)
+            value = self._read_terminated(context[CTX_STREAM])
         else:
             length = self.__size__(context)
             value: bytes = context[CTX_STREAM].read(length)
@@ -1321,6 +1432,167 @@ class CString(FieldStruct[str, str]):
         encoding: str = self.encoding(context) if self._encoding_is_lambda else self.encoding   # pyright: ignore[reportCallIssue, reportAssignmentType]
         return value.rstrip(self._raw_pad).decode(encoding)
 
+    @override
+    def skip_single(self, context: _ContextLike) -> None:
+        """
+        Skip a single C-style string without decoding it.
+
+        :param context: The current context.
+        """
+        if self.length is Ellipsis:
+            _ = self._read_terminated(context[CTX_STREAM])
+        else:
+            skip_exact(context, self.__size__(context), "CString")
+
+    @override
+    def skip_seq(self, context: _ContextLike) -> None:
+        """
+        Skip a sequence of C-style strings without decoding them.
+
+        :param context: The current context.
+        """
+        skip_seq(context, self.skip_single)
+
+    @override
+    def unpack_seq(self, context: _ContextLike) -> Collection[str]:
+        """
+        Unpack a sequence of C-style strings from the stream.
+
+        Whole string tables are read in large chunks and split at the padding
+        character at once. Greedy sequences on seekable streams consume the
+        rest of the stream with a single read. Dynamic encodings or lengths,
+        as well as prefixed sequences, use the generic implementation.
+
+        :param context: The current context.
+        :return: A list of unpacked strings.
+        """
+        field = context[CTX_FIELD]
+        count = field.length(context)
+        stream = context[CTX_STREAM]
+        seekable = getattr(stream, "seekable", lambda: False)()
+        if (
+            self._encoding_is_lambda
+            or self._length_is_lambda
+            or not (isinstance(count, int) or (count is Ellipsis and seekable))
+        ):
+            return super().unpack_seq(context)
+
+        encoding: str = self.encoding  # pyright: ignore[reportAssignmentType]
+        if count is Ellipsis:
+            values = [
+                value.decode(encoding)
+                for value in self._split_remaining(stream)
+            ]
+        elif count <= 0:
+            values = []
+        elif self.length is Ellipsis:
+            if seekable:
+                raw_values = self._split_terminated(stream, count)
+            else:
+                raw_values = [self._read_terminated(stream) for _ in range(count)]
+            values = [value.decode(encoding) for value in raw_values]
+        else:
+            length: int = self.length  # pyright: ignore[reportAssignmentType]
+            data: bytes = stream.read(length * count)
+            values = [
+                data[i : i + length].rstrip(self._raw_pad).decode(encoding)
+                for i in range(0, length * count, length)
+            ]
+
+        factory = array_factory(context)
+        if factory:
+            return factory(values)
+        return values
+
+    def _read_terminated(self, stream: _StreamType) -> bytes:
+        # Reads until the padding character has been consumed. The terminator
+        # is not included in the returned value.
+        pad = self._raw_pad
+        data = bytearray()
+        if getattr(stream, "seekable", lambda: False)():
+            while True:
+                chunk = stream.read(CSTRING_CHUNK_SIZE)
+                if not chunk:
+                    break
+                index = chunk.find(pad)
+                if index >= 0:
+                    data.extend(chunk[:index])
+                    extra = len(chunk) - index - 1
+                    if extra:
+                        stream.seek(-extra, 1)
+                    break
+                data.extend(chunk)
+        elif hasattr(stream, "peek"):
+            # Buffered readers (e.g. pipes or sockets opened via makefile())
+            # expose their read-ahead buffer, which we can search directly
+            # without consuming more than necessary.
+            while True:
+                chunk = stream.peek(CSTRING_CHUNK_SIZE)
+                if not chunk:
+                    break
+                index = chunk.find(pad)
+                if index >= 0:
+                    data.extend(stream.read(index + 1)[:-1])
+                    break
+                data.extend(stream.read(len(chunk)))
+        else:
+            while True:
+                value = stream.read(1)
+                if not value or value[0] == pad[0]:
+                    break
+                data.extend(value)
+        return bytes(data)
+
+    def _split_terminated(self, stream: _StreamType, count: int) -> list[bytes]:
+        # Splits whole string tables at once. Only the unused tail of the last
+        # chunk is returned to the stream.
+        pad = self._raw_pad
+        values: list[bytes] = []
+        pending = b""
+        while len(values) < count:
+            chunk = stream.read(CSTRING_CHUNK_SIZE)
+            if not chunk:
+                # Same behaviour as for single strings: unterminated data at
+                # the end of the stream is returned as is.
+                values.append(pending)
+                pending = b""
+                values.extend([b""] * (count - len(values)))
+                break
+
+            parts = (pending + chunk).split(pad)
+            pending = parts.pop()
+            needed = count - len(values)
+            if len(parts) >= needed:
+                values.extend(parts[:needed])
+                # Everything after the last consumed terminator goes back
+                unused = sum(map(len, parts[needed:])) + len(parts) - needed
+                unused += len(pending)
+                if unused:
+                    stream.seek(-unused, 1)
+                break
+            values.extend(parts)
+        return values
+
+    def _split_remaining(self, stream: _StreamType) -> list[bytes]:
+        data: bytes = stream.read()
+        if self.length is not Ellipsis:
+            length: int = self.length  # pyright: ignore[reportAssignmentType]
+            return [
+                data[i : i + length].rstrip(self._raw_pad)
+                for i in range(0, len(data), length)
+            ] or [b""]
+
+        values = data.split(self._raw_pad)
+        # A trailing terminator produces an empty last element, which is not
+        # part of the sequence. Empty input still yields one (empty) string.
+        if len(values) > 1 and not values[-1]:
+            _ = values.pop()
+        return values
+
+
+CSTRING_CHUNK_SIZE = 4096
+"""Number of bytes read ahead when searching for string terminators."""
+
 
 class ConstString(Const[str]):
     """
@@ -1490,6 +1762,11 @@ class Computed(Generic[_IT], FieldStruct[NoneType, _IT]):
         # fmt: off
         return self.value(context) if callable(self.value) else self.value  # pyright: ignore[reportReturnType]
 
+    @override
+    def __skip__(self, context: _ContextLike) -> None:
+        # Computed values don't occupy any space
+        pass
+
     @override
     def pack_single(self, obj: NoneType, context: _ContextLike) -> None:
         """
@@ -1573,6 +1850,10 @@ class Pass(FieldStruct[NoneType, NoneType]):
     def __unpack__(self, context: _ContextLike) -> None:
         pass
 
+    @override
+    def __skip__(self, context: _ContextLike) -> None:
+        pass
+
     @override
     def pack_single(self, obj: None, context: _ContextLike) -> None:
         pass
@@ -1721,6 +2002,15 @@ class Prefixed(Generic[_PrefixIOT], FieldStruct[_PrefixIOT, _PrefixIOT]):
             obj = data.decode(self.encoding)
         return obj
 
+    @override
+    def skip_single(self, context: _ContextLike) -> None:
+        """
+        Skip a single prefixed object. Only the prefix is decoded.
+
+        :param context: The current context.
+        """
+        skip_exact(context, self.prefix.__unpack__(context), "Prefixed")
+
 
 class Int(FieldStruct[int, int]):
     """Generic Integer
@@ -1800,9 +2090,9 @@ class Int(FieldStruct[int, int]):
         """
         field = context.get(CTX_FIELD)
         is_little = (
-            field.order.ch
+            (field._order_ch or field.getch(context))
             if field
-            else (self.__byteorder__ or O_DEFAULT_ENDIAN.value or LittleEndian).ch
+            else getch(self.__byteorder__, context)
         ) == LITTLE_ENDIAN_FMT
         if obj < self.min_value or obj > self.max_value:
             raise OverflowError(
@@ -1831,9 +2121,9 @@ class Int(FieldStruct[int, int]):
         """
         field: Field = context.get(CTX_FIELD)
         is_little = (
-            field.order.ch
+            (field._order_ch or field.getch(context))
             if field
-            else (self.__byteorder__ or O_DEFAULT_ENDIAN.value or LittleEndian).ch
+            else getch(self.__byteorder__, context)
         ) == LITTLE_ENDIAN_FMT
 
         value = int.from_bytes(
@@ -2225,8 +2515,10 @@ class Uuid(FieldStruct[UUID, UUID]):
         if not isinstance(obj, UUID):
             obj = UUID(obj)
         field = context.get(CTX_FIELD)
-        order = field.order if field else (O_DEFAULT_ENDIAN.value or LittleEndian)
-        is_le = order.ch == LITTLE_ENDIAN_FMT
+        if field:
+            is_le = (field._order_ch or field.getch(context)) == LITTLE_ENDIAN_FMT
+        else:
+            is_le = getch(None, context) == LITTLE_ENDIAN_FMT
         context[CTX_STREAM].write(obj.bytes_le if is_le else obj.bytes)
 
     @override
@@ -2242,11 +2534,17 @@ class Uuid(FieldStruct[UUID, UUID]):
         :rtype: UUID
         """
         field = context.get(CTX_FIELD)
-        order = field.order if field else (O_DEFAULT_ENDIAN.value or LittleEndian)
-        is_le = order.ch == LITTLE_ENDIAN_FMT
+        if field:
+            is_le = (field._order_ch or field.getch(context)) == LITTLE_ENDIAN_FMT
+        else:
+            is_le = getch(None, context) == LITTLE_ENDIAN_FMT
         data = context[CTX_STREAM].read(16)
         return UUID(bytes_le=data) if is_le else UUID(bytes=data)
 
+    @override
+    def __skip__(self, context: _ContextLike) -> None:
+        skip_exact(context, 16, "Uuid")
+
 
 class AsLengthRef:
     """
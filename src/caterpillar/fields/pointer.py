@@ -148,7 +148,9 @@ class Pointer(Generic[_PtrT, _PtrValueT], FieldStruct[int, _PtrT]):
                     ) from exc
                 try:
                     model_obj = self.model.__unpack__(context)
-                except StructException as exc:
+                # nested errors are not wrapped per field
+                # pylint: disable-next=broad-exception-caught
+                except Exception as exc:
                     field = context.get(CTX_FIELD)
                     if field is not None and field.has_flag(PTR_STRICT):
                         raise DelegationError(
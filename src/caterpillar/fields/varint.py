@@ -14,6 +14,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 import typing
+from collections.abc import Collection
 from typing_extensions import override
 
 from caterpillar.exception import (
@@ -22,13 +23,13 @@ from caterpillar.exception import (
     StreamError,
 )
 from caterpillar.byteorder import (
-    O_DEFAULT_ENDIAN,
-    LittleEndian,
     LITTLE_ENDIAN_FMT,
+    getch,
 )
 from caterpillar.context import CTX_FIELD, CTX_STREAM
 from caterpillar.options import Flag
-from caterpillar.abc import _ContextLike, _EndianLike, _StreamType
+from caterpillar._common import array_factory
+from caterpillar.abc import _ContextLike, _EndianLike, _StreamType, _PrefixedType
 
 from ._mixin import FieldStruct
 
@@ -80,6 +81,22 @@ class VarInt(FieldStruct[int, int]):
                 low_bit = 1 << 7
         return high_bit, low_bit
 
+    def codec_config(self, context: _ContextLike) -> tuple[int, int, bool]:
+        """
+        Resolve the bit configuration and byteorder once per operation.
+
+        :param context: The current context.
+        :return: A tuple of ``(high_bit, low_bit, is_little)``.
+        """
+        field: "Field" = context.get(CTX_FIELD)
+        order_ch: str = (
+            (field._order_ch or field.getch(context))  # pyright: ignore[reportPrivateUsage]
+            if field
+            else getch(self.__byteorder__, context)
+        )
+        hb, lb = self.bit_config(context)
+        return hb, lb, order_ch == LITTLE_ENDIAN_FMT
+
     @override
     def pack_single(self, obj: int, context: _ContextLike) -> None:
         """
@@ -88,82 +105,194 @@ class VarInt(FieldStruct[int, int]):
         :param obj: The value to pack.
         :param context: The current context.
         """
-        if obj < 0:
-            raise InvalidValueError("Invalid negative value for VarInt encoding!")
-
-        stream: _StreamType = context[CTX_STREAM]
-        field: "Field" = context.get(CTX_FIELD)
-        order: _EndianLike = (
-            field.order
-            if field
-            else (self.__byteorder__ or O_DEFAULT_ENDIAN.value or LittleEndian)
-        )
-        is_little: bool = order.ch == LITTLE_ENDIAN_FMT
+        hb, lb, is_little = self.codec_config(context)
+        data = bytearray()
+        _encode_into(data, obj, hb, lb, is_little)
+        context[CTX_STREAM].write(data)
 
-        hb, lb = self.bit_config(context)
-        # This implementation is using LittleEndian. Later we can use reverse to
-        # apply little endian encoding.
-        data: list[int] = []
-        while obj > 0b01111111:
-            data.append(obj & 0x7F)
-            obj >>= 7
-        data.append(obj)
+    @override
+    def pack_seq(self, seq: Collection[int], context: _ContextLike) -> None:
+        """
+        Pack a sequence of values with a single write to the stream.
 
-        if not is_little:
-            data.reverse()
+        Prefixed sequences are delegated to the generic implementation, all
+        other lengths are encoded into one buffer.
 
-        for i in range(0, len(data) - 1):
-            data[i] |= hb
+        :param seq: The values to pack.
+        :param context: The current context.
+        """
+        field: "Field" = context[CTX_FIELD]
+        # pylint: disable-next=unidiomatic-typecheck
+        if type(field.amount) is _PrefixedType:
+            return super().pack_seq(seq, context)
 
-        data[-1] |= lb
-        # Just write all bytes to the stream
-        stream.write(bytes(data))
+        hb, lb, is_little = self.codec_config(context)
+        data = bytearray()
+        for obj in seq:
+            _encode_into(data, obj, hb, lb, is_little)
+        context[CTX_STREAM].write(data)
 
     @override
     def unpack_single(self, context: _ContextLike) -> int:
         """
         Unpack a single value from the stream.
 
-        :param stream: The input stream.
+        Single values are read byte-by-byte, which is faster than reading a
+        chunk and seeking back for the few bytes of one value.
+
         :param context: The current context.
         :return: The unpacked value.
         """
+        _, lb, is_little = self.codec_config(context)
+        return _read_one(context[CTX_STREAM], lb, is_little, context)
+
+    @override
+    def unpack_seq(self, context: _ContextLike) -> Collection[int]:
+        """
+        Unpack a sequence of values from the stream.
+
+        Sequences with a static length decode as many values as possible from
+        each chunk read from the stream. Greedy sequences decode the rest of
+        the stream at once, an incomplete value at the end is ignored.
+        Prefixed sequences use the generic implementation.
+
+        :param context: The current context.
+        :return: A list of unpacked values.
+        """
+        field: "Field" = context[CTX_FIELD]
+        length = field.length(context)
+        if length is not Ellipsis and not isinstance(length, int):
+            return super().unpack_seq(context)
+
         stream: _StreamType = context[CTX_STREAM]
-        data: list[int] = []
-        _, lb = self.bit_config(context)
+        _, lb, is_little = self.codec_config(context)
+        values: list[int] = []
+        if length is Ellipsis:
+            data: bytes = stream.read()
+            _ = _decode_into(values, data, 0, len(data), lb, is_little)
+        elif length > 0:
+            if stream.seekable():
+                self._unpack_chunked(stream, length, values, lb, is_little, context)
+            else:
+                for _ in range(length):
+                    values.append(_read_one(stream, lb, is_little, context))
+
+        factory = array_factory(context)
+        if factory:
+            return factory(values)
+        return values
+
+    def _unpack_chunked(
+        self,
+        stream: _StreamType,
+        count: int,
+        values: list[int],
+        lb: int,
+        is_little: bool,
+        context: _ContextLike,
+    ) -> None:
+        # Most varints are shorter than ten bytes (64-bit values), so we size the
+        # first chunk accordingly and grow the buffer only when necessary.
+        chunk_size = min(count * VARINT_CHUNK_HINT, VARINT_MAX_CHUNK)
+        buffer = b""
+        pos = 0
+        while count > 0:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                raise StreamError("Can't read stream!", context)
+            buffer = buffer[pos:] + chunk
+            pos, decoded = _decode_into(values, buffer, 0, count, lb, is_little)
+            count -= decoded
+
+        if unused := len(buffer) - pos:
+            _ = stream.seek(-unused, 1)
+
+
+VARINT_CHUNK_HINT = 10
+"""Number of bytes read per expected value (enough for one 64-bit varint)."""
+
+VARINT_MAX_CHUNK = 1 << 16
+"""Upper bound for a single chunk read while decoding varint sequences."""
+
+
+def _encode_into(
+    data: bytearray, obj: int, hb: int, lb: int, is_little: bool
+) -> None:
+    if obj < 0:
+        raise InvalidValueError("Invalid negative value for VarInt encoding!")
+
+    if obj <= 0x7F:
+        data.append(obj | lb)
+    elif is_little:
+        while obj > 0x7F:
+            data.append((obj & 0x7F) | hb)
+            obj >>= 7
+        data.append(obj | lb)
+    else:
+        # Most significant group first, the last group carries the low bit
+        shift = ((obj.bit_length() - 1) // 7) * 7
+        while shift > 0:
+            data.append(((obj >> shift) & 0x7F) | hb)
+            shift -= 7
+        data.append((obj & 0x7F) | lb)
+
+
+def _decode_into(
+    values: list[int],
+    buffer: bytes,
+    pos: int,
+    count: int,
+    lb: int,
+    is_little: bool,
+) -> tuple[int, int]:
+    # Decodes up to 'count' complete varints from the buffer and returns the
+    # position after the last complete value together with the number of
+    # decoded values. Incomplete trailing data is left untouched.
+    end = len(buffer)
+    decoded = 0
+    while decoded < count and pos < end:
+        value = 0
         shift = 0
-        field: "Field" = context.get(CTX_FIELD)
-        order: _EndianLike = (
-            field.order
-            if field
-            else (self.__byteorder__ or O_DEFAULT_ENDIAN.value or LittleEndian)
-        )
-        is_little: bool = order.ch == LITTLE_ENDIAN_FMT
-
-        while True:
-            # Note tha unpack operation here to retrieve one byte only
-            try:
-                (value,) = stream.read(1)
-            except ValueError as exc:
-                raise StreamError("Can't read stream!", context) from exc
-            data.append(value & 0x7F)
-            if value & 0x80 == lb:
-                # The "low_byte" here is taken from the field's configuration
+        idx = pos
+        while idx < end:
+            byte = buffer[idx]
+            idx += 1
+            if is_little:
+                value |= (byte & 0x7F) << shift
+                shift += 7
+            else:
+                value = (value << 7) | (byte & 0x7F)
+            if byte & 0x80 == lb:
                 break
+        else:
+            break
 
-        # The following examples shows what to do with the byteorder
-        # configuration: num=0xA0B0C0D0
-        #                            0     1     2     3
-        # b'\xd0\xc0\xb0\xa0' LE : [0xD0, 0xC0, 0xB0, 0xA0]
-        # b'\xa0\xb0\xc0\xd0' BE : [0xA0, 0xB0, 0xC0, 0xD0] << reverse that
-        if not is_little:
-            data.reverse()
+        values.append(value)
+        pos = idx
+        decoded += 1
+    return pos, decoded
 
-        value = 0
-        for number in data:
-            value |= number << shift
+
+def _read_one(
+    stream: _StreamType, lb: int, is_little: bool, context: _ContextLike
+) -> int:
+    value = 0
+    shift = 0
+    while True:
+        # Note tha unpack operation here to retrieve one byte only
+        try:
+            (byte,) = stream.read(1)
+        except ValueError as exc:
+            raise StreamError("Can't read stream!", context) from exc
+
+        if is_little:
+            value |= (byte & 0x7F) << shift
             shift += 7
-        return value
+        else:
+            value = (value << 7) | (byte & 0x7F)
+        if byte & 0x80 == lb:
+            # The "low_byte" here is taken from the field's configuration
+            return value
 
 
 vint: typing.Final[VarInt] = VarInt()
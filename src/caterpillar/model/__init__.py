@@ -17,6 +17,7 @@ from ._struct import (
     Struct,
     struct,
     UnionHook,
+    BufferedUnionHook,
     union,
     Invisible,
     StructDefMixin,
@@ -39,10 +40,25 @@ from ._bitfield import (
     bitfield_factory,
     BitfieldDefMixin,
 )
-from ._template import istemplate, template, TemplateTypeVar, derive
+from ._index import index, save_index, load_index, RecordFile
+from ._deps import (
+    FieldDependencies,
+    field_dependencies,
+    struct_dependencies,
+    referenced_fields,
+    unreferenced_fields,
+)
+from ._template import (
+    istemplate,
+    template,
+    TemplateTypeVar,
+    derive,
+    clear_derive_cache,
+)
 from .provider import (
     unpack,
     unpack_file,
+    skip,
     pack,
     pack_into,
     pack_file,
@@ -55,13 +71,24 @@ __all__ = [
     "Struct",
     "struct",
     "UnionHook",
+    "BufferedUnionHook",
     "union",
     "unpack",
     "unpack_file",
+    "skip",
     "pack",
     "pack_into",
     "pack_file",
     "sizeof",
+    "index",
+    "save_index",
+    "load_index",
+    "RecordFile",
+    "FieldDependencies",
+    "field_dependencies",
+    "struct_dependencies",
+    "referenced_fields",
+    "unreferenced_fields",
     "Bitfield",
     "bitfield",
     "BitfieldGroup",
@@ -71,6 +98,7 @@ __all__ = [
     "template",
     "TemplateTypeVar",
     "derive",
+    "clear_derive_cache",
     "NewGroup",
     "EndGroup",
     "SetAlignment",
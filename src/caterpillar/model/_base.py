@@ -15,7 +15,8 @@
 # pyright: reportPrivateUsage=false, reportAny=false, reportExplicitAny=false
 import re
 
-from collections.abc import Iterable
+from collections import namedtuple
+from collections.abc import Callable, Iterable
 from typing import Annotated, Any, Generic, get_args, get_origin
 from typing_extensions import Self, override, TypeVar
 
@@ -28,6 +29,8 @@ from caterpillar.context import (
     O_CONTEXT_FACTORY,
     Context,
     CTX_ROOT,
+    CTX_PROJECTION,
+    CTX_TUPLE,
 )
 from caterpillar.exception import StructException, ValidationError
 from caterpillar.options import (
@@ -35,6 +38,8 @@ from caterpillar.options import (
     S_DISCARD_UNNAMED,
     S_UNION,
     S_REPLACE_TYPES,
+    S_TUPLE_MODEL,
+    O_TUPLE_MODEL,
 )
 from caterpillar.fields import (
     Field,
@@ -42,13 +47,15 @@ from caterpillar.fields import (
     FieldMixin,
     Const,
 )
-from caterpillar._common import unpack_seq, pack_seq
+from caterpillar._common import unpack_seq, pack_seq, skip_seq, skip_exact
 from caterpillar.shared import (
     ATTR_ACTION_PACK,
     ATTR_ACTION_UNPACK,
     Action,
+    getstruct,
+    hasstruct,
 )
-from caterpillar import registry
+from caterpillar import registry, options as _options
 from caterpillar.abc import (
     _StructLike,
     _ContextLike,
@@ -62,6 +69,18 @@ from caterpillar.abc import (
 
 
 class _Member:
+    __slots__: tuple[str, ...] = (
+        "name",
+        "field",
+        "include",
+        "is_action",
+        "action_unpack",
+        "action_pack",
+        "path_suffix",
+        "unpack",
+        "pack",
+    )
+
     def __init__(
         self,
         name: str | None,
@@ -77,6 +96,9 @@ class _Member:
         self.action_unpack: _ContextLambda[None] | None = getattr(field, ATTR_ACTION_UNPACK, None)
         self.action_pack: _ContextLambda[None] | None = getattr(field, ATTR_ACTION_PACK, None)
         self.path_suffix: str = f".{self.name}"
+        # Replaced by specialized callables once the sequence is finalized
+        self.unpack: Callable[[_ContextLike], Any] | None = None if is_action else field.__unpack__
+        self.pack: Callable[[Any, _ContextLike], None] | None = None if is_action else field.__pack__
 
     def clone(self) -> "_Member":
         field: Field = self.field if self.is_action else _clone_field(self.field)
@@ -129,6 +151,47 @@ _ExtraOptionT = _EndianLike | _ArchLike | _OptionLike[Any]
 _AnnotationT = str | bytes | Field | type | _ActionLike | Any
 
 
+
+def _advances_by_size(sequence: "Sequence[Any, Any, Any]", seen: set[int]) -> bool:
+    # Whether unpacking advances the stream by exactly the size of all
+    # members. Actions and offsets (also in nested sequences) don't.
+    if id(sequence) in seen:
+        return True
+    seen.add(id(sequence))
+    for member in sequence.fields:
+        if member.is_action:
+            return False
+        field = member.field
+        if field._has_offset or not field._keep_pos:
+            return False
+        struct = field.struct
+        if hasstruct(struct):
+            struct = getstruct(struct)
+        if isinstance(struct, Sequence) and not _advances_by_size(struct, seen):
+            return False
+    return True
+
+
+def _tuple_factory(model: type, names: tuple[str, ...]) -> type[tuple[Any, ...]]:
+    # The tuple type is named after the model (e.g. 'PointTuple'), but it is
+    # not the model. Records are pickled by a reference to their model class,
+    # because the generated type can't be looked up by its name.
+    tuple_type = namedtuple(
+        f"{model.__name__}Tuple", names, rename=True, module=model.__module__
+    )
+    tuple_type.__qualname__ = f"{model.__qualname__}Tuple"
+
+    def __reduce__(self: tuple[Any, ...]) -> tuple[Any, ...]:
+        return _rebuild_tuple, (model, tuple(self))
+
+    tuple_type.__reduce__ = __reduce__  # pyright: ignore[reportAttributeAccessIssue]
+    return tuple_type
+
+
+def _rebuild_tuple(model: type, values: tuple[Any, ...]) -> tuple[Any, ...]:
+    return getstruct(model)._get_tuple_type()._make(values)  # pyright: ignore[reportOptionalMemberAccess]
+
+
 class Sequence(Generic[_SeqModelT, _SeqIT, _SeqOT], FieldMixin[_SeqIT, _SeqOT]):
     """Default implementation for a sequence of fields.
 
@@ -149,6 +212,15 @@ class Sequence(Generic[_SeqModelT, _SeqIT, _SeqOT], FieldMixin[_SeqIT, _SeqOT]):
         "field_options",
         "_members",
         "is_union",
+        "_finalized",
+        "_skip_by_size",
+        "_skip_size",
+        "_skip_static",
+        "_projections",
+        "_model_names",
+        "_has_excluded",
+        "_tuple_model",
+        "_tuple_type",
     )
 
     def __init__(
@@ -169,10 +241,59 @@ class Sequence(Generic[_SeqModelT, _SeqIT, _SeqOT], FieldMixin[_SeqIT, _SeqOT]):
         self._members: dict[str, Field] = {}
         self.fields: list[_Member] = []
         self.is_union: bool = S_UNION in self.options
+        self._finalized: int = -1
+        # size-based skipping, see skip_one()
+        self._skip_by_size: bool | None = None
+        self._skip_size: int | None = None
+        self._skip_static: bool = False
+        # projection plans by selected field paths, see unpack_projected()
+        self._projections: dict[frozenset[str], list[Any]] = {}
+        # names of parsed members that are part of the model
+        self._model_names: tuple[str, ...] = ()
+        self._has_excluded: bool = False
+        # named tuple output, see S_TUPLE_MODEL
+        self._tuple_model: bool = False
+        self._tuple_type: type[tuple[Any, ...]] | None = None
         # Process all fields in the model
         self._process_model()
+        self.finalize()
+
+    def finalize(self) -> None:
+        """
+        Freezes the schema of this sequence.
+
+        Every field resolves its option-dependent state and selects specialized
+        pack and unpack callables (see :meth:`~caterpillar.fields.Field.specialize`),
+        so that the pack and unpack loops don't have to branch per field. This
+        method is called automatically on creation and again once global options
+        have changed or members were added or removed.
+
+        .. versionadded:: 2.8.2
+        """
+        for member in self.fields:
+            if not member.is_action:
+                member.unpack, member.pack = member.field.specialize()
+        # resolved lazily by the first skip_one()
+        self._skip_by_size = None
+        self._skip_size = None
+        self._projections.clear()
+        model_names = tuple(
+            member.name
+            for member in self.fields
+            if not member.is_action and member.include
+        )
+        if model_names != self._model_names:
+            # the tuple type is kept unless the layout has changed
+            self._tuple_type = None
+            self._model_names = model_names
+        self._has_excluded = any(
+            not member.is_action and not member.include for member in self.fields
+        )
+        self._tuple_model = S_TUPLE_MODEL in self.options
+        self._finalized = _options._OPTIONS_EPOCH
 
     def _insert_member(self, member: _Member, replace: bool = False) -> None:
+        self._finalized = -1
         if member.is_action:
             self.fields.append(member)
             return
@@ -208,6 +329,7 @@ class Sequence(Generic[_SeqModelT, _SeqIT, _SeqOT], FieldMixin[_SeqIT, _SeqOT]):
 
     def __sub__(self, sequence: "Sequence") -> Self:
         # By default, we are only removing existing fields.
+        self._finalized = -1
         for member in sequence.fields:
             _ = self._members.pop(member.name, None)
             if member.name in self.fields:
@@ -447,6 +569,7 @@ class Sequence(Generic[_SeqModelT, _SeqIT, _SeqOT], FieldMixin[_SeqIT, _SeqOT]):
             field.arch = arch
         field.flags.update(self.field_options)
         # field.flags.update({hash(x): x for x in self.field_options})
+        field.freeze()
         return field
 
     def add_field(self, name: str, field: Field, included: bool = False) -> None:
@@ -458,6 +581,7 @@ class Sequence(Generic[_SeqModelT, _SeqIT, _SeqOT], FieldMixin[_SeqIT, _SeqOT]):
         :param included: True if the field should be included, else False.
         """
         self.fields.append(_Member(name, field, include=included))
+        self._finalized = -1
         setattr(field, "__name__", name)
         if included:
             self._members[name] = field
@@ -479,6 +603,7 @@ class Sequence(Generic[_SeqModelT, _SeqIT, _SeqOT], FieldMixin[_SeqIT, _SeqOT]):
         """
         self._members.pop(name, None)
         self.fields.remove(field)  # REVISIT: invalid type here
+        self._finalized = -1
 
     def get_members(self) -> dict[str, Field]:
         return self._members.copy()
@@ -509,14 +634,63 @@ class Sequence(Generic[_SeqModelT, _SeqIT, _SeqOT], FieldMixin[_SeqIT, _SeqOT]):
         return max_size if self.is_union else total
 
     def unpack_one(self, context: _ContextLike) -> _SeqOT:
+        """
+        Unpack one instance of this sequence.
+
+        :param context: The context of the sequence.
+        :return: The unpacked object.
+        """
+        return self._create_object(self._unpack_data(context), context)
+
+    def _create_object(self, data: _ContextLike, context: _ContextLike) -> _SeqOT:
+        # converts the parsed values into the final object
+        if self._is_tuple_mode(context):
+            return self._make_tuple(data)
+        if not self._has_excluded:
+            # the object context is the result
+            return data  # pyright: ignore[reportReturnType]
+        init_data = (O_CONTEXT_FACTORY.value or Context)()
+        for name in self._model_names:
+            init_data[name] = data[name]
+        return init_data  # pyright: ignore[reportReturnType]
+
+    def _is_tuple_mode(self, context: _ContextLike) -> bool:
+        return bool(
+            self._tuple_model
+            or O_TUPLE_MODEL.value
+            or context._root.get(CTX_TUPLE)
+        )
+
+    def _get_tuple_type(self) -> type[tuple[Any, ...]]:
+        tuple_type = self._tuple_type
+        if tuple_type is None:
+            names = self._model_names
+            if isinstance(self.model, type):
+                tuple_type = _tuple_factory(self.model, names)
+            else:
+                tuple_type = namedtuple(f"{type(self).__name__}Tuple", names, rename=True)
+            self._tuple_type = tuple_type
+        return tuple_type
+
+    def _make_tuple(self, data: _ContextLike) -> Any:
+        return self._get_tuple_type()._make([data[name] for name in self._model_names])
+
+    def _unpack_data(self, context: _ContextLike) -> _ContextLike:
+        if self._finalized != _options._OPTIONS_EPOCH:
+            self.finalize()
+        projection = context.get(CTX_PROJECTION)
+        if projection is not None:
+            if not self.is_union:
+                return self.unpack_projected(context, projection)
+            # all members of a union are parsed completely
+            context[CTX_PROJECTION] = None
         # At first, we define the object context where the parsed values
-        # will be stored
-        factory = O_CONTEXT_FACTORY.value or Context
+        # will be stored. It contains parsed values only, so that it can be
+        # used as the result or init data without copying (see _create_object).
+        # The parent context is available through context[CTX_PARENT].
         fields = self.fields
         ctx_path = CTX_PATH
-        ctx_object = CTX_OBJECT
-        init_data = factory()
-        context[ctx_object] = factory(_parent=context)
+        obj_context = context[CTX_OBJECT] = (O_CONTEXT_FACTORY.value or Context)()
         base_path: str = context[ctx_path]
         stream: _StreamType = context[CTX_STREAM]
         start = pos = max_size = 0
@@ -536,23 +710,69 @@ class Sequence(Generic[_SeqModelT, _SeqIT, _SeqOT], FieldMixin[_SeqIT, _SeqOT]):
             name = member.name
             # The context path has to be changed accordingly
             context[ctx_path] = base_path + member.path_suffix
-            result = member.field.__unpack__(context)
-            # the object's data shouldn't include removed fields
-            context[ctx_object][name] = result
-            if member.include:
-                init_data[name] = result
+            obj_context[name] = member.unpack(context)  # pyright: ignore[reportOptionalCall]
 
             if self.is_union:
                 # This union implementation will cover the max size
                 max_size = max(max_size, stream.tell() - pos)
                 stream.seek(start)
 
-        obj = init_data
         if self.is_union:
             # Reset the stream position
             stream.seek(start + max_size)
         context[ctx_path] = base_path
-        return obj  # pyright: ignore[reportReturnType]
+        return obj_context
+
+    def unpack_projected(
+        self, context: _ContextLike, projection: frozenset[str]
+    ) -> _ContextLike:
+        """
+        Unpack only the given field paths and their dependencies.
+
+        Members that are neither selected nor referenced by other members
+        (through their length, condition, offset or switch) are skipped and
+        stored as :code:`None`. If the dependencies of a member can't be
+        determined (e.g. because of a lambda function), all members are
+        parsed.
+
+        .. versionadded:: 2.8.2
+
+        :param context: The context of the struct.
+        :param projection: The selected field paths relative to this struct.
+        :raises StructException: if a path doesn't start with a member name
+        :return: The unpacked values.
+        """
+        plan = self._projections.get(projection)
+        if plan is None:
+            from ._deps import projection_plan
+
+            try:
+                plan = projection_plan(self, projection)
+            except ValueError as exc:
+                raise StructException(str(exc), context) from exc
+            self._projections[projection] = plan
+
+        obj_context = context[CTX_OBJECT] = (O_CONTEXT_FACTORY.value or Context)()
+        base_path: str = context[CTX_PATH]
+        for member, parse, sub_projection in plan:
+            if member.is_action:
+                if member.action_unpack:
+                    member.action_unpack(context)
+                continue
+
+            name = member.name
+            context[CTX_PATH] = base_path + member.path_suffix
+            # nested structs read their projection from this context
+            context[CTX_PROJECTION] = sub_projection
+            if parse:
+                obj_context[name] = member.unpack(context)  # pyright: ignore[reportOptionalCall]
+            else:
+                member.field.__skip__(context)
+                obj_context[name] = None
+
+        context[CTX_PROJECTION] = projection
+        context[CTX_PATH] = base_path
+        return obj_context
 
     def __unpack__(self, context: _ContextLike) -> _SeqOT:
         """
@@ -570,12 +790,89 @@ class Sequence(Generic[_SeqModelT, _SeqIT, _SeqOT], FieldMixin[_SeqIT, _SeqOT]):
             _io=context[CTX_STREAM],
             _path=base_path,
         )
+        projection = context.get(CTX_PROJECTION)
         # See __pack__ for more information
         field = context.get("_field")
         if field and context[CTX_SEQ]:
-            return unpack_seq(context, self.unpack_one)  # pyright: ignore[reportReturnType]
+            if projection is None:
+                return unpack_seq(context, self.unpack_one)  # pyright: ignore[reportReturnType]
+
+            def unpack_element(element_context: _ContextLike) -> _SeqOT:
+                element_context[CTX_PROJECTION] = projection
+                return self.unpack_one(element_context)
+
+            return unpack_seq(context, unpack_element)  # pyright: ignore[reportReturnType]
+
+        if projection is not None:
+            this_context[CTX_PROJECTION] = projection
         return self.unpack_one(this_context)
 
+    def skip_one(self, context: _ContextLike) -> None:
+        """
+        Skip one instance of this sequence without building the model object.
+
+        Sequences whose size is known before parsing are skipped at once. This
+        requires that no member is an action, uses an offset or is read by
+        another member. Otherwise, all members are parsed into the context
+        (later fields may depend on them), but no model object is created.
+
+        .. versionadded:: 2.8.2
+
+        :param context: The context of the sequence.
+        """
+        if self._finalized != _options._OPTIONS_EPOCH:
+            self.finalize()
+        if self._skip_by_size is None:
+            self._setup_skip()
+        if self._skip_by_size:
+            size = self._skip_size
+            if size is None:
+                base_path: str = context[CTX_PATH]
+                try:
+                    size = self.__size__(context)
+                except Exception:
+                    context[CTX_PATH] = base_path
+                    if self._skip_static:
+                        # the size doesn't depend on the context
+                        self._skip_by_size = False
+                else:
+                    if self._skip_static:
+                        self._skip_size = size
+            if size is not None:
+                skip_exact(context, size, f"Sequence at {context[CTX_PATH]!r}")
+                return
+
+        _ = Sequence._unpack_data(self, context)
+
+    def _setup_skip(self) -> None:
+        from ._deps import referenced_fields, struct_dependencies
+
+        self._skip_by_size = (
+            _advances_by_size(self, set()) and referenced_fields(self) == set()
+        )
+        self._skip_static = self._skip_by_size and struct_dependencies(self) == set()
+
+    def __skip__(self, context: _ContextLike) -> None:
+        """
+        Advance the stream past this sequence (see :meth:`skip_one`).
+
+        .. versionadded:: 2.8.2
+
+        :param context: The current context.
+        """
+        field = context.get(CTX_FIELD)
+        if field and context[CTX_SEQ]:
+            skip_seq(context, self.skip_one)
+            return
+
+        this_context = (O_CONTEXT_FACTORY.value or Context)(
+            _root=context.get(CTX_ROOT, context),
+            _parent=context,
+            _io=context[CTX_STREAM],
+            _path=context[CTX_PATH],
+        )
+        self.skip_one(this_context)
+
     def get_value(self, obj: _SeqIT, name: str, field: Field) -> Any | None:
         value = obj.get(name, INVALID_DEFAULT)
         if value is INVALID_DEFAULT:
@@ -587,6 +884,8 @@ class Sequence(Generic[_SeqModelT, _SeqIT, _SeqOT], FieldMixin[_SeqIT, _SeqOT]):
         return value
 
     def pack_one(self, obj: _SeqIT, context: _ContextLike) -> None:
+        if self._finalized != _options._OPTIONS_EPOCH:
+            self.finalize()
         max_size = 0
         union_field = None
         fields = self.fields
@@ -617,7 +916,7 @@ class Sequence(Generic[_SeqModelT, _SeqIT, _SeqOT], FieldMixin[_SeqIT, _SeqOT]):
                     # REVISIT: this line might not be necessary if const fields already
                     # use their internal value.
                     value = field.default if field.default != INVALID_DEFAULT else None
-                field.__pack__(value, context)
+                member.pack(value, context)  # pyright: ignore[reportOptionalCall]
 
         if self.is_union:
             if union_field is None:
@@ -36,8 +36,7 @@ from caterpillar.shared import (
 )
 from caterpillar.byteorder import (
     LITTLE_ENDIAN_FMT,
-    O_DEFAULT_ENDIAN,
-    LittleEndian,
+    getch,
 )
 from caterpillar.options import (
     B_GROUP_NEW,
@@ -48,6 +47,7 @@ from caterpillar.options import (
     B_GROUP_END,
     B_GROUP_KEEP,
     B_NO_AUTO_BOOL,
+    S_TUPLE_MODEL,
     Flag,
 )
 from caterpillar.fields import (
@@ -56,6 +56,7 @@ from caterpillar.fields import (
     INVALID_DEFAULT,
 )
 from caterpillar.exception import StructException, ValidationError
+from caterpillar._common import skip_exact
 from caterpillar.context import (
     CTX_FIELD,
     CTX_PATH,
@@ -651,6 +652,7 @@ class Bitfield(Struct[_VT]):
         # Add additional options based on the struct's type
         self.options.difference_update(GLOBAL_STRUCT_OPTIONS, GLOBAL_UNION_OPTIONS)
         self.options.update(GLOBAL_BITFIELD_FLAGS)
+        self._tuple_model = S_TUPLE_MODEL in self.options
 
         self.groups = [group for group in self.groups if not group.is_empty()]
         self.groups[-1].align_to(self._current_alignment)
@@ -1023,6 +1025,18 @@ class Bitfield(Struct[_VT]):
         """
         return sum(group.get_bits() for group in self.groups)
 
+    @override
+    def skip_one(self, context: _ContextLike) -> None:
+        """
+        Skip one bitfield. Bitfields always have a static size.
+
+        .. versionadded:: 2.8.2
+
+        :param context: Unpacking context.
+        :type context: Any
+        """
+        skip_exact(context, self.__size__(context), "Bitfield")
+
     @override
     def unpack_one(self, context: _ContextLike) -> _VT:
         init_data = (O_CONTEXT_FACTORY.value or Context)()
@@ -1032,12 +1046,12 @@ class Bitfield(Struct[_VT]):
         base_path: str = context[CTX_PATH]
         members = self._members
         # REVISIT
-        order: _EndianLike = (
-            field.order
+        order_ch: str = (
+            (field._order_ch or field.getch(context))
             if field
-            else (self.order or O_DEFAULT_ENDIAN.value or LittleEndian)
+            else getch(self.order, context)
         )
-        endian = "little" if order.ch == LITTLE_ENDIAN_FMT else "big"
+        endian = "little" if order_ch == LITTLE_ENDIAN_FMT else "big"
         for group in self.groups:
             if group.is_field():
                 # unpack using field instance
@@ -1078,6 +1092,8 @@ class Bitfield(Struct[_VT]):
                         value -= 1 << entry.width
                     init_data[entry.name] = value
 
+        if self._is_tuple_mode(context):
+            return self._make_tuple(init_data)
         return self.model(**init_data)  # pyright: ignore[reportCallIssue]
 
     @override
@@ -1086,12 +1102,12 @@ class Bitfield(Struct[_VT]):
         field: Field | None = context.get(CTX_FIELD)
         members = self._members
         # REVISIT
-        order: _EndianLike = (
-            field.order
+        order_ch: str = (
+            (field._order_ch or field.getch(context))
             if field
-            else (self.order or O_DEFAULT_ENDIAN.value or LittleEndian)
+            else getch(self.order, context)
         )
-        endian = "little" if order.ch == LITTLE_ENDIAN_FMT else "big"
+        endian = "little" if order_ch == LITTLE_ENDIAN_FMT else "big"
         for group in self.groups:
             if group.is_field():
                 field = group.get_field()
@@ -0,0 +1,354 @@
+# Copyright (C) MatrixEditor 2023-2026
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# pyright: reportAny=false, reportExplicitAny=false, reportPrivateUsage=false
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from caterpillar.context import (
+    CTX_OBJECT,
+    CTX_PARENT,
+    ContextPath,
+    BinaryExpression,
+    UnaryExpression,
+    ContextLength,
+    expr_paths,
+)
+from caterpillar.byteorder import ByteOrder, DynByteOrder, Arch
+from caterpillar.fields import Field
+from caterpillar.shared import getstruct, hasstruct
+from ._base import Sequence, _Member
+
+# Paths are stored as dotted strings relative to the context of the analyzed
+# field, e.g. "_obj.length" for this.length. None marks a dependency that
+# can't be determined statically (e.g. a lambda function).
+_Paths = set[str] | None
+
+_EXPRESSION_TYPES = (ContextPath, BinaryExpression, UnaryExpression, ContextLength)
+_CONSTANT_TYPES = (int, float, str, bytes, bytearray, type, Enum, ByteOrder, Arch)
+
+
+def _attributes(obj: object) -> list[Any]:
+    # all instance attributes, including private slots
+    values = list(getattr(obj, "__dict__", {}).values())
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{cls.__name__.lstrip('_')}{name}"
+            try:
+                values.append(getattr(obj, name))
+            except AttributeError:
+                pass
+    return values
+
+
+def _value_paths(value: Any, seen: set[int]) -> _Paths:
+    if value is None or isinstance(value, _CONSTANT_TYPES):
+        return set()
+    if isinstance(value, DynByteOrder):
+        if value.func is not None:
+            return None if value._ctx_func else set()
+        if isinstance(value.key, str):
+            return {value.key}
+        return expr_paths(value.key)
+    if isinstance(value, _EXPRESSION_TYPES):
+        return expr_paths(value)
+    if isinstance(value, (Field, Sequence)) or hasattr(value, "__unpack__"):
+        return struct_dependencies(value, seen)
+
+    values = None
+    if isinstance(value, dict):
+        values = value.values()
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        values = value
+    if values is not None:
+        paths: set[str] = set()
+        for item in values:
+            item_paths = _value_paths(item, seen)
+            if item_paths is None:
+                return None
+            paths |= item_paths
+        return paths
+    # opaque callables may read anything from the context
+    return None if callable(value) else set()
+
+
+@dataclass(frozen=True)
+class FieldDependencies:
+    """Context paths read while unpacking a single field.
+
+    Paths are dotted strings relative to the context of the field, e.g.
+    ``"_obj.length"`` for :code:`this.length` (see
+    :func:`~caterpillar.context.expr_paths`). An attribute is :code:`None` if
+    its paths can't be determined statically, e.g. because of a lambda
+    function.
+
+    .. versionadded:: 2.8.2
+    """
+
+    struct: set[str] | None
+    """Paths read by the struct itself, e.g. the length of :code:`Bytes(this.length)`."""
+
+    length: set[str] | None
+    """Paths read by the sequence length or prefix of the field."""
+
+    condition: set[str] | None
+    """Paths read by the condition of the field."""
+
+    offset: set[str] | None
+    """Paths read by the offset of the field."""
+
+    switch: set[str] | None
+    """Paths read by the switch options of the field."""
+
+    order: set[str] | None
+    """Paths read by a dynamic byteorder of the field."""
+
+    @property
+    def paths(self) -> set[str] | None:
+        """All paths read by the field or :code:`None` if unknown."""
+        paths: set[str] = set()
+        for part in (
+            self.struct,
+            self.length,
+            self.condition,
+            self.offset,
+            self.switch,
+            self.order,
+        ):
+            if part is None:
+                return None
+            paths |= part
+        return paths
+
+    @property
+    def members(self) -> set[str] | None:
+        """Names of the members of the enclosing struct read by the field."""
+        paths = self.paths
+        if paths is None:
+            return None
+        names: set[str] = set()
+        for path in paths:
+            tokens = path.split(".")
+            if tokens[0] == CTX_OBJECT:
+                if len(tokens) == 1:
+                    # the whole object is used
+                    return None
+                names.add(tokens[1])
+        return names
+
+
+def field_dependencies(field: Field, seen: set[int] | None = None) -> FieldDependencies:
+    """Returns the context paths read while unpacking the given field.
+
+    >>> deps = field_dependencies(Bytes(this.length) // (parent.flags == 1))
+    >>> deps.struct, deps.condition
+    ({'_obj.length'}, {'_parent._obj.flags'})
+
+    .. versionadded:: 2.8.2
+
+    :param field: the field to analyze
+    :type field: Field
+    :return: the paths grouped by their origin
+    :rtype: FieldDependencies
+    """
+    seen = set() if seen is None else seen
+    if field._is_lambda:
+        struct = expr_paths(field.struct)
+    else:
+        struct = _value_paths([field.struct, field.bits], seen)
+
+    amount = field.amount
+    length: set[str] | None = set()
+    if isinstance(amount, slice):
+        # prefixed sequence, the prefix is a struct
+        length = _value_paths(amount.start, seen)
+    elif field._amount_is_lambda:
+        length = expr_paths(amount)
+
+    switch: set[str] | None = set()
+    if field.options:
+        # switch functions receive the parsed value, they can't be analyzed
+        switch = None if field._switch_is_lambda else _value_paths(dict(field.options), seen)
+
+    return FieldDependencies(
+        struct=struct,
+        length=length,
+        condition=expr_paths(field.condition) if field._cond_is_lambda else set(),
+        offset=expr_paths(field.offset) if field._offset_is_lambda else set(),
+        switch=switch,
+        order=_value_paths(field.order, seen),
+    )
+
+
+def struct_dependencies(struct: Any, seen: set[int] | None = None) -> set[str] | None:
+    """Returns the context paths read while unpacking the given struct.
+
+    Paths of sequences are translated to the context of a field that stores
+    the sequence: references to their own members are dropped and parent
+    references (:code:`parent.*`) become object references (:code:`this.*`).
+
+    .. versionadded:: 2.8.2
+
+    :param struct: the struct or model class to analyze
+    :type struct: Any
+    :return: the paths, or :code:`None` if they can't be determined
+    :rtype: set[str] | None
+    """
+    if hasstruct(struct):
+        struct = getstruct(struct)
+    seen = set() if seen is None else seen
+    if id(struct) in seen:
+        # recursive definition, the paths are collected by the outer call
+        return set()
+    seen.add(id(struct))
+    try:
+        return _struct_paths(struct, seen)
+    finally:
+        seen.discard(id(struct))
+
+
+def _struct_paths(struct: Any, seen: set[int]) -> _Paths:
+    if isinstance(struct, Field):
+        return field_dependencies(struct, seen).paths
+    if not isinstance(struct, Sequence):
+        return _value_paths(_attributes(struct), seen)
+
+    paths: set[str] = set()
+    for member in struct.fields:
+        if member.is_action:
+            return None
+        member_paths = field_dependencies(member.field, seen).paths
+        if member_paths is None:
+            return None
+        for path in member_paths:
+            head, _, rest = path.partition(".")
+            if head == CTX_OBJECT:
+                continue
+            if head == CTX_PARENT:
+                if not rest:
+                    return None
+                paths.add(rest)
+            else:
+                paths.add(path)
+    return paths
+
+
+def referenced_fields(struct: Any) -> set[str] | None:
+    """Returns the names of all fields read by other fields of a struct.
+
+    The values of these fields must be available in the object context
+    while unpacking. Actions and lambda functions may read any value, in which
+    case :code:`None` is returned.
+
+    .. versionadded:: 2.8.2
+
+    :param struct: the sequence or model class to analyze
+    :type struct: Any
+    :return: the field names, or :code:`None` if they can't be determined
+    :rtype: set[str] | None
+    """
+    sequence: Sequence[Any, Any, Any] = getstruct(struct) if hasstruct(struct) else struct
+    names: set[str] = set()
+    for member in sequence.fields:
+        if member.is_action:
+            return None
+        members = field_dependencies(member.field).members
+        if members is None:
+            return None
+        names |= members
+    return names
+
+
+def unreferenced_fields(struct: Any) -> list[str] | None:
+    """Returns the names of all fields that no other field of a struct reads.
+
+    >>> @struct
+    ... class Format:
+    ...     length: uint8
+    ...     data: Bytes(this.length)
+    ...     crc: uint32
+    ...
+    >>> unreferenced_fields(Format)
+    ['data', 'crc']
+
+    These fields can be skipped when they aren't needed (see the *fields*
+    parameter of :func:`~caterpillar.model.unpack`).
+
+    .. versionadded:: 2.8.2
+
+    :param struct: the sequence or model class to analyze
+    :type struct: Any
+    :return: the field names in declaration order, or :code:`None` if they
+        can't be determined
+    :rtype: list[str] | None
+    """
+    sequence: Sequence[Any, Any, Any] = getstruct(struct) if hasstruct(struct) else struct
+    names = referenced_fields(sequence)
+    if names is None:
+        return None
+    return [
+        member.name
+        for member in sequence.fields
+        if not member.is_action and member.name not in names
+    ]
+
+
+_ProjectionPlan = list[tuple[_Member, bool, frozenset[str] | None]]
+
+
+def projection_plan(
+    sequence: Sequence[Any, Any, Any], projection: frozenset[str]
+) -> _ProjectionPlan:
+    """Creates the unpack plan of a sequence for the given field paths.
+
+    Each entry of the plan stores the member, whether it must be parsed and
+    the paths selected within it (None to parse it completely). Members
+    that are neither selected nor referenced by other members are skipped.
+
+    :param sequence: the sequence to unpack
+    :type sequence: Sequence
+    :param projection: the selected field paths relative to the sequence
+    :type projection: frozenset[str]
+    :raises ValueError: if a path doesn't start with a member name
+    :return: the plan
+    :rtype: list[tuple[_Member, bool, frozenset[str] | None]]
+    """
+    selected: dict[str, set[str] | None] = {}
+    for path in projection:
+        name, _, rest = path.partition(".")
+        if name not in sequence._members:
+            raise ValueError(f"Unknown field in projection: {name!r}")
+        if not rest:
+            selected[name] = None
+        elif selected.get(name, set()) is not None:
+            selected.setdefault(name, set()).add(rest)  # pyright: ignore[reportOptionalMemberAccess]
+
+    required = referenced_fields(sequence)
+    plan: _ProjectionPlan = []
+    for member in sequence.fields:
+        name = member.name
+        if member.is_action or required is None or name in required:
+            # referenced values must be complete
+            plan.append((member, True, None))
+        elif name in selected:
+            sub = selected[name]
+            plan.append((member, True, None if sub is None else frozenset(sub)))
+        else:
+            plan.append((member, False, None))
+    return plan
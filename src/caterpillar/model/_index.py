@@ -0,0 +1,294 @@
+# Copyright (C) MatrixEditor 2023-2026
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# pyright: reportAny=false, reportExplicitAny=false, reportPrivateUsage=false
+import os
+import sys
+
+from array import array
+from io import IOBase, SEEK_END
+from collections.abc import Iterator
+from types import TracebackType
+from typing import Any, Generic
+from typing_extensions import Self, overload
+
+from caterpillar.exception import DynamicSizeError, StructException
+from caterpillar.shared import getstruct, hasstruct
+from caterpillar.abc import _OT, _SupportsUnpack, _EndianLike, _ArchLike
+from .provider import unpack, sizeof, skip
+
+
+INDEX_TYPECODE = "Q"
+"""Type code of the offset arrays created by :func:`index`."""
+
+
+def _open_stream(file: str | os.PathLike[str] | IOBase) -> tuple[IOBase, bool]:
+    # returns the stream and whether it is owned by the caller
+    if isinstance(file, IOBase):
+        return file, False
+    return open(file, "rb"), True
+
+
+def index(
+    struct: _SupportsUnpack[_OT] | type[_OT],
+    file: str | os.PathLike[str] | IOBase,
+    /,
+    *,
+    start: int = 0,
+    count: int | None = None,
+    order: _EndianLike | None = None,
+    arch: _ArchLike | None = None,
+    **kwds: Any,
+) -> array:
+    """Builds an index of all records stored in the given file.
+
+    The file is treated as a greedy sequence of records, each described by
+    *struct*. The returned array stores the start offset of every record.
+    Records of a static size are indexed after skipping the first record only.
+    Otherwise, all records are skipped once (see :func:`~caterpillar.model.skip`).
+
+    >>> offsets = index(Item, "items.bin")
+    >>> save_index(offsets, "items.bin.idx")
+
+    .. versionadded:: 2.8.2
+
+    :param struct: the struct of a single record
+    :type struct: _SupportsUnpack[_OT] | type[_OT]
+    :param file: the file name or a seekable binary stream
+    :type file: str | os.PathLike[str] | IOBase
+    :param start: offset of the first record (e.g. after a length prefix), defaults to 0
+    :type start: int, optional
+    :param count: maximum number of records to index, defaults to None
+    :type count: int | None, optional
+    :raises StructException: if a record doesn't advance the stream
+    :return: the start offsets of all records
+    :rtype: array
+    """
+    if hasstruct(struct):
+        struct = getstruct(struct)
+
+    stream, owned = _open_stream(file)
+    try:
+        end = stream.seek(0, SEEK_END)
+        try:
+            size = sizeof(struct, order=order, arch=arch, **kwds)  # pyright: ignore[reportArgumentType]
+        except DynamicSizeError:
+            # the size can't be determined without parsing the data
+            size = 0
+
+        offsets = array(INDEX_TYPECODE)
+        pos = stream.seek(start)
+        while pos < end and (count is None or len(offsets) < count):
+            offsets.append(pos)
+            _ = skip(struct, stream, order=order, arch=arch, **kwds)  # pyright: ignore[reportArgumentType]
+            step = stream.tell() - pos
+            if step <= 0:
+                raise StructException(f"Record at offset {pos} doesn't advance the stream")
+            if step == size and len(offsets) == 1:
+                # Records of a static size are stored at a fixed stride. It is
+                # verified with the first record, because sizeof() also counts
+                # fields at an offset, which don't advance the stream.
+                stop = end - size + 1
+                if count is not None:
+                    stop = min(stop, start + count * size)
+                offsets.extend(range(pos + size, stop, size))
+                break
+            pos += step
+        return offsets
+    finally:
+        if owned:
+            stream.close()
+
+
+def save_index(offsets: array, path: str | os.PathLike[str]) -> None:
+    """Stores an index as a sidecar file.
+
+    The offsets are written as little-endian unsigned 64-bit integers.
+
+    .. versionadded:: 2.8.2
+
+    :param offsets: the offsets returned by :func:`index`
+    :type offsets: array
+    :param path: the target file name
+    :type path: str | os.PathLike[str]
+    """
+    data = array(INDEX_TYPECODE, offsets)
+    if sys.byteorder != "little":
+        data.byteswap()
+    with open(path, "wb") as fp:
+        data.tofile(fp)
+
+
+def load_index(path: str | os.PathLike[str]) -> array:
+    """Loads an index previously stored by :func:`save_index`.
+
+    .. versionadded:: 2.8.2
+
+    :param path: the sidecar file name
+    :type path: str | os.PathLike[str]
+    :return: the start offsets of all records
+    :rtype: array
+    """
+    offsets = array(INDEX_TYPECODE)
+    with open(path, "rb") as fp:
+        offsets.frombytes(fp.read())
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    return offsets
+
+
+class RecordFile(Generic[_OT]):
+    """Random access to the records of a greedy record file.
+
+    Records are located through an offset index (see :func:`index`), which
+    makes indexing and slicing independent of the number of preceding
+    records. Only the bytes of the requested records are read.
+
+    >>> with RecordFile(Item, "items.bin", index_path="items.bin.idx") as records:
+    ...     last = records[-1]
+    ...     page = records[100:120]
+
+    If *index_path* points to an existing file, the index is loaded from it.
+    Otherwise, the index is built and, if *index_path* is given, saved there.
+
+    Records are decoded from the underlying stream at their offset, so
+    absolute offsets and pointers refer to positions in the whole file.
+
+    .. versionadded:: 2.8.2
+
+    :param struct: the struct of a single record
+    :type struct: _SupportsUnpack[_OT] | type[_OT]
+    :param file: the file name or a seekable binary stream
+    :type file: str | os.PathLike[str] | IOBase
+    :param offsets: a pre-built index, defaults to None
+    :type offsets: array | None, optional
+    :param index_path: sidecar file of the index, defaults to None
+    :type index_path: str | os.PathLike[str] | None, optional
+    """
+
+    def __init__(
+        self,
+        struct: _SupportsUnpack[_OT] | type[_OT],
+        file: str | os.PathLike[str] | IOBase,
+        /,
+        *,
+        offsets: array | None = None,
+        index_path: str | os.PathLike[str] | None = None,
+        start: int = 0,
+        order: _EndianLike | None = None,
+        arch: _ArchLike | None = None,
+        **kwds: Any,
+    ) -> None:
+        self.struct: _SupportsUnpack[_OT] = (
+            getstruct(struct) if hasstruct(struct) else struct  # pyright: ignore[reportAttributeAccessIssue]
+        )
+        self.stream, self._owned = _open_stream(file)
+        self.order: _EndianLike | None = order
+        self.arch: _ArchLike | None = arch
+        self.kwds: dict[str, Any] = kwds
+        if offsets is None:
+            if index_path is not None and os.path.exists(index_path):
+                offsets = load_index(index_path)
+            else:
+                offsets = index(
+                    self.struct, self.stream, start=start, order=order, arch=arch, **kwds
+                )
+                if index_path is not None:
+                    save_index(offsets, index_path)
+
+        self.offsets: array = offsets
+        self._end: int = self.stream.seek(0, SEEK_END)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying stream if it was opened by this object."""
+        if self._owned:
+            self.stream.close()
+
+    def read_raw(self, position: int) -> bytes:
+        """Returns the raw bytes of the record at the given position.
+
+        :param position: the record index
+        :type position: int
+        :return: the raw record data
+        :rtype: bytes
+        """
+        offsets = self.offsets
+        count = len(offsets)
+        if position < 0:
+            position += count
+        if not 0 <= position < count:
+            raise IndexError("record index out of range")
+
+        start = offsets[position]
+        end = offsets[position + 1] if position + 1 < count else self._end
+        _ = self.stream.seek(start)
+        return self.stream.read(end - start)
+
+    @overload
+    def __getitem__(self, key: int) -> _OT: ...
+    @overload
+    def __getitem__(self, key: slice) -> list[_OT]: ...
+    def __getitem__(self, key: int | slice) -> _OT | list[_OT]:
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self.offsets)))]
+
+        offsets = self.offsets
+        position = key + len(offsets) if key < 0 else key
+        if not 0 <= position < len(offsets):
+            raise IndexError("record index out of range")
+
+        _ = self.stream.seek(offsets[position])
+        return unpack(
+            self.struct,
+            self.stream,
+            order=self.order,
+            arch=self.arch,
+            **self.kwds,
+        )
+
+    def __iter__(self) -> Iterator[_OT]:
+        for i in range(len(self.offsets)):
+            yield self[i]
+
+    def chunks(self, size: int) -> Iterator[range]:
+        """Splits all records into consecutive ranges of at most *size* records.
+
+        Each range can be processed independently (e.g. by a worker that opens
+        its own :class:`RecordFile` with the same *offsets*).
+
+        :param size: the maximum number of records per chunk
+        :type size: int
+        :return: an iterator over record index ranges
+        :rtype: Iterator[range]
+        """
+        if size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {size}")
+
+        count = len(self.offsets)
+        for begin in range(0, count, size):
+            yield range(begin, min(begin + size, count))
@@ -14,6 +14,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # pyright: reportAny=false, reportExplicitAny=false, reportPrivateUsage=false
 import inspect
+import keyword
 import dataclasses as dc
 
 from io import BytesIO
@@ -36,6 +37,7 @@ from caterpillar.options import (
     S_UNION,
     S_ADD_BYTES,
     S_SLOTS,
+    S_FAST_INIT,
     GLOBAL_STRUCT_OPTIONS,
     GLOBAL_UNION_OPTIONS,
 )
@@ -73,7 +75,12 @@ class Struct(Sequence[type[_ModelT], _ModelT, _ModelT]):
     # An internal field that maps the field names of all class attributes to their
     # corresponding struct fields.
 
-    __slots__: tuple[str, ...] = ("kw_only", "_union_hook", "_hidden_field_names")
+    __slots__: tuple[str, ...] = (
+        "kw_only",
+        "_union_hook",
+        "_hidden_field_names",
+        "_fast_init",
+    )
 
     def __init__(
         self,
@@ -89,6 +96,8 @@ class Struct(Sequence[type[_ModelT], _ModelT, _ModelT]):
         # Cache of init=False field names (e.g. via Invisible); computed lazily
         # on first unpack and invalidated whenever the model layout changes.
         self._hidden_field_names: frozenset[str] | None = None
+        # Instance factory for S_FAST_INIT; False until created by unpack_one()
+        self._fast_init: Callable[[Any], _ModelT] | bool | None = False
         options = set(options or [])
         options.update(
             GLOBAL_UNION_OPTIONS if S_UNION in options else GLOBAL_STRUCT_OPTIONS
@@ -179,8 +188,31 @@ class Struct(Sequence[type[_ModelT], _ModelT, _ModelT]):
         return names
 
     @override
-    def unpack_one(self, context: _ContextLike) -> _ModelT:
-        data = super().unpack_one(context)
+    def finalize(self) -> None:
+        super().finalize()
+        self._fast_init = False
+
+    def _create_fast_init(self) -> Callable[[Any], _ModelT] | None:
+        if not self.has_option(S_FAST_INIT) or self.is_union:
+            return None
+        names = [
+            member.name
+            for member in self.fields
+            if not member.is_action and member.include
+        ]
+        return _fast_init_factory(self.model, names)
+
+    @override
+    def _create_object(self, data: _ContextLike, context: _ContextLike) -> _ModelT:
+        if self._is_tuple_mode(context):
+            return self._make_tuple(data)
+        # fast_init reads the model fields only, the object context is
+        # never modified
+        fast_init = self._fast_init
+        if fast_init is False:
+            fast_init = self._fast_init = self._create_fast_init()
+        if fast_init:
+            return fast_init(data)
         # Fields declared with init=False (e.g. via Invisible) are part of the
         # struct layout but are not parameters of the generated __init__. Their
         # parsed values must be assigned after construction instead of being
@@ -188,10 +220,13 @@ class Struct(Sequence[type[_ModelT], _ModelT, _ModelT]):
         hidden = self._hidden_field_names
         if hidden is None:
             hidden = self._compute_hidden_field_names()
-        if not hidden:
+        if not hidden and not self._has_excluded:
             return self.model(**data)
-        init_kwargs = {k: v for k, v in data.items() if k not in hidden}
-        obj = self.model(**init_kwargs)
+        # The object context is never modified, only the constructor
+        # arguments are selected from it.
+        obj = self.model(
+            **{name: data[name] for name in self._model_names if name not in hidden}
+        )
         for name in hidden:
             if name in data:
                 setattr(obj, name, data[name])
@@ -229,6 +264,27 @@ class _StructTypeConverter(registry.TypeConverter):
 registry.annotation_registry.append(_StructTypeConverter())
 
 
+def _fast_init_factory(model: type[_ModelT], names: list[str]) -> Callable[[Any], _ModelT]:
+    # Generates a function that builds a model instance from the unpacked
+    # data without calling __init__. A custom __setattr__ (e.g. of frozen
+    # dataclasses) is bypassed.
+    direct = model.__setattr__ is object.__setattr__
+    lines = ["def fast_init(data):", "    obj = _new(_cls)"]
+    for name in names:
+        if not direct or not name.isidentifier() or keyword.iskeyword(name):
+            lines.append(f"    _setattr(obj, {name!r}, data[{name!r}])")
+        else:
+            lines.append(f"    obj.{name} = data[{name!r}]")
+    lines.append("    return obj")
+    namespace: dict[str, Any] = {
+        "_new": object.__new__,
+        "_cls": model,
+        "_setattr": object.__setattr__,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["fast_init"]
+
+
 def _struct_bytes(model: Struct[_ModelT]) -> Callable[[_ModelT], bytes]:
     def to_bytes(self: _ModelT) -> bytes:
         return pack(self, model)
@@ -710,6 +766,111 @@ class UnionHook(Generic[_ModelT]):
             stream.seek(0)  # pyright: ignore[reportUnusedCallResult]
 
 
+class BufferedUnionHook(UnionHook[_ModelT]):
+    """Union hook backed by a single shared buffer of :attr:`~UnionHook.max_size` bytes.
+
+    In contrast to the default :class:`UnionHook`, an assignment only encodes
+    the new value into the buffer (at offset zero) and invalidates all other
+    members. They are decoded lazily on their next attribute read and cached
+    until the next assignment. Bytes not covered by the assigned member are
+    preserved, just like in a C union.
+
+    The buffer is created on the first assignment after construction. If the
+    largest member already stores a value, it is used to seed the buffer.
+
+    >>> @union(hook_cls=BufferedUnionHook)
+    ... class Value:
+    ...     number: uint32_t
+    ...     raw: f[bytes, Bytes(4)]
+    ...
+    >>> obj = Value()
+    >>> obj.number = 0x01020304
+    >>> obj.raw
+    b'\\x04\\x03\\x02\\x01'
+
+    .. note::
+        Lazy member views store their state in the instance dictionary and
+        therefore can't be combined with :data:`~caterpillar.options.S_SLOTS`.
+
+    .. versionadded:: 2.8.2
+    """
+
+    def __init__(self, struct_: Struct[_ModelT]) -> None:
+        super().__init__(struct_)
+        if struct_.has_option(S_SLOTS):
+            raise InvalidValueError(
+                "BufferedUnionHook does not support unions with slots enabled"
+            )
+
+        model = struct_.model
+        members = struct_._members
+        # The largest member covers the whole buffer and is therefore used
+        # to seed it.
+        self._largest_: str | None = max(
+            members, key=lambda name: sizeof(members[name]), default=None
+        )
+        # Class-level defaults would shadow invalidated members, so they have
+        # to be removed. The generated constructor still knows about them.
+        for name in members:
+            if name in vars(model):
+                delattr(model, name)
+        setattr(model, "__getattr__", _union_getattr(self))
+
+    def get_buffer(self, obj: _ModelT) -> bytearray | None:
+        """Returns the shared buffer of the given union object (if any).
+
+        :param obj: the union object
+        :type obj: _ModelT
+        :return: the shared buffer or *None* if no member was assigned yet
+        :rtype: bytearray | None
+        """
+        return vars(obj).get("_union_buffer_")
+
+    def __model_getattr__(self, obj: _ModelT, key: str) -> Any:
+        # Only called if the attribute is not present in the instance
+        # dictionary, i.e. the member was invalidated by an assignment.
+        state = vars(obj)
+        buffer = state.get("_union_buffer_")
+        field = self.struct._members.get(key)
+        if buffer is None or field is None:
+            raise AttributeError(
+                f"{type(obj).__name__!r} object has no attribute {key!r}"
+            )
+
+        value = state[key] = unpack(field, buffer)
+        return value
+
+    @override
+    def __model_setattr__(self, obj: _ModelT, key: str, new_value: Any) -> None:
+        members = self.struct._members
+        if self._processing_ or key not in members:
+            object.__setattr__(obj, key, new_value)
+            return
+
+        with self:
+            self.refresh(obj, key, new_value, members)
+
+    @override
+    def refresh(
+        self, obj: _ModelT, key: str, new_value: Any, members: dict[str, Field]
+    ) -> None:
+        state = vars(obj)
+        buffer: bytearray | None = state.get("_union_buffer_")
+        if buffer is None:
+            buffer = state["_union_buffer_"] = bytearray(self.max_size)
+            seed = state.get(self._largest_) if self._largest_ != key else None
+            if seed is not None:
+                data = pack(seed, members[self._largest_])  # pyright: ignore[reportArgumentType]
+                buffer[: len(data)] = data
+
+        data = pack(new_value, members[key])
+        buffer[: len(data)] = data
+        # Invalidate all other members, they will be decoded on access
+        for name in members:
+            state.pop(name, None)
+        state[key] = new_value
+
+
 def _union_init(hook: UnionHook[_ModelT]) -> Callable[..., None]:
     # wrapper function to capture the calling instance
     def init(self: _ModelT, *args: P.args, **kwargs: P.kwargs) -> None:
@@ -726,6 +887,14 @@ def _union_setattr(hook: UnionHook[_ModelT]) -> Callable[..., None]:
     return setattribute
 
 
+def _union_getattr(hook: BufferedUnionHook[_ModelT]) -> Callable[..., Any]:
+    # wrapper function to capture the calling instance
+    def getattribute(self: _ModelT, key: str) -> Any:
+        return hook.__model_getattr__(self, key)
+
+    return getattribute
+
+
 @overload
 @dataclass_transform(field_specifiers=(dc.field, Invisible))
 def union(
@@ -18,6 +18,7 @@ import inspect
 import types
 import dataclasses
 from types import ModuleType
+from weakref import WeakValueDictionary
 from typing import Any, Callable, TypeVar, overload
 from typing_extensions import override
 
@@ -220,6 +221,25 @@ def get_mangled_name(model_ty: type, annotations: dict[str, Any]) -> str:
     return f"_{hex_name}{ty_name}"
 
 
+_DERIVE_CACHE: "WeakValueDictionary[tuple[Any, ...], type]" = WeakValueDictionary()
+"""
+Global cache of derived classes, keyed by the template class, the given type
+arguments and the derivation options. Entries are removed once the derived
+class is no longer referenced.
+"""
+
+
+def clear_derive_cache() -> None:
+    """Removes all classes cached by :func:`derive`.
+
+    Derived structs capture the global struct options at the time they were
+    created. Call this function after changing them to derive fresh classes.
+
+    .. versionadded:: 2.8.2
+    """
+    _DERIVE_CACHE.clear()
+
+
 def derive(
     template_ty: type,
     *tys_args: _StructLike,
@@ -238,7 +258,35 @@ def derive(
     :type name: str | Ellipsis, optional
     :return: the derived type
     :rtype: type
+
+    .. versionchanged:: 2.8.2
+        Derived classes are cached by template, type arguments and options.
+        Repeated derivations return the same class, even from other modules
+        (the class keeps the module of its first derivation, see
+        :func:`clear_derive_cache`). Inferred names (:code:`...`) are not cached.
     """
+    key = cached = None
+    if not isinstance(name, _GreedyType):
+        # inferred names depend on the calling line and are not cached
+        try:
+            key = (
+                template_ty,
+                tys_args,
+                frozenset(tys_kwargs.items()),
+                partial,
+                name,
+                union,
+            )
+            cached = _DERIVE_CACHE.get(key)
+        except TypeError:
+            # unhashable type arguments can't be cached
+            key = None
+    if cached is not None:
+        return cached
+
+    # The caller is resolved on a cache miss only
+    module = get_caller_module(2)
+
     if len(tys_args) == 0 and len(tys_kwargs) == 0:
         raise ValueError(
             (
@@ -284,7 +332,6 @@ def derive(
 
     # IF the target module already stores the new type, then return it
     # directly
-    module = get_caller_module(2)
     new_ty = getattr(sys.modules[module], name, None)
     if new_ty is None:
         bases = list(template_ty.__bases__)
@@ -335,4 +382,6 @@ def derive(
             elif name in info.positional_tys:
                 new_info.positional_tys[name] = replacement
         setattr(new_ty, ATTR_TEMPLATE, new_info)
+    if key is not None:
+        _DERIVE_CACHE[key] = new_ty
     return new_ty
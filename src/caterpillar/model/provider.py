@@ -17,6 +17,7 @@ from tempfile import TemporaryFile
 from io import BytesIO, IOBase
 from collections import OrderedDict
 from shutil import copyfileobj
+from collections.abc import Iterable
 from typing import Any
 from typing_extensions import (
     overload,
@@ -30,11 +31,22 @@ from caterpillar.byteorder import (
     system_arch,
 )
 from caterpillar.shared import ATTR_PACK, getstruct, hasstruct
-from caterpillar.context import O_CONTEXT_FACTORY, CTX_STREAM, Context
-from caterpillar.exception import DynamicSizeError
+from caterpillar.context import (
+    O_CONTEXT_FACTORY,
+    CTX_ARCH,
+    CTX_ORDER,
+    CTX_STREAM,
+    CTX_PROJECTION,
+    CTX_TUPLE,
+    Context,
+)
+from caterpillar.exception import DynamicSizeError, StructException, error_context
+from caterpillar.stream import ReadAheadStream
 from caterpillar.shared import MODE_PACK, MODE_UNPACK
+from caterpillar._common import skip_struct
 from caterpillar.abc import (
     _ContainsStruct,
+    _ContextLike,
     _OT,
     _IT,
     _SupportsPack,
@@ -303,66 +315,58 @@ def pack_into(
             + "no __pack__ defined!"
         )
 
-    prev_order = O_DEFAULT_ENDIAN.value
-    prev_arch = O_DEFAULT_ARCH.value
-    if order:
-        O_DEFAULT_ENDIAN.value = order
-    if arch:
-        O_DEFAULT_ARCH.value = prev_arch
-    try:
-        start: int = 0
-        fill_pat: bytes = b"\x00"
-        match fill:
-            case str():
-                fill_pat = fill.encode()
-            case bytes():
-                fill_pat = bytes(fill)
-            case int():
-                fill_pat = bytes([fill])
-            case None:
-                fill_pat = b"\x00"
-            case _:
-                raise TypeError("Invalid fill type!")
-
-        if use_tempfile:
-            # NOTE: this implementation is exprimental - use this option with caution.
-            stream = TemporaryFile()
-
+    # The byteorder and architecture of this call are read from the root
+    # context, global options are left untouched.
+    start: int = 0
+    fill_pat: bytes = b"\x00"
+    match fill:
+        case str():
+            fill_pat = fill.encode()
+        case bytes():
+            fill_pat = bytes(fill)
+        case int():
+            fill_pat = bytes([fill])
+        case None:
+            fill_pat = b"\x00"
+        case _:
+            raise TypeError("Invalid fill type!")
+
+    if use_tempfile:
+        # NOTE: this implementation is exprimental - use this option with caution.
+        stream = TemporaryFile()
+
+    else:
+        # Default implementation: We use an in-memory buffer to store all packed
+        # elements and then apply all offset-packed objects.
+        stream = BytesIO()
+
+    with stream: # <-- closes tempfile automatically
+        context[CTX_STREAM] = stream
+        struct.__pack__(obj, context) # pyright: ignore
+
+        _buf_data = bytearray()
+        _ = stream.seek(0)
+        if len(offsets) != 0:
+            for offset, value in offsets.items():
+                _ = stream.seek(start)
+                content_data = stream.read(offset - start)
+
+                buffer.write(content_data)
+                # adjust filler automatically
+                start += len(content_data)
+                if start < offset:
+                    pad_length = offset - start
+                    if pad_length % len(fill_pat) != 0:
+                        raise ValueError(f"invalid pattern length. Fill pattern does not fit into {pad_length} bytes")
+
+                    count: int = pad_length // len(fill_pat)
+                    buffer.write(fill_pat * count)
+                    start += pad_length
+
+                buffer.write(value)
+                start += len(value)
         else:
-            # Default implementation: We use an in-memory buffer to store all packed
-            # elements and then apply all offset-packed objects.
-            stream = BytesIO()
-
-        with stream: # <-- closes tempfile automatically
-            context[CTX_STREAM] = stream
-            struct.__pack__(obj, context) # pyright: ignore
-
-            _buf_data = bytearray()
-            _ = stream.seek(0)
-            if len(offsets) != 0:
-                for offset, value in offsets.items():
-                    _ = stream.seek(start)
-                    content_data = stream.read(offset - start)
-
-                    buffer.write(content_data)
-                    # adjust filler automatically
-                    start += len(content_data)
-                    if start < offset:
-                        pad_length = offset - start
-                        if pad_length % len(fill_pat) != 0:
-                            raise ValueError(f"invalid pattern length. Fill pattern does not fit into {pad_length} bytes")
-
-                        count: int = pad_length // len(fill_pat)
-                        buffer.write(fill_pat * count)
-                        start += pad_length
-
-                    buffer.write(value)
-                    start += len(value)
-            else:
-                copyfileobj(stream, buffer)
-    finally:
-        O_DEFAULT_ENDIAN.value = prev_order
-        O_DEFAULT_ARCH.value = prev_arch
+            copyfileobj(stream, buffer)
 
 
 @overload
@@ -489,6 +493,8 @@ def unpack(
     as_field: bool = False,
     order: _EndianLike | None = None,
     arch: _ArchLike | None = None,
+    fields: Iterable[str] | None = None,
+    as_tuple: bool = False,
     **kwds: Any,
 ) -> _OT: ...
 @overload
@@ -500,6 +506,8 @@ def unpack(
     as_field: bool = False,
     order: _EndianLike | None = None,
     arch: _ArchLike | None = None,
+    fields: Iterable[str] | None = None,
+    as_tuple: bool = False,
     **kwds: Any,
 ) -> _OT: ...
 @overload
@@ -511,6 +519,8 @@ def unpack(
     as_field: bool = False,
     order: _EndianLike | None = None,
     arch: _ArchLike | None = None,
+    fields: Iterable[str] | None = None,
+    as_tuple: bool = False,
     **kwds: Any,
 ) -> _OT: ...
 def unpack(
@@ -520,6 +530,8 @@ def unpack(
     as_field: bool = False,
     order: _EndianLike | None = None,
     arch: _ArchLike | None = None,
+    fields: Iterable[str] | None = None,
+    as_tuple: bool = False,
     **kwds: Any,
 ) -> _OT:
     """
@@ -529,7 +541,9 @@ def unpack(
     a `buffer` (either bytes or a stream) containing the serialized data, and
     returns the unpacked object. If `as_field` is set to True, the `struct` is
     wrapped by a `Field`. Additional keyword arguments are passed to the root
-    context as attributes.
+    context as attributes. Non-seekable streams without :code:`peek()` are
+    wrapped by a :class:`~caterpillar.stream.ReadAheadStream` that reads only the
+    requested bytes.
 
     Example:
 
@@ -541,15 +555,33 @@ def unpack(
     :param struct: The struct to use for unpacking (could be a `SupportsUnpack` or `ContainsStruct` object).
     :param buffer: The bytes buffer or stream to unpack from.
     :param as_field: Whether to wrap the struct in a `Field` transformer before unpacking.
+    :param fields: Dotted paths of the fields to unpack (e.g. ``"header.type"``). All
+        other fields that aren't required to parse the selected ones are skipped
+        and set to :code:`None`.
+    :param as_tuple: Whether to unpack all structs as named tuples and all arrays as
+        tuples (see :attr:`~caterpillar.context.CTX_TUPLE`). A global
+        :attr:`~caterpillar.options.O_ARRAY_FACTORY` takes precedence.
     :param kwds: Additional keyword arguments to pass to the unpack function.
 
     :return: The unpacked object, which is the result of calling `struct.__unpack__(context)`.
 
+    .. versionchanged:: 2.8.2
+        Added the *fields* parameter for projected unpacking and the *as_tuple*
+        parameter.
+
     :raises TypeError: If the `struct` is not a valid struct instance.
     """
     # fmt: off
     # prepare the data stream
-    stream = buffer if isinstance(buffer, IOBase) else BytesIO(buffer)
+    if not isinstance(buffer, IOBase):
+        stream = BytesIO(buffer)
+    elif not buffer.seekable() and not hasattr(buffer, "peek"):
+        # Raw pipes and sockets get a seekable window, so that fields relying
+        # on tell() and seek() keep working. Buffered readers are used as they
+        # are, because data read ahead would be lost for the caller.
+        stream = ReadAheadStream(buffer, exact=True)  # pyright: ignore[reportArgumentType]
+    else:
+        stream = buffer
     context = (O_CONTEXT_FACTORY.value or Context)(
         _path="<root>",
         _parent=None,
@@ -561,6 +593,10 @@ def unpack(
         mode=MODE_UNPACK,
         **kwds,
     )
+    if fields is not None:
+        context[CTX_PROJECTION] = frozenset(fields)
+    if as_tuple:
+        context[CTX_TUPLE] = True
     if as_field:
         from caterpillar.fields import Field
         struct = Field(struct)  # pyright: ignore[reportArgumentType]
@@ -570,18 +606,73 @@ def unpack(
     if not isinstance(struct, _SupportsUnpack):
         raise TypeError(f"{type(struct).__name__} is not a valid struct instance!")
 
-    prev_order = O_DEFAULT_ENDIAN.value
-    prev_arch = O_DEFAULT_ARCH.value
-    if order:
-        O_DEFAULT_ENDIAN.value = order
-    if arch:
-        O_DEFAULT_ARCH.value = arch
-
+    # The byteorder, architecture and tuple mode of this call are read from
+    # the root context, global options are left untouched.
     try:
         return struct.__unpack__(context)
-    finally:
-        O_DEFAULT_ARCH.value = prev_arch
-        O_DEFAULT_ENDIAN.value = prev_order
+    except StructException:
+        raise
+    except Exception as exc:
+        # Errors are wrapped only once at this boundary. The context of the
+        # failing field is recorded by the field itself, errors of a
+        # top-level struct are propagated as is.
+        from caterpillar.fields import Field
+        error_ctx = error_context(exc, context)
+        if error_ctx is context and not isinstance(struct, Field):
+            raise
+        raise StructException(str(exc), error_ctx) from exc
+
+
+class _Skip:
+    # Adapter that runs a skip pass through unpack() and returns the
+    # number of skipped bytes.
+    __slots__: tuple[str] = ("struct",)
+
+    def __init__(self, struct: object) -> None:
+        self.struct: object = struct
+
+    def __unpack__(self, context: _ContextLike) -> int:
+        stream: _StreamType = context[CTX_STREAM]
+        start = stream.tell()
+        skip_struct(self.struct, context)
+        return stream.tell() - start
+
+
+def skip(
+    struct: type | _SupportsUnpack[Any] | _ContainsStruct[Any, Any],
+    buffer: Buffer | _StreamType,
+    /,
+    as_field: bool = False,
+    order: _EndianLike | None = None,
+    arch: _ArchLike | None = None,
+    **kwds: Any,
+) -> int:
+    """
+    Advance a stream past one instance of the given struct without building it.
+
+    Structs implementing :code:`__skip__` skip their data directly, all others
+    are unpacked and the result is discarded. The arguments are the same as
+    for :func:`unpack`.
+
+    >>> stream = BytesIO(data)
+    >>> skip(Header, stream)   # position is now after the header
+    12
+
+    .. versionadded:: 2.8.2
+
+    :param struct: The struct to skip.
+    :param buffer: The bytes buffer or stream to skip in.
+    :param as_field: Whether to wrap the struct in a `Field` before skipping.
+    :param kwds: Additional keyword arguments to pass to the root context.
+
+    :return: The number of skipped bytes.
+    """
+    if as_field:
+        from caterpillar.fields import Field
+        struct = Field(struct)  # pyright: ignore[reportArgumentType]
+    elif hasstruct(struct):
+        struct = getstruct(struct)
+    return unpack(_Skip(struct), buffer, order=order, arch=arch, **kwds)
 
 
 @overload
@@ -641,12 +732,38 @@ def unpack_file(
 
 
 @overload
-def sizeof(obj: _SupportsSize, **kwds: Any) -> int: ...
+def sizeof(
+    obj: _SupportsSize,
+    order: _EndianLike | None = None,
+    arch: _ArchLike | None = None,
+    **kwds: Any,
+) -> int: ...
 @overload
-def sizeof(obj: _ContainsStruct, **kwds: Any) -> int: ...
+def sizeof(
+    obj: _ContainsStruct,
+    order: _EndianLike | None = None,
+    arch: _ArchLike | None = None,
+    **kwds: Any,
+) -> int: ...
 @overload
-def sizeof(obj: type, **kwds: Any) -> int: ...
-def sizeof(obj: _SupportsSize | _ContainsStruct | type, **kwds: Any) -> int:
+def sizeof(
+    obj: type,
+    order: _EndianLike | None = None,
+    arch: _ArchLike | None = None,
+    **kwds: Any,
+) -> int: ...
+def sizeof(
+    obj: _SupportsSize | _ContainsStruct | type,
+    order: _EndianLike | None = None,
+    arch: _ArchLike | None = None,
+    **kwds: Any,
+) -> int:
+    # order and arch are applied like in pack() and unpack(), e.g. the size
+    # of pointers depends on the architecture
+    if order is not None:
+        kwds[CTX_ORDER] = order
+    if arch is not None:
+        kwds[CTX_ARCH] = arch
     context = (O_CONTEXT_FACTORY.value or Context)(_parent=None, _path="<root>", **kwds)
     struct_ = obj
     if hasstruct(struct_):
@@ -14,6 +14,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # pyright: reportPrivateUsage=false
 from dataclasses import dataclass
+from collections.abc import Callable, Iterable
 from typing import Generic
 from typing_extensions import Final, override
 
@@ -37,6 +38,14 @@ class Flag(Generic[_VT]):
         self.value = value
         self._hash_: int = hash(name)
 
+    @override
+    def __setattr__(self, name: str, value: object, /) -> None:
+        # Changing the value of a flag may change state that fields have
+        # frozen (e.g. the default byteorder), so it must be invalidated.
+        if name == "value" and value is not self.__dict__.get(name, value):
+            invalidate_options()
+        object.__setattr__(self, name, value)
+
     @override
     def __hash__(self) -> int:
         """
@@ -52,17 +61,84 @@ class Flag(Generic[_VT]):
         return getattr(value, "name", None) == self.name  # pyright: ignore[reportAny]
 
 
+_OPTIONS_EPOCH: int = 0
+"""
+Generation counter of global options. Fields freeze option-derived state
+together with the epoch it was resolved in and re-resolve it once the
+epoch changed.
+"""
+
+
+def invalidate_options() -> None:
+    """
+    Invalidate all state that fields have frozen from global options.
+
+    This function is called automatically when the value of a :class:`Flag`
+    changes or when one of the global option sets is modified, either
+    through :func:`configure` or directly (e.g. :code:`GLOBAL_FIELD_FLAGS.add(...)`).
+
+    .. versionadded:: 2.8.2
+    """
+    global _OPTIONS_EPOCH
+    _OPTIONS_EPOCH += 1
+
+
+class _OptionSet(set[_OptionLike]):
+    # A set of options that reports every in-place change, so that state
+    # frozen from it (e.g. specialized callables) is never used stale.
+    __slots__: tuple[str] = ("_on_change",)
+
+    def __init__(
+        self,
+        iterable: Iterable[_OptionLike] = (),
+        on_change: Callable[[], None] = invalidate_options,
+    ) -> None:
+        super().__init__(iterable)
+        self._on_change: Callable[[], None] = on_change
+
+
+def _notify(name: str) -> Callable[..., object]:
+    method = getattr(set, name)
+
+    def mutate(self: _OptionSet, *args: object) -> object:
+        result = method(self, *args)
+        self._on_change()
+        return result
+
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in (
+    "add",
+    "clear",
+    "discard",
+    "pop",
+    "remove",
+    "update",
+    "difference_update",
+    "intersection_update",
+    "symmetric_difference_update",
+    "__ior__",
+    "__iand__",
+    "__isub__",
+    "__ixor__",
+):
+    setattr(_OptionSet, _name, _notify(_name))
+del _name
+
+
 #: Defaults that will be applied to **all** structs.
-GLOBAL_STRUCT_OPTIONS: set[_OptionLike] = set()
+GLOBAL_STRUCT_OPTIONS: set[_OptionLike] = _OptionSet()
 
 #: Defaults that will be applied on **all** unions.
-GLOBAL_UNION_OPTIONS: set[_OptionLike] = set()
+GLOBAL_UNION_OPTIONS: set[_OptionLike] = _OptionSet()
 
 #: Default field flags that will be applied on **all** fields.
-GLOBAL_FIELD_FLAGS: set[_OptionLike] = set()
+GLOBAL_FIELD_FLAGS: set[_OptionLike] = _OptionSet()
 
 #: Default field flags that will be applied on **all** bit-fields.
-GLOBAL_BITFIELD_FLAGS: set[_OptionLike] = set()
+GLOBAL_BITFIELD_FLAGS: set[_OptionLike] = _OptionSet()
 
 
 def configure(base: set[_OptionLike], *flags: _OptionLike) -> None:
@@ -73,6 +149,7 @@ def configure(base: set[_OptionLike], *flags: _OptionLike) -> None:
     :param flags: Additional flags to be added.
     """
     base.update(flags)
+    invalidate_options()
 
 
 def set_struct_flags(*flags: _OptionLike, with_union: bool = False) -> None:
@@ -225,6 +302,27 @@ S_UNION: Final[Flag] = Flag("struct.union")
 S_ADD_BYTES: Final[Flag] = Flag("struct.bytes_method")
 S_DISCARD_CONST: Final[Flag] = Flag("struct.discard_const")
 
+S_TUPLE_MODEL: Final[Flag] = Flag("struct.tuple_model")
+"""
+Unpacks instances as named tuples instead of model objects. The tuple type is
+generated once per struct from its field names (invalid names are replaced by
+their position, see :func:`collections.namedtuple`) and named after the model
+with a ``Tuple`` suffix. The result is not an instance of the model class.
+Tuples are immutable and can't be packed by structs that expect a dictionary.
+
+.. versionadded:: 2.8.2
+"""
+
+S_FAST_INIT: Final[Flag] = Flag("struct.fast_init")
+"""
+Creates unpacked instances without calling the generated :code:`__init__`.
+Parsed values are assigned directly, therefore :code:`__post_init__` is not
+called and defaults of attributes that are not part of the struct are not
+applied. Unions ignore this option.
+
+.. versionadded:: 2.8.2
+"""
+
 # for fields
 F_KEEP_POSITION: Final[Flag] = Flag("field.keep_position")
 """
@@ -270,6 +368,15 @@ leading to significant memory savings. The following table demonstrates the memo
 footprint of unpacked objects under different configurations:
 """
 
+O_TUPLE_MODEL: Flag[bool] = Flag("option.tuple_model", value=False)
+"""
+Unpacks all structs, sequences and bit-fields as named tuples (see
+:attr:`S_TUPLE_MODEL`). Use :code:`unpack(..., as_tuple=True)` to enable the
+same mode for a single call only.
+
+.. versionadded:: 2.8.2
+"""
+
 # bitfield options
 B_OVERWRITE_ALIGNMENT: Final[Flag] = Flag("bitfield.overwrite_alignment")
 """
@@ -0,0 +1,313 @@
+# Copyright (C) MatrixEditor 2023-2026
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# pyright: reportPrivateUsage=false, reportAny=false, reportExplicitAny=false
+import re
+
+from threading import get_ident
+from dataclasses import dataclass
+from time import perf_counter
+from types import TracebackType
+from typing import Any, Callable
+from typing_extensions import Self, override
+
+from caterpillar.abc import _ContextLike
+from caterpillar.context import CTX_FIELD, CTX_PATH, CTX_STREAM
+from caterpillar.options import Flag, invalidate_options
+
+
+@dataclass
+class ProfileEntry:
+    """Collected statistics for a single context path."""
+
+    path: str
+    """The normalized context path (sequence indices are replaced by ``[]``)."""
+
+    calls: int = 0
+    """Number of pack or unpack calls for this path."""
+
+    total_time: float = 0.0
+    """Cumulative time in seconds, including nested fields."""
+
+    own_time: float = 0.0
+    """Cumulative time in seconds, excluding nested fields."""
+
+    nbytes: int = 0
+    """Number of bytes consumed (unpack) or produced (pack)."""
+
+
+class Profiler:
+    """
+    Records per-path statistics of all pack and unpack operations while enabled.
+
+    Profiling works by replacing the pack and unpack methods of
+    :class:`~caterpillar.fields.Field` and :class:`~caterpillar.model.Sequence`
+    with instrumented versions once per session, i.e. when the profiler is
+    enabled and again when it is disabled. Hence, there is no overhead at all
+    as long as no profiler is active. Sequence elements share one entry,
+    because their index is removed from the recorded path.
+
+    >>> with profile() as p:
+    ...     obj = unpack(Format, data)
+    ...
+    >>> print(p.report(limit=10))
+
+    A profiler can also be enabled for all calls to
+    :func:`~caterpillar.model.pack` and :func:`~caterpillar.model.unpack` by
+    assigning it to :attr:`O_PROFILE`. The session lasts until the option is
+    reset.
+
+    Only one profiler can be active at a time. It records the calls of the
+    thread that enabled it, other threads run the original methods.
+    """
+
+    def __init__(self) -> None:
+        self.entries: dict[str, ProfileEntry] = {}
+        self._stack: list[float] = []
+        self._depth: int = 0
+
+    def enable(self) -> None:
+        """
+        Activates this profiler. Calls may be nested.
+
+        :raises RuntimeError: If another profiler is already active.
+        """
+        if self._depth == 0:
+            _install(self)
+        self._depth += 1
+
+    def disable(self) -> None:
+        """Deactivates this profiler once all nested activations have ended."""
+        if self._depth == 0:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            _uninstall(self)
+
+    def reset(self) -> None:
+        """Removes all collected statistics."""
+        self.entries.clear()
+
+    def __enter__(self) -> Self:
+        self.enable()
+        return self
+
+    def __exit__(
+        self, exc_type: type, exc_value: Exception, traceback: TracebackType
+    ) -> None:
+        self.disable()
+
+    def record(self, context: _ContextLike, func: Callable[[], Any]) -> Any:
+        """
+        Runs *func* and records its statistics for the current context path.
+
+        :param context: The current context.
+        :param func: The function that performs the actual operation.
+        :return: The result of *func*.
+        """
+        stream = context.get(CTX_STREAM)
+        try:
+            start_pos: int | None = stream.tell()  # pyright: ignore[reportOptionalMemberAccess]
+        except Exception:
+            start_pos = None
+
+        path = _INDEX_PATTERN.sub("[]", context.get(CTX_PATH) or "")
+        stack = self._stack
+        stack.append(0.0)
+        start = perf_counter()
+        try:
+            return func()
+        finally:
+            elapsed = perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+
+            entry = self.entries.get(path)
+            if entry is None:
+                entry = self.entries[path] = ProfileEntry(path)
+            entry.calls += 1
+            entry.total_time += elapsed
+            entry.own_time += elapsed - nested
+            if start_pos is not None:
+                try:
+                    entry.nbytes += stream.tell() - start_pos  # pyright: ignore[reportOptionalMemberAccess]
+                except Exception:
+                    pass
+
+    def sorted_entries(self, key: str = "total_time") -> list[ProfileEntry]:
+        """
+        Returns all entries sorted in descending order.
+
+        :param key: The attribute of :class:`ProfileEntry` to sort by.
+        :return: The sorted list of entries.
+        """
+        return sorted(
+            self.entries.values(), key=lambda entry: getattr(entry, key), reverse=True
+        )
+
+    def report(self, key: str = "total_time", limit: int | None = None) -> str:
+        """
+        Formats the collected statistics as a text table.
+
+        :param key: The attribute of :class:`ProfileEntry` to sort by.
+        :param limit: The maximum number of rows, defaults to all entries.
+        :return: The formatted table.
+        """
+        entries = self.sorted_entries(key)[:limit]
+        width = max([len(entry.path) for entry in entries] + [4])
+        lines = [
+            f"{'path':<{width}} {'calls':>10} {'total (ms)':>12} "
+            + f"{'own (ms)':>12} {'bytes':>12}"
+        ]
+        for entry in entries:
+            lines.append(
+                f"{entry.path:<{width}} {entry.calls:>10} "
+                + f"{entry.total_time * 1e3:>12.3f} {entry.own_time * 1e3:>12.3f} "
+                + f"{entry.nbytes:>12}"
+            )
+        return "\n".join(lines)
+
+    def flamegraph(self) -> str:
+        """
+        Exports the collected statistics in the *folded stacks* format.
+
+        Each line contains the path segments separated by ``;`` followed by
+        the exclusive time in microseconds. The output can be passed directly
+        to tools such as ``flamegraph.pl``, inferno or speedscope.
+
+        :return: The folded stack lines.
+        """
+        lines: list[str] = []
+        for entry in self.entries.values():
+            stack = ";".join(entry.path.split("."))
+            lines.append(f"{stack} {round(entry.own_time * 1e6)}")
+        return "\n".join(lines)
+
+
+class _ProfileFlag(Flag[Profiler]):
+    # Starts a profiling session when a profiler is assigned and ends it when
+    # the value is replaced, instead of enabling the profiler per call.
+    @override
+    def __setattr__(self, name: str, value: object, /) -> None:
+        if name == "value":
+            previous = self.__dict__.get(name)
+            if value is previous:
+                return
+            if previous is not None:
+                previous.disable()
+            if value is not None:
+                value.enable()  # pyright: ignore[reportAttributeAccessIssue]
+            # the (un)installation has invalidated all options already
+            object.__setattr__(self, name, value)
+            return
+        super().__setattr__(name, value)
+
+
+O_PROFILE: Flag[Profiler] = _ProfileFlag("option.profile", value=None)
+"""
+Profiler that is enabled for every call to :func:`~caterpillar.model.pack` and
+:func:`~caterpillar.model.unpack` while this option is set. It is installed once
+on assignment and removed again once the option is reset.
+
+>>> O_PROFILE.value = profiler = Profiler()
+>>> obj = unpack(Format, data)
+>>> O_PROFILE.value = None
+>>> print(profiler.report())
+"""
+
+
+def profile() -> Profiler:
+    """
+    Creates a new profiler to be used as a context manager.
+
+    >>> with profile() as p:
+    ...     obj = unpack(Format, data)
+    ...
+    >>> print(p.report())
+
+    :return: A new, inactive profiler.
+    """
+    return Profiler()
+
+
+# Sequence elements are stored as '<path>.<index>' in the context
+_INDEX_PATTERN = re.compile(r"\.\d+(?=\.|$)")
+
+_active: Profiler | None = None
+_originals: list[tuple[type, str, Any]] = []
+
+
+def _install(profiler: Profiler) -> None:
+    global _active
+    # pylint: disable-next=import-outside-toplevel
+    from caterpillar.fields._base import Field
+    # pylint: disable-next=import-outside-toplevel
+    from caterpillar.model._base import Sequence
+
+    if _active is not None:
+        raise RuntimeError("Another profiler is already active!")
+
+    _active = profiler
+    # Calls of other threads are not recorded, see Profiler
+    owner = get_ident()
+    field_unpack = Field.__unpack__
+    field_pack = Field.__pack__
+    seq_unpack = Sequence.__unpack__
+    seq_pack = Sequence.__pack__
+
+    def profiled_field_unpack(self: Any, context: _ContextLike) -> Any:
+        if get_ident() != owner:
+            return field_unpack(self, context)
+        return profiler.record(context, lambda: field_unpack(self, context))
+
+    def profiled_field_pack(self: Any, obj: Any, context: _ContextLike) -> None:
+        if get_ident() != owner:
+            return field_pack(self, obj, context)
+        return profiler.record(context, lambda: field_pack(self, obj, context))
+
+    # Structs nested in a field are already covered by the field itself, only
+    # the top-level struct is recorded here.
+    def profiled_seq_unpack(self: Any, context: _ContextLike) -> Any:
+        if context.get(CTX_FIELD) is not None or get_ident() != owner:
+            return seq_unpack(self, context)
+        return profiler.record(context, lambda: seq_unpack(self, context))
+
+    def profiled_seq_pack(self: Any, obj: Any, context: _ContextLike) -> None:
+        if context.get(CTX_FIELD) is not None or get_ident() != owner:
+            return seq_pack(self, obj, context)
+        return profiler.record(context, lambda: seq_pack(self, obj, context))
+
+    for cls, name, func in (
+        (Field, "__unpack__", profiled_field_unpack),
+        (Field, "__pack__", profiled_field_pack),
+        (Sequence, "__unpack__", profiled_seq_unpack),
+        (Sequence, "__pack__", profiled_seq_pack),
+    ):
+        _originals.append((cls, name, cls.__dict__[name]))
+        setattr(cls, name, func)
+    # finalized structs must pick up the instrumented methods
+    invalidate_options()
+
+
+def _uninstall(profiler: Profiler) -> None:
+    global _active
+    if _active is not profiler:
+        return
+
+    while _originals:
+        cls, name, func = _originals.pop()
+        setattr(cls, name, func)
+    _active = None
+    invalidate_options()
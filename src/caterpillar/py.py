@@ -66,11 +66,14 @@ from .context import (
     CTX_ARCH,
     CTX_ROOT,
     CTX_ORDER,
+    CTX_PROJECTION,
     ExprMixin,
     root,
     SetContextVar,
     O_CONTEXT_FACTORY,
     parentctx,
+    compile_expr,
+    expr_paths,
 )
 from .exception import (
     StructException,
@@ -84,6 +87,8 @@ from .exception import (
 )
 from .fields import *  # noqa
 from .model import *  # noqa
+from .stream import ReadAheadStream, DEFAULT_READAHEAD_SIZE
+from .profiler import Profiler, ProfileEntry, profile, O_PROFILE
 from .options import (
     Flag,
     F_SEQUENTIAL,
@@ -95,6 +100,8 @@ from .options import (
     set_union_flags,
     S_ADD_BYTES,
     S_DISCARD_CONST,
+    S_FAST_INIT,
+    S_TUPLE_MODEL,
     S_SLOTS,
     S_DISCARD_UNNAMED,
     S_REPLACE_TYPES,
@@ -107,14 +114,16 @@ from .options import (
     get_flag,
     get_flags,
     has_flag,
+    invalidate_options,
     O_ARRAY_FACTORY,
+    O_TUPLE_MODEL,
     B_GROUP_END,
     B_GROUP_KEEP,
     B_GROUP_NEW,
     B_NO_AUTO_BOOL,
     B_OVERWRITE_ALIGNMENT,
 )
-from ._common import WithoutContextVar, iseof, pack_seq, unpack_seq
+from ._common import WithoutContextVar, iseof, pack_seq, unpack_seq, stream_size
 from .shared import (
     ATTR_ACTION_PACK,
     ATTR_STRUCT,
@@ -133,6 +142,7 @@ from .shared import (
     constval,
     ATTR_PACK,
     ATTR_UNPACK,
+    ATTR_SKIP,
 )
 
 __all__ = [
@@ -201,16 +211,20 @@ __all__ = [
     "GLOBAL_STRUCT_OPTIONS",
     "GLOBAL_UNION_OPTIONS",
     "O_ARRAY_FACTORY",
+    "O_TUPLE_MODEL",
     "S_ADD_BYTES",
     "S_DISCARD_CONST",
     "S_DISCARD_UNNAMED",
     "S_EVAL_ANNOTATIONS",
+    "S_FAST_INIT",
+    "S_TUPLE_MODEL",
     "S_REPLACE_TYPES",
     "S_SLOTS",
     "S_UNION",
     "get_flag",
     "get_flags",
     "has_flag",
+    "invalidate_options",
     "set_field_flags",
     "set_struct_flags",
     "set_union_flags",
@@ -221,6 +235,7 @@ __all__ = [
     "ATTR_STRUCT",
     "Action",
     "iseof",
+    "stream_size",
     "pack_seq",
     "unpack_seq",
     "ATTR_ACTION_UNPACK",
@@ -239,13 +254,24 @@ __all__ = [
     "Struct",
     "struct",
     "UnionHook",
+    "BufferedUnionHook",
     "union",
     "unpack",
     "unpack_file",
+    "skip",
     "pack",
     "pack_into",
     "pack_file",
     "sizeof",
+    "index",
+    "save_index",
+    "load_index",
+    "RecordFile",
+    "FieldDependencies",
+    "field_dependencies",
+    "struct_dependencies",
+    "referenced_fields",
+    "unreferenced_fields",
     "Bitfield",
     "bitfield",
     "BitfieldGroup",
@@ -255,6 +281,7 @@ __all__ = [
     "template",
     "TemplateTypeVar",
     "derive",
+    "clear_derive_cache",
     "NewGroup",
     "EndGroup",
     "SetAlignment",
@@ -368,6 +395,7 @@ __all__ = [
     "Field",
     "INVALID_DEFAULT",
     "DEFAULT_OPTION",
+    "SwitchTable",
     "singleton",
     "FieldMixin",
     "FieldStruct",
@@ -394,6 +422,7 @@ __all__ = [
     "IOHook",
     "CTX_ROOT",
     "CTX_ORDER",
+    "CTX_PROJECTION",
     "root",
     "B_GROUP_END",
     "B_GROUP_KEEP",
@@ -408,9 +437,18 @@ __all__ = [
     "SetContextVar",
     "ATTR_PACK",
     "ATTR_UNPACK",
+    "ATTR_SKIP",
     "StructDefMixin",
     "AsLengthRef",
     "struct_factory",
     "parentctx",
     "bitfield_factory",
+    "compile_expr",
+    "expr_paths",
+    "ReadAheadStream",
+    "DEFAULT_READAHEAD_SIZE",
+    "Profiler",
+    "ProfileEntry",
+    "profile",
+    "O_PROFILE",
 ]
@@ -128,8 +128,89 @@ class TypeConverter:
         return f"<{self.__class__.__name__} for {self.target.__name__}>"
 
 
+class _Registry(list[TypeConverter]):
+    """
+    List of type converters that maintains a per-type index of the converter
+    to use. The index is reset whenever the list is modified.
+    """
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self._index: dict[type, _Plan] = {}
+
+    def _invalidate(self) -> None:
+        self._index.clear()
+
+    def _wrap(name: str) -> Any:  # pylint: disable=no-self-argument
+        method = getattr(list, name)
+
+        def mutate(self: "_Registry", *args: Any) -> Any:
+            result = method(self, *args)
+            self._invalidate()
+            return result
+
+        mutate.__name__ = name
+        return mutate
+
+    append = _wrap("append")
+    extend = _wrap("extend")
+    insert = _wrap("insert")
+    remove = _wrap("remove")
+    pop = _wrap("pop")
+    clear = _wrap("clear")
+    sort = _wrap("sort")
+    reverse = _wrap("reverse")
+    __setitem__ = _wrap("__setitem__")
+    __delitem__ = _wrap("__delitem__")
+    __iadd__ = _wrap("__iadd__")
+    __imul__ = _wrap("__imul__")
+    del _wrap
+
+    def plan(self, obj: object) -> "_Plan":
+        """Returns the (cached) lookup plan for the type of the given object."""
+        plan = self._index.get(type(obj))
+        if plan is None:
+            plan = _Plan.create(self, obj)
+            self._index[type(obj)] = plan
+        return plan
+
+
+class _Plan:
+    # Precomputed lookup for a single annotation type: converters with a custom
+    # 'matches' implementation must be checked per object, all others only
+    # depend on the type and are resolved once.
+    __slots__: tuple[str, ...] = ("is_struct", "candidates", "handler")
+
+    def __init__(
+        self,
+        is_struct: bool,
+        candidates: tuple[TypeConverter, ...],
+        handler: TypeConverter | None,
+    ) -> None:
+        self.is_struct: bool = is_struct
+        self.candidates: tuple[TypeConverter, ...] = candidates
+        self.handler: TypeConverter | None = handler
+
+    @staticmethod
+    def create(converters: list[TypeConverter], obj: object) -> "_Plan":
+        candidates: list[TypeConverter] = []
+        handler = None
+        for converter in converters:
+            if type(converter).matches is not TypeConverter.matches:
+                candidates.append(converter)
+            elif converter.matches(obj):
+                handler = converter
+                break
+        return _Plan(isinstance(obj, _StructLike), tuple(candidates), handler)
+
+
 #: A global registry to store type converters.
-annotation_registry: list[TypeConverter] = []
+#:
+#: .. versionchanged:: 2.8.2
+#:     The registry indexes converters by annotation type. Converters that
+#:     override :meth:`TypeConverter.matches` are still checked for every
+#:     annotation.
+annotation_registry: list[TypeConverter] = _Registry()
 
 
 def to_struct(obj: object, **kwargs: Any) -> _StructLike:  # pyright: ignore[reportAny]
@@ -138,6 +219,10 @@ def to_struct(obj: object, **kwargs: Any) -> _StructLike:  # pyright: ignore[rep
     This function will not convert any objects that are already
     implementing the functions of :code:`_StructLike`.
 
+    .. versionchanged:: 2.8.2
+        Converters are looked up through a per-type index. Classes used as
+        annotations are still matched against all converters.
+
     :param obj: The object to be converted.
     :type obj: Any
     :param kwargs: Additional arguments passed to the conversion handler.
@@ -145,15 +230,29 @@ def to_struct(obj: object, **kwargs: Any) -> _StructLike:  # pyright: ignore[rep
     :return: the converted object
     :rtype: _StructLike
     """
-
-    # If the object is already a structured-like instance, return it.
-    if isinstance(obj, _StructLike):
-        return obj
-
     global annotation_registry
 
-    # Find and use only the first registered converter that matches the object's type.
-    handler = next(filter(lambda x: x.matches(obj), annotation_registry), None)
+    handler = None
+    if isinstance(obj, type) or not isinstance(annotation_registry, _Registry):
+        # Classes share their type, so the result of a match depends on the
+        # class itself and cannot be indexed.
+        if isinstance(obj, _StructLike):
+            return obj
+
+        # Find and use only the first registered converter that matches the object's type.
+        handler = next(filter(lambda x: x.matches(obj), annotation_registry), None)
+    else:
+        plan = annotation_registry.plan(obj)
+        if plan.is_struct:
+            return obj  # pyright: ignore[reportReturnType]
+
+        for converter in plan.candidates:
+            if converter.matches(obj):
+                handler = converter
+                break
+        else:
+            handler = plan.handler
+
     if handler is None:
         msg = (
             f"The object of type '{obj.__class__}' could not be converted to a struct, because "
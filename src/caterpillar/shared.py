@@ -128,6 +128,11 @@ ATTR_UNPACK: Final[str] = "__unpack__"
 
 .. versionadded:: 2.8.0
 """
+ATTR_SKIP: Final[str] = "__skip__"
+"""Attribute that advances the stream past a struct without decoding it.
+
+.. versionadded:: 2.8.2
+"""
 
 # Constants for actions during packing and unpacking
 ATTR_ACTION_PACK: Final[str] = "__action_pack__"
@@ -330,6 +335,8 @@ class PackMixin(Generic[_IT]):
     .. versionadded:: 2.8.1
     """
 
+    __slots__: tuple[str, ...] = ()
+
     @overload
     def to_bytes(
         self,
@@ -418,6 +425,8 @@ class UnpackMixin(Generic[_OT]):
     .. versionadded:: 2.8.1
     """
 
+    __slots__: tuple[str, ...] = ()
+
     def __lshift__(self, data: Buffer | _StreamType) -> _OT:
         """Unpack binary data using the left-shift operator.
 
@@ -0,0 +1,252 @@
+# Copyright (C) MatrixEditor 2023-2026
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+from io import RawIOBase, UnsupportedOperation, SEEK_SET, SEEK_CUR, SEEK_END
+from typing_extensions import override, Buffer
+
+DEFAULT_READAHEAD_SIZE = 1 << 16
+"""Default number of bytes read from the underlying stream at once."""
+
+
+class ReadAheadStream(RawIOBase):
+    """
+    A read-only stream adapter that makes non-seekable sources seekable within
+    a bounded window.
+
+    Data is read from the wrapped stream in large blocks and kept in an internal
+    buffer. At least *buffer_size* bytes before the current position remain
+    available, so small backward seeks (e.g. after scanning for a terminator)
+    are served from memory. Forward seeks consume data from the wrapped stream.
+    Positions are counted from the point where the stream was wrapped.
+
+    :func:`~caterpillar.model.unpack` installs this adapter automatically for
+    non-seekable inputs such as pipes or sockets:
+
+    >>> with socket.create_connection(addr) as sock:
+    ...     obj = unpack(Format, sock.makefile("rb"))
+
+    Readers that already provide :code:`peek()` (e.g. :class:`io.BufferedReader`)
+    are used as they are. The adapter created by :func:`~caterpillar.model.unpack`
+    only requests the bytes that are actually read (*exact*), so that no data
+    after the parsed object is consumed. In this mode, the adapter reports itself
+    as not seekable and :meth:`peek` returns only data that has already been
+    read. Fields that scan for terminators therefore don't read ahead, while
+    :meth:`tell` and :meth:`seek` keep working within the window.
+
+    Note that bytes read ahead are stored in the adapter and not in the wrapped
+    stream. To parse multiple objects from the same source, wrap it once and
+    reuse the adapter. Unused bytes can be taken back with :meth:`detach`:
+
+    >>> stream = ReadAheadStream(sock.makefile("rb", buffering=0))
+    >>> first = unpack(Format, stream)
+    >>> second = unpack(Format, stream)
+    >>> raw, rest = stream.detach()
+
+    :param io: The underlying (blocking) stream to read from.
+    :type io: RawIOBase
+    :param buffer_size: The read-ahead block size and the guaranteed length of
+        the backward seek window, defaults to :data:`DEFAULT_READAHEAD_SIZE`.
+    :type buffer_size: int
+    :param exact: Whether to read only the requested number of bytes from the
+        wrapped stream instead of whole blocks, defaults to False. Exact
+        adapters are not seekable (see above).
+    :type exact: bool
+    """
+
+    def __init__(
+        self,
+        io: RawIOBase,
+        buffer_size: int = DEFAULT_READAHEAD_SIZE,
+        exact: bool = False,
+    ) -> None:
+        if buffer_size <= 0:
+            raise ValueError(f"Invalid buffer size: {buffer_size}")
+
+        self._io: RawIOBase = io
+        self._buffer_size: int = buffer_size
+        self._exact: bool = exact
+        self._buffer: bytearray = bytearray()
+        # absolute position of the first byte in the buffer
+        self._start: int = 0
+        self._pos: int = 0
+        self._eof: bool = False
+
+    def _fill(self, size: int) -> int:
+        # Ensures that at least 'size' bytes after the current position are
+        # buffered (unless EOF has been reached) and returns the number of
+        # available bytes.
+        available = self._start + len(self._buffer) - self._pos
+        while available < size and not self._eof:
+            missing = size - available
+            chunk = self._io.read(missing if self._exact else max(self._buffer_size, missing))
+            if not chunk:
+                self._eof = True
+                break
+            self._buffer.extend(chunk)
+            available += len(chunk)
+        return max(available, 0)
+
+    def _fill_all(self) -> None:
+        while not self._eof:
+            chunk = self._io.read(self._buffer_size)
+            if not chunk:
+                self._eof = True
+            else:
+                self._buffer.extend(chunk)
+
+    def _trim(self) -> None:
+        # Drop data that is no longer part of the backward seek window. This
+        # happens in larger steps to keep the amortized cost low.
+        behind = self._pos - self._start
+        if behind > 2 * self._buffer_size:
+            drop = min(behind - self._buffer_size, len(self._buffer))
+            del self._buffer[:drop]
+            self._start += drop
+
+    def peek(self, size: int = 1) -> bytes:
+        """
+        Return up to *size* bytes without advancing the stream position.
+
+        In *exact* mode, at most one byte is read from the wrapped stream and
+        only if no data is buffered.
+
+        :param size: The number of bytes to look ahead, defaults to 1.
+        :type size: int
+        :return: The next bytes in the stream, or an empty bytes object at EOF.
+        :rtype: bytes
+        """
+        size = max(size, 1)
+        _ = self._fill(1 if self._exact else size)
+        offset = self._pos - self._start
+        return bytes(self._buffer[offset : offset + size])
+
+    def detach(self) -> tuple[RawIOBase, bytes]:
+        """
+        Separate the adapter from the wrapped stream.
+
+        The adapter is unusable afterward.
+
+        :return: The wrapped stream and all bytes that were read from it but
+            not consumed by the adapter.
+        :rtype: tuple[RawIOBase, bytes]
+        """
+        offset = self._pos - self._start
+        rest = bytes(self._buffer[max(offset, 0) :])
+        io = self._io
+        self._buffer.clear()
+        self.close()
+        return io, rest
+
+    def iseof(self) -> bool:
+        """
+        Check whether the end of the stream has been reached.
+
+        This only performs I/O if the read-ahead buffer has been exhausted.
+
+        :return: True if no more data is available, otherwise False.
+        :rtype: bool
+        """
+        return self._fill(1) == 0
+
+    @override
+    def read(self, size: int | None = -1) -> bytes:
+        """
+        Read up to *size* bytes from the stream.
+
+        :param size: The number of bytes to read, defaults to -1 (read until EOF).
+        :type size: int
+        :return: The read data.
+        :rtype: bytes
+        """
+        if size is None or size < 0:
+            self._fill_all()
+            size = self._start + len(self._buffer) - self._pos
+
+        size = min(size, self._fill(size))
+        offset = self._pos - self._start
+        data = bytes(self._buffer[offset : offset + size])
+        self._pos += len(data)
+        self._trim()
+        return data
+
+    @override
+    def readinto(self, buffer: Buffer, /) -> int:
+        """
+        Read bytes into a pre-allocated, writable buffer.
+
+        :param buffer: The target buffer.
+        :return: The number of bytes read.
+        :rtype: int
+        """
+        view = memoryview(buffer).cast("B")
+        data = self.read(len(view))
+        view[: len(data)] = data
+        return len(data)
+
+    @override
+    def readable(self) -> bool:
+        return True
+
+    @override
+    def seekable(self) -> bool:
+        # Exact adapters must not be used to read ahead, see peek()
+        return not self._exact
+
+    @override
+    def tell(self) -> int:
+        """
+        Returns the current position relative to where the stream was wrapped.
+
+        :return: The current position in the stream.
+        :rtype: int
+        """
+        return self._pos
+
+    @override
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        """
+        Change the stream position.
+
+        Backward seeks are limited to the buffered window. Seeking relative to
+        the end of the stream reads all remaining data.
+
+        :param offset: The offset to seek to.
+        :type offset: int
+        :param whence: The reference point, defaults to ``SEEK_SET``.
+        :type whence: int
+        :raises UnsupportedOperation: If the target lies before the buffered window.
+        :return: The new absolute position.
+        :rtype: int
+        """
+        if whence == SEEK_SET:
+            target = offset
+        elif whence == SEEK_CUR:
+            target = self._pos + offset
+        elif whence == SEEK_END:
+            self._fill_all()
+            target = self._start + len(self._buffer) + offset
+        else:
+            raise ValueError(f"Invalid whence value: {whence}")
+
+        if target < self._start:
+            raise UnsupportedOperation(
+                f"Can't seek to {target}: position is outside of the buffered "
+                + f"window (starting at {self._start})"
+            )
+
+        if target > self._pos:
+            _ = self._fill(target - self._pos)
+        self._pos = target
+        self._trim()
+        return self._pos
@@ -2,7 +2,8 @@ import io
 
 import pytest
 
-from caterpillar.py import CString, pack, unpack, ValidationError
+from caterpillar.py import CString, pack, unpack, uint8, ValidationError
+from caterpillar.model import Sequence
 
 
 def test_fixed_cstring():
@@ -100,3 +101,49 @@ def test_zero_length_is_not_greedy():
 def test_array_of_cstrings():
     seq = CString()[2]
     assert unpack(seq, b"a\x00bb\x00") == ["a", "bb"]
+
+
+def test_array_of_cstrings_restores_position():
+    seq = Sequence({"names": CString[3], "tail": uint8})
+    data = b"a\x00bb\x00ccc\x00\xff"
+    assert unpack(seq, data) == {"names": ["a", "bb", "ccc"], "tail": 255}
+
+
+def test_array_of_cstrings_spanning_chunks():
+    names = ["x" * 5000, "", "y" * 3]
+    data = b"\x00".join(name.encode() for name in names) + b"\x00"
+    assert unpack(CString[3], data) == names
+    assert unpack(CString[...], data) == names
+    assert unpack(CString[...], data[:-1]) == names
+
+
+def test_array_of_fixed_cstrings():
+    assert unpack(CString(4)[2], b"ab\x00\x00cdef") == ["ab", "cdef"]
+    assert unpack(CString(4)[...], b"ab\x00\x00cd") == ["ab", "cd"]
+
+
+def test_array_of_cstrings_buffered_non_seekable():
+    class NonSeekable(io.RawIOBase):
+        def __init__(self, data):
+            self._data = data
+            self._pos = 0
+
+        def readable(self):
+            return True
+
+        def seekable(self):
+            return False
+
+        def readinto(self, buffer):
+            chunk = self._data[self._pos : self._pos + len(buffer)]
+            buffer[: len(chunk)] = chunk
+            self._pos += len(chunk)
+            return len(chunk)
+
+    stream = io.BufferedReader(NonSeekable(b"a\x00bb\x00rest"))
+    assert unpack(CString[2], stream) == ["a", "bb"]
+    assert stream.read() == b"rest"
+
+    stream = io.BufferedReader(NonSeekable(b"a\x00bb\x00\xff"))
+    seq = Sequence({"names": CString[2], "tail": uint8})
+    assert unpack(seq, stream) == {"names": ["a", "bb"], "tail": 255}
@@ -2,7 +2,15 @@ import enum
 
 import pytest
 
-from caterpillar.py import Enum, InvalidValueError, ValidationError, pack, uint8, unpack
+from caterpillar.py import (
+    Enum,
+    InvalidValueError,
+    ValidationError,
+    pack,
+    struct,
+    uint8,
+    unpack,
+)
 
 
 class Color(enum.Enum):
@@ -70,3 +78,37 @@ def test_intflag_unknown_bits_return_pseudo_member():
 def test_strict_raw_int_pack_raises():
     with pytest.raises(ValidationError):
         pack(1, Enum(Color, uint8, strict=True))
+
+
+def test_enum_sequence_is_decoded_at_once():
+    field = Enum(Color, uint8)[4]
+    assert unpack(field, b"\x01\x02\x07\x01") == [Color.RED, Color.BLUE, 7, Color.RED]
+    assert pack([Color.RED, Color.BLUE, 7, Color.RED], field) == b"\x01\x02\x07\x01"
+
+    field = Enum(Color, uint8, default=Color.BLUE)[...]
+    assert unpack(field, b"\x01\xff") == [Color.RED, Color.BLUE]
+
+
+def test_enum_sequence_with_flags_and_names():
+    assert unpack(Enum(Perm, uint8)[2], b"\x00\x03") == [Perm(0), Perm(3)]
+    assert Enum(Color, uint8).decode("RED", None) is Color.RED
+
+
+def test_strict_enum_sequence_reports_invalid_element():
+    field = Enum(Code, uint8, strict=True)
+
+    @struct
+    class Counted:
+        a: uint8
+        items: field[3]
+
+    with pytest.raises(InvalidValueError) as info:
+        unpack(Counted, b"\x00\x01\x02\x07")
+    assert info.value.context._path == "<root>.items.2"
+
+    @struct
+    class Greedy:
+        items: field[...]
+
+    # greedy arrays stop at the first element that cannot be parsed
+    assert unpack(Greedy, b"\x01\x07\x02").items == [Code.A]
@@ -0,0 +1,173 @@
+import enum
+import pytest
+
+from caterpillar.py import (
+    Field,
+    Sequence,
+    uint8,
+    uint16,
+    unpack,
+    BigEndian,
+    Dynamic,
+    Flag,
+    GLOBAL_FIELD_FLAGS,
+    set_field_flags,
+    invalidate_options,
+    SwitchTable,
+    DEFAULT_OPTION,
+    Bytes,
+    OptionError,
+    VARINT_LSB,
+    vint,
+)
+from caterpillar import options
+from caterpillar.byteorder import O_DEFAULT_ENDIAN
+
+
+def test_field_uses_slots():
+    field = Field(uint8)
+    assert not hasattr(field, "__dict__")
+    assert field.get_name() == "_"
+
+    field.__name__ = "value"
+    assert field.get_name() == "value"
+
+    with pytest.raises(AttributeError):
+        field.unknown = 1
+
+
+def test_sequence_members_use_slots():
+    seq = Sequence({"a": uint8, "b": uint8[2]})
+    for member in seq.fields:
+        assert not hasattr(member, "__dict__")
+
+
+def test_field_freezes_order_and_flags():
+    field = Field(uint16, order=BigEndian)
+    field.freeze()
+    assert field._order_ch == BigEndian.ch
+
+    field.order = Dynamic
+    field.freeze()
+    assert field._order_ch is None
+    assert unpack(field, b"\x00\x01", order=BigEndian) == 1
+
+
+def test_field_frozen_state_invalidated_by_global_options():
+    field = Field(uint16)
+    assert unpack(field, b"\x00\x01") == 256
+    # the byteorder of a single call is read from the context
+    epoch = options._OPTIONS_EPOCH
+    assert unpack(field, b"\x00\x01", order=BigEndian) == 1
+    assert field._order_ch is None
+    assert options._OPTIONS_EPOCH == epoch
+    assert unpack(field, b"\x00\x01") == 256
+
+    O_DEFAULT_ENDIAN.value = BigEndian
+    try:
+        assert unpack(field, b"\x00\x01") == 1
+    finally:
+        O_DEFAULT_ENDIAN.value = None
+
+    flag = Flag("test.frozen")
+    assert not field.has_flag(flag)
+    try:
+        set_field_flags(flag)
+        assert field.has_flag(flag)
+    finally:
+        GLOBAL_FIELD_FLAGS.discard(flag)
+        invalidate_options()
+    assert not field.has_flag(flag)
+
+
+def test_field_flags_mutated_in_place():
+    flag = Flag("test.in_place")
+    field = Field(uint8)
+    assert not field.has_flag(flag)
+    field.flags.add(flag)
+    assert field.has_flag(flag)
+    field.flags.discard(flag)
+    assert not field.has_flag(flag)
+
+    # no explicit invalidate_options() call required
+    epoch = options._OPTIONS_EPOCH
+    GLOBAL_FIELD_FLAGS.add(flag)
+    try:
+        assert options._OPTIONS_EPOCH != epoch
+        assert field.has_flag(flag)
+    finally:
+        GLOBAL_FIELD_FLAGS.discard(flag)
+    assert not field.has_flag(flag)
+
+
+def test_sequence_follows_in_place_flag_changes():
+    seq = Sequence({"value": vint})
+    data = b"\x01\x81"
+    plain = unpack(seq, data)["value"]
+    lsb = unpack(Field(vint) | VARINT_LSB, data)
+    assert plain != lsb
+
+    seq.get_members()["value"].flags.add(VARINT_LSB)
+    assert unpack(seq, data)["value"] == lsb
+    seq.get_members()["value"].flags.clear()
+    assert unpack(seq, data)["value"] == plain
+
+    GLOBAL_FIELD_FLAGS.add(VARINT_LSB)
+    try:
+        assert unpack(seq, data)["value"] == lsb
+    finally:
+        GLOBAL_FIELD_FLAGS.remove(VARINT_LSB)
+    assert unpack(seq, data)["value"] == plain
+
+
+def test_field_specialize_kinds():
+    unpack_fn, pack_fn = Field(uint8).specialize()
+    assert unpack_fn.__name__ == "unpack_plain"
+    assert pack_fn.__name__ == "pack_plain"
+
+    unpack_fn, _ = Field(uint8, condition=lambda context: True).specialize()
+    assert unpack_fn.__name__ == "unpack_conditional"
+
+    unpack_fn, _ = Field(uint8, condition=False).specialize()
+    assert unpack_fn.__name__ == "unpack_disabled"
+
+    field = Field(uint8, offset=2)
+    unpack_fn, _ = field.specialize()
+    assert unpack_fn == field.__unpack__
+
+
+def test_sequence_finalized_members_follow_changes():
+    seq = Sequence({"a": uint8, "b": uint8})
+    assert unpack(seq, b"\x01\x02") == {"a": 1, "b": 2}
+
+    # changing a field after finalization falls back to the generic path
+    seq.get_members()["b"].condition = False
+    assert unpack(seq, b"\x01\x02") == {"a": 1, "b": None}
+
+
+class Kind(enum.Enum):
+    A = 1
+    B = 2
+
+
+def test_switch_table_normalizes_enum_keys():
+    table = SwitchTable({Kind.A: uint8, DEFAULT_OPTION: uint16})
+    assert table[Kind.A] is table[1]
+    assert table[0xFF] is table.default
+
+    table = SwitchTable({1: uint8})
+    assert table[Kind.A] is table[1]
+    with pytest.raises(KeyError):
+        _ = table[Kind.B]
+
+
+def test_switch_dispatch_with_default():
+    field = Field(uint8) >> {Kind.A: uint8, 2: uint16, DEFAULT_OPTION: Bytes(1)}
+    assert isinstance(field.options, SwitchTable)
+    assert unpack(field, b"\x01\x05") == 5
+    assert unpack(field, b"\x02\x05\x00") == 5
+    assert unpack(field, b"\x03\x05") == b"\x05"
+
+    field = Field(uint8) >> {1: uint8}
+    with pytest.raises(OptionError):
+        unpack(field, b"\x02\x05")
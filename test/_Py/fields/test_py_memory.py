@@ -42,8 +42,9 @@ def test_py_memory_length_dyn():
 
     # The length must be set otherwise there will be an error
     assert sizeof(field, length=length) == length
-    with pytest.raises(AttributeError):
+    with pytest.raises(DynamicSizeError) as info:
         _ = sizeof(field)
+    assert isinstance(info.value.__cause__, AttributeError)
 
     assert pack(value, field, length=length) == value
     with pytest.raises(ValidationError):
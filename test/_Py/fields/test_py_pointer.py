@@ -2,7 +2,20 @@ import io
 
 import pytest
 
-from caterpillar.py import Pointer, StructException, pack, pointer, struct, uint8, unpack
+from caterpillar.py import (
+    Bytes,
+    CString,
+    Pointer,
+    ReadAheadStream,
+    Sequence,
+    StructException,
+    pack,
+    pointer,
+    struct,
+    uint8,
+    unpack,
+    f,
+)
 
 
 @struct
@@ -70,6 +83,31 @@ def test_pack_pointer_object_writes_pointed_to_model_at_offset():
     assert pack(ptr, Pointer(uint8, Target)) == b"\x02\x00\xab"
 
 
-def test_non_seekable_stream_with_model_raises_struct_exception():
+def test_non_seekable_stream_with_model_uses_readahead():
+    ptr = unpack(Pointer(uint8, Target), NonSeekable(b"\x02\x00\xab"))
+    assert int(ptr) == 2
+    assert ptr.obj == Target(0xAB)
+
+
+def test_target_outside_readahead_window_raises_struct_exception():
+    stream = ReadAheadStream(NonSeekable(b"\x00\xab" + b"\x00" * 9 + b"\x01"), 1)
+    seq = Sequence({"pad": Bytes(11), "ptr": Pointer(uint8, Target)})
     with pytest.raises(StructException):
-        unpack(Pointer(uint8, Target), NonSeekable(b"\x02\x00\xab"))
+        unpack(seq, stream)
+
+
+def test_non_strict_pointer_ignores_nested_errors():
+    @struct
+    class Name:
+        s: f[str, CString(encoding="ascii")]
+
+    @struct
+    class Format:
+        p: f[int, Pointer(uint8, Name)]
+        tail: uint8
+
+    obj = unpack(Format, b"\x02\x07\xff\x00")
+    assert int(obj.p) == 2
+    assert obj.p.obj is None
+    # the stream position is restored after the failed dereference
+    assert obj.tail == 7
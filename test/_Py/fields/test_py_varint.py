@@ -0,0 +1,103 @@
+import io
+import random
+
+import pytest
+
+from caterpillar.py import (
+    BigEndian,
+    LittleEndian,
+    VARINT_LSB,
+    StructException,
+    uint8,
+    vint,
+    pack,
+    unpack,
+)
+from caterpillar.model import Sequence
+
+
+class NonSeekable(io.RawIOBase):
+    def __init__(self, data):
+        self._data = data
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def read(self, n=-1):
+        if n is None or n < 0:
+            n = len(self._data) - self._pos
+        chunk = self._data[self._pos : self._pos + n]
+        self._pos += len(chunk)
+        return chunk
+
+
+@pytest.mark.parametrize(
+    "field, expected",
+    [
+        (BigEndian + vint, b"\x88\x00"),
+        (BigEndian + vint | VARINT_LSB, b"\x08\x80"),
+        (LittleEndian + vint, b"\x80\x08"),
+        (LittleEndian + vint | VARINT_LSB, b"\x00\x88"),
+    ],
+)
+def test_varint_encoding(field, expected):
+    assert pack(1024, field) == expected
+    assert unpack(field, expected) == 1024
+
+
+def test_varint_seq_roundtrip():
+    random.seed(0)
+    values = [random.getrandbits(random.randint(0, 80)) for _ in range(500)]
+    for order in (LittleEndian, BigEndian):
+        field = (order + vint)[len(values)]
+        data = pack(values, field)
+        assert data == b"".join(pack(v, order + vint) for v in values)
+        assert unpack(field, data) == values
+        assert unpack(field, NonSeekable(data)) == values
+
+
+def test_varint_seq_restores_stream_position():
+    seq = Sequence({"values": vint[3], "tail": uint8})
+    data = b"\x01\xac\x02\x7f\xff"
+    assert unpack(seq, data) == {"values": [1, 300, 127], "tail": 255}
+
+    single = Sequence({"value": vint, "tail": uint8})
+    assert unpack(single, b"\xac\x02\xff") == {"value": 300, "tail": 255}
+
+
+def test_varint_greedy_and_prefixed():
+    assert unpack(vint[...], b"\x01\xac\x02") == [1, 300]
+    field = vint[uint8::]
+    assert pack([1, 300], field) == b"\x02\x01\xac\x02"
+    assert unpack(field, b"\x02\x01\xac\x02") == [1, 300]
+
+
+def test_varint_greedy_ignores_incomplete_value():
+    assert unpack(vint[...], b"\x01\xac\x02\x80") == [1, 300]
+    assert unpack(vint[...], b"") == []
+
+
+def test_varint_single_reads_exact():
+    class CountingBytesIO(io.BytesIO):
+        seeks = 0
+
+        def seek(self, *args):
+            self.seeks += 1
+            return super().seek(*args)
+
+    stream = CountingBytesIO(b"\xac\x02\xff")
+    assert unpack(vint, stream) == 300
+    # single values don't read ahead and seek back
+    assert stream.seeks == 0
+    assert stream.read() == b"\xff"
+
+
+def test_varint_truncated_input():
+    with pytest.raises(StructException):
+        _ = unpack(vint, b"\x80")
+    with pytest.raises(StructException):
+        _ = unpack(vint[2], b"\x01\x80")
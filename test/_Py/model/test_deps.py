@@ -0,0 +1,101 @@
+from caterpillar.model import (
+    struct,
+    field_dependencies,
+    struct_dependencies,
+    referenced_fields,
+    unreferenced_fields,
+)
+from caterpillar.fields import Bytes, CString, Field, uint8
+from caterpillar.context import this, parent, SetContextVar
+from caterpillar.byteorder import Dynamic
+from caterpillar.shortcuts import f
+from caterpillar.types import uint8_t, uint16_t, uint32_t
+
+
+@struct
+class Header:
+    type: uint8_t
+    length: uint16_t
+
+
+@struct
+class Format:
+    header: Header
+    flags: uint8_t
+    payload: f[bytes, Bytes(this.header.length)]
+    extra: f[int, uint8 // (this.flags == 1)]
+    count: uint8_t
+    names: f[list[str], CString()[this.count]]
+    crc: uint32_t
+
+
+def test_field_dependencies():
+    deps = field_dependencies(Bytes(this.length) // (parent.flags == 1))
+    assert deps.struct == {"_obj.length"}
+    assert deps.condition == {"_parent._obj.flags"}
+    assert deps.length == deps.offset == deps.switch == set()
+    assert deps.paths == {"_obj.length", "_parent._obj.flags"}
+    assert deps.members == {"length"}
+
+    deps = field_dependencies(uint8[this.count] @ this.start)
+    assert deps.length == {"_obj.count"}
+    assert deps.offset == {"_obj.start"}
+
+    deps = field_dependencies(uint8 >> {1: Bytes(this.size), 2: uint8})
+    assert deps.switch == {"_obj.size"}
+
+    deps = field_dependencies(Dynamic("spec") + uint8)
+    assert deps.order == {"spec"}
+    assert deps.members == set()
+
+
+def test_field_dependencies_unknown():
+    deps = field_dependencies(Field(lambda context: 1))
+    assert deps.struct is None
+    assert deps.paths is None and deps.members is None
+
+    deps = field_dependencies(uint8 // (lambda context: True))
+    assert deps.condition is None
+    assert deps.struct == set()
+
+
+def test_referenced_fields():
+    assert referenced_fields(Format) == {"header", "flags", "count"}
+    assert unreferenced_fields(Format) == ["payload", "extra", "names", "crc"]
+
+
+def test_struct_dependencies():
+    @struct
+    class Child:
+        data: f[bytes, Bytes(parent.length)]
+        size: uint8_t
+        more: f[bytes, Bytes(this.size)]
+
+    # references to the parent become object references of the field
+    assert struct_dependencies(Child) == {"_obj.length"}
+    assert struct_dependencies(Format) == set()
+
+    @struct
+    class Parent:
+        length: uint8_t
+        child: Child
+
+    assert unreferenced_fields(Parent) == ["child"]
+
+
+def test_unknown_dependencies():
+    @struct
+    class Opaque:
+        a: uint8_t
+        b: f[bytes, Bytes(lambda context: context._obj.a)]
+
+    assert referenced_fields(Opaque) is None
+    assert unreferenced_fields(Opaque) is None
+
+    @struct
+    class WithAction:
+        a: uint8_t
+        _: SetContextVar("value", this.a)
+        b: uint8_t
+
+    assert unreferenced_fields(WithAction) is None
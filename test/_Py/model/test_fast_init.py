@@ -0,0 +1,58 @@
+import dataclasses
+
+import pytest
+
+from caterpillar.model import struct, union, unpack, pack
+from caterpillar.fields import uint8, uint16
+from caterpillar.options import S_FAST_INIT, S_SLOTS
+from caterpillar.model import Invisible
+
+
+@struct(options={S_FAST_INIT})
+class Format:
+    a: uint8
+    b: uint16
+
+    def __post_init__(self) -> None:
+        raise AssertionError("__post_init__ must not be called")
+
+
+def test_fast_init():
+    obj = unpack(Format, b"\x01\x02\x00")
+    assert (obj.a, obj.b) == (1, 2)
+    assert type(obj) is Format
+    assert pack(obj) == b"\x01\x02\x00"
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_fast_init_slots(frozen: bool):
+    @struct(options={S_FAST_INIT, S_SLOTS})
+    @dataclasses.dataclass(frozen=frozen)
+    class Slotted:
+        a: uint8
+        b: uint8
+
+    obj = unpack(Slotted, b"\x01\x02")
+    assert not hasattr(obj, "__dict__")
+    assert obj == Slotted(1, 2)
+
+
+def test_fast_init_hidden():
+    @struct(options={S_FAST_INIT})
+    class Hidden:
+        a: uint8
+        b: uint8 = Invisible()
+
+    obj = unpack(Hidden, b"\x01\x02")
+    assert (obj.a, obj.b) == (1, 2)
+
+
+def test_fast_init_union():
+    @union(options={S_FAST_INIT})
+    class Union:
+        a: uint16
+        b: uint8
+
+    # unions are still created through their hook
+    obj = unpack(Union, b"\x01\x02")
+    assert (obj.a, obj.b) == (0x0201, 1)
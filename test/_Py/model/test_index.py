@@ -0,0 +1,148 @@
+from io import BytesIO
+
+import pytest
+
+from caterpillar.model import (
+    struct,
+    sizeof,
+    pack,
+    index,
+    save_index,
+    load_index,
+    RecordFile,
+)
+from caterpillar.fields import uint8, uint16, uintptr, Bytes, CString
+from caterpillar.byteorder import x86, x86_64
+from caterpillar.exception import DynamicSizeError, StructException
+from caterpillar.context import this
+from caterpillar.shortcuts import f
+from caterpillar.types import uint16_t
+
+
+@struct
+class Item:
+    length: f[int, uint8]
+    data: f[bytes, Bytes(this.length)]
+
+
+@struct
+class Fixed:
+    value: uint16_t
+
+
+def _items(count: int) -> bytes:
+    return b"".join(pack(Item(i % 5, bytes(i % 5))) for i in range(count))
+
+
+def test_index_dynamic():
+    data = _items(10)
+    offsets = index(Item, BytesIO(data))
+    assert offsets.typecode == "Q"
+    assert len(offsets) == 10
+    assert list(offsets[:4]) == [0, 1, 3, 6]
+    assert len(index(Item, BytesIO(data), count=3)) == 3
+
+
+def test_index_static():
+    data = b"\x00\x01" * 8
+    offsets = index(Fixed, BytesIO(b"\xff" + data), start=1)
+    assert list(offsets) == list(range(1, 17, 2))
+    assert len(index(uint16, BytesIO(data), count=2)) == 2
+
+
+def test_index_sidecar(tmp_path):
+    path = tmp_path / "items.bin"
+    path.write_bytes(_items(20))
+    offsets = index(Item, str(path))
+
+    save_index(offsets, tmp_path / "items.idx")
+    assert load_index(tmp_path / "items.idx") == offsets
+
+
+def test_record_file(tmp_path):
+    path = tmp_path / "items.bin"
+    path.write_bytes(_items(20))
+    sidecar = tmp_path / "items.idx"
+
+    with RecordFile(Item, str(path), index_path=sidecar) as records:
+        assert len(records) == 20
+        assert records[7] == Item(2, b"\x00\x00")
+        assert records[-1] == Item(4, bytes(4))
+        assert records[3:6] == [Item(3, bytes(3)), Item(4, bytes(4)), Item(0, b"")]
+        assert [list(r) for r in records.chunks(8)] == [
+            list(range(8)),
+            list(range(8, 16)),
+            list(range(16, 20)),
+        ]
+        with pytest.raises(IndexError):
+            _ = records[20]
+
+    # the sidecar file is reused
+    assert sidecar.exists()
+    with RecordFile(Item, str(path), index_path=sidecar) as records:
+        assert list(records) == [Item(i % 5, bytes(i % 5)) for i in range(20)]
+
+
+def test_index_uses_arch():
+    @struct
+    class Entry:
+        kind: uint8
+        ptr: uintptr
+
+    data = bytes(15)
+    assert list(index(Entry, BytesIO(data), arch=x86)) == [0, 5, 10]
+    assert list(index(Entry, BytesIO(data), arch=x86_64)) == [0]
+
+
+def test_index_offset_fields():
+    @struct
+    class WithOffset:
+        a: uint8
+        b: f[int, uint8 @ 0]
+
+    assert list(index(WithOffset, BytesIO(b"\x01\x02\x03"))) == [0, 1, 2]
+
+
+def test_index_empty_record():
+    @struct
+    class Empty:
+        data: f[bytes, Bytes(0)]
+
+    with pytest.raises(StructException):
+        _ = index(Empty, BytesIO(b"\x00"))
+
+
+def test_index_dynamic_size_errors():
+    @struct
+    class Named:
+        name: f[str, CString(...)]
+
+    with pytest.raises(DynamicSizeError):
+        _ = sizeof(Item)
+    with pytest.raises(DynamicSizeError):
+        _ = sizeof(Named)
+    assert list(index(Named, BytesIO(b"a\x00bc\x00"))) == [0, 2]
+
+
+def test_index_propagates_size_errors():
+    class Broken:
+        def __size__(self, context):
+            raise ZeroDivisionError
+
+        def __unpack__(self, context):
+            return None
+
+    with pytest.raises(ZeroDivisionError):
+        _ = index(Broken(), BytesIO(b"\x00"))
+
+
+def test_record_file_absolute_offsets():
+    @struct
+    class Ref:
+        value: f[int, uint8 @ 0]
+        pad: uint8
+
+    with RecordFile(Ref, BytesIO(b"\x07\x00\x00")) as records:
+        assert len(records) == 3
+        # offsets refer to the whole file, not to the record
+        assert records[2] == Ref(7, 0)
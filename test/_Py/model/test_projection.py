@@ -0,0 +1,128 @@
+from io import BytesIO
+
+import pytest
+
+from caterpillar.model import struct, pack, unpack
+from caterpillar.fields import Bytes, CString, uint8
+from caterpillar.context import this, parent
+from caterpillar.exception import StructException
+from caterpillar.shortcuts import f
+from caterpillar.types import uint8_t, uint16_t, uint32_t
+
+
+@struct
+class Header:
+    type: uint8_t
+    length: uint16_t
+
+
+@struct
+class Item:
+    size: uint8_t
+    name: f[str, CString(this.size)]
+
+
+@struct
+class Format:
+    header: Header
+    flags: uint8_t
+    payload: f[bytes, Bytes(this.header.length)]
+    count: uint8_t
+    items: f[list[Item], Item[this.count]]
+    tail: uint32_t
+
+
+DATA = pack(
+    Format(Header(1, 3), 1, b"abc", 2, [Item(1, "x"), Item(2, "yz")], 9),
+    Format,
+)
+
+
+def test_projection_full_equivalence():
+    fields = {"header", "flags", "payload", "count", "items", "tail"}
+    assert unpack(Format, DATA, fields=fields) == unpack(Format, DATA)
+
+
+def test_projection_skips_unselected():
+    stream = BytesIO(DATA)
+    obj = unpack(Format, stream, fields={"tail"})
+    assert obj.tail == 9
+    assert obj.flags is None
+    assert obj.payload is None
+    assert obj.items is None
+    # dependencies of skipped fields are parsed completely
+    assert obj.header == Header(1, 3)
+    assert obj.count == 2
+    assert stream.tell() == len(DATA)
+
+
+def test_projection_nested():
+    obj = unpack(Format, DATA, fields={"header.type", "items.name"})
+    # header.length is required to skip the payload
+    assert obj.header == Header(1, 3)
+    assert obj.payload is None
+    assert obj.items == [Item(1, "x"), Item(2, "yz")]
+    assert obj.tail is None
+
+
+def test_projection_nested_partial():
+    @struct
+    class Outer:
+        a: Header
+        b: uint8_t
+
+    obj = unpack(Outer, b"\x01\x02\x00\x03", fields={"a.type"})
+    assert obj.a == Header(1, None)  # pyright: ignore[reportArgumentType]
+    assert obj.b is None
+
+
+def test_projection_parent_reference():
+    @struct
+    class Child:
+        data: f[bytes, Bytes(parent.length)]
+
+    @struct
+    class Parent:
+        length: uint8_t
+        child: Child
+        value: uint8_t
+
+    obj = unpack(Parent, b"\x02ab\x07", fields={"value"})
+    assert obj.length == 2
+    assert obj.child is None
+    assert obj.value == 7
+
+
+def test_projection_lambda_fallback():
+    @struct
+    class Opaque:
+        length: uint8_t
+        data: f[bytes, Bytes(lambda ctx: ctx._obj.length)]
+        value: uint8_t
+
+    # dependencies of lambda functions are unknown, everything is parsed
+    obj = unpack(Opaque, b"\x02ab\x07", fields={"value"})
+    assert obj == Opaque(2, b"ab", 7)
+
+
+def test_projection_unknown_field():
+    with pytest.raises(StructException):
+        _ = unpack(Format, DATA, fields={"unknown"})
+
+
+def test_projection_skips_offset_fields():
+    @struct
+    class WithOffset:
+        a: uint8_t
+        b: f[int, uint8 @ 3]
+
+    @struct
+    class W:
+        s: WithOffset
+        t: uint8_t
+
+    data = b"\x01\x03\x00\x04"
+    assert unpack(W, data).t == 3
+    obj = unpack(W, data, fields={"t"})
+    assert obj.s is None
+    assert obj.t == 3
@@ -0,0 +1,79 @@
+from caterpillar.model import Sequence, struct, unpack
+from caterpillar.fields import Bytes, Field, uint8
+from caterpillar.context import this
+from caterpillar.options import S_DISCARD_UNNAMED
+from caterpillar.shortcuts import f
+
+
+def test_sequence_unpack_data():
+    seq = Sequence({"a": uint8, "b": uint8})
+    seq.add_field("data", Field(Bytes(this.a)), included=False)
+    data = unpack(seq, b"\x02\x03ab")
+    # the object context becomes the result, without internal keys
+    assert dict(data) == {"a": 2, "b": 3}
+
+
+def test_struct_unpack_discarded():
+    @struct(options=[S_DISCARD_UNNAMED])
+    class Format:
+        length: uint8
+        _: f[bytes, Bytes(this.length)]
+        value: uint8
+
+    # discarded fields can still be referenced while parsing
+    obj = unpack(Format, b"\x02ab\x07")
+    assert obj == Format(length=2, value=7)
+    assert not hasattr(obj, "_")
+
+
+def test_sequence_keeps_object_context():
+    captured = []
+
+    def capture(context):
+        captured.append(context._obj)
+        return 0
+
+    seq = Sequence({"a": uint8, "b": uint8, "c": capture})
+    seq.add_field("data", Field(Bytes(this.a)), included=False)
+    data = unpack(seq, b"\x02\x03ab")
+    assert dict(data) == {"a": 2, "b": 3, "c": 0}
+    # excluded members are filtered into a new result, the object context
+    # itself stays as parsed
+    obj_context = captured[-1]
+    assert obj_context is not data
+    assert obj_context["data"] == b"ab"
+
+
+def test_sequence_object_context_is_result():
+    captured = []
+
+    def capture(context):
+        captured.append(context._obj)
+        return 0
+
+    seq = Sequence({"a": uint8, "c": capture})
+    data = unpack(seq, b"\x02")
+    # without excluded members, the values are stored only once and the
+    # object context holds no parent reference
+    assert data is captured[0]
+    assert dict(data) == {"a": 2, "c": 0}
+
+
+def test_struct_keeps_object_context():
+    captured = []
+
+    def capture(context):
+        captured.append(context._obj)
+        return 0
+
+    @struct(options=[S_DISCARD_UNNAMED])
+    class Format:
+        length: uint8
+        _: f[bytes, Bytes(this.length)]
+        value: uint8
+        last: capture
+
+    obj = unpack(Format, b"\x02ab\x07")
+    assert obj.value == 7
+    assert captured[0]["_"] == b"ab"
+    assert "_parent" not in captured[0]
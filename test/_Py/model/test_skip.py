@@ -0,0 +1,140 @@
+from io import BytesIO
+
+import pytest
+
+from caterpillar.model import struct, bitfield, skip, pack, unpack
+from caterpillar.fields import (
+    Bytes,
+    CString,
+    Prefixed,
+    uint8,
+    uint16,
+    uint32,
+)
+from caterpillar.context import this
+from caterpillar.exception import StructException, ValidationError
+from caterpillar.shortcuts import f
+from caterpillar.types import int4_t, uint8_t, uint32_t
+
+
+@struct
+class Static:
+    a: uint8_t
+    b: uint32_t
+
+
+@struct
+class Dynamic:
+    length: uint8_t
+    data: f[bytes, Bytes(this.length)]
+    name: f[str, CString()]
+
+
+def test_skip_primitives():
+    assert skip(uint32, b"\x00" * 8) == 4
+    assert skip(uint16[3], b"\x00" * 8, as_field=True) == 6
+    assert skip(uint8[uint16::], b"\x02\x00\x01\x02\x03", as_field=True) == 4
+    with pytest.raises(StructException):
+        _ = skip(uint32, b"\x00" * 2)
+
+
+def test_skip_bytes():
+    stream = BytesIO(b"\x01\x02\x03\x04\x05")
+    assert skip(Bytes(2), stream) == 2
+    assert skip(Bytes(...), stream) == 3
+    assert stream.tell() == 5
+    assert skip(Prefixed(uint8), b"\x03abcd") == 4
+    assert skip(CString(), b"abc\x00def\x00") == 4
+    assert skip(CString[2], b"abc\x00def\x00", as_field=True) == 8
+
+
+def test_skip_struct():
+    data = pack(Static(1, 2))
+    assert skip(Static, data + b"\xff") == 5
+
+    data = pack(Dynamic(3, b"abc", "name")) + pack(Dynamic(1, b"x", ""))
+    stream = BytesIO(data)
+    assert skip(Dynamic, stream) == 9
+    assert unpack(Dynamic, stream) == Dynamic(1, b"x", "")
+
+
+def test_skip_struct_sequence():
+    @struct
+    class Format:
+        count: uint8_t
+        items: f[list[Dynamic], Dynamic[this.count]]
+        static: f[list[Static], Static[2]]
+
+    obj = Format(2, [Dynamic(1, b"a", "b"), Dynamic(0, b"", "")], [Static(1, 2)] * 2)
+    data = pack(obj)
+    assert skip(Format, data + b"\x00") == len(data)
+
+
+def test_skip_bitfield():
+    @bitfield
+    class Flags:
+        a: int4_t
+        b: int4_t
+        c: uint8_t
+
+    assert skip(Flags, b"\x00\x00\x00") == 2
+
+
+def test_skip_fallback():
+    class Custom:
+        def __unpack__(self, context):
+            return context._io.read(3)
+
+    assert skip(Custom(), b"\x00" * 4) == 3
+
+
+def test_skip_validation():
+    with pytest.raises(ValidationError):
+        _ = skip(Static, b"\x00" * 4)
+
+
+def test_skip_struct_with_offset_field():
+    @struct
+    class WithOffset:
+        a: uint8_t
+        b: f[int, uint8 @ 3]
+
+    data = b"\x01\x02\x03\x04"
+    stream = BytesIO(data)
+    _ = unpack(WithOffset, stream)
+    position = stream.tell()
+
+    stream = BytesIO(data)
+    assert skip(WithOffset, stream) == position
+
+    @struct
+    class Outer:
+        inner: WithOffset
+        c: uint8_t
+
+    assert skip(Outer, data) == position + 1
+
+
+def test_skip_fixed_cstring_requires_data():
+    with pytest.raises(StructException):
+        _ = skip(CString(4), b"ab")
+
+
+def test_skip_resolves_stream_size_once(tmp_path, monkeypatch):
+    from caterpillar import _common
+
+    calls = []
+    original = _common.stream_size
+
+    def counting(stream):
+        calls.append(stream)
+        return original(stream)
+
+    monkeypatch.setattr(_common, "stream_size", counting)
+    data = pack(Static(a=1, b=2), Static) * 8
+    path = tmp_path / "records.bin"
+    path.write_bytes(data)
+    with path.open("rb") as stream:
+        assert skip(Static[...], stream, as_field=True) == len(data)
+    # the size of the file is determined once for the whole call
+    assert len(calls) == 1
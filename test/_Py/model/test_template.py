@@ -0,0 +1,81 @@
+import gc
+import sys
+import types
+import weakref
+
+from caterpillar.model import (
+    TemplateTypeVar,
+    template,
+    derive,
+    clear_derive_cache,
+    pack,
+    unpack,
+)
+from caterpillar.fields import uint16, uint32
+from caterpillar.shared import hasstruct
+from caterpillar.model import _template
+from caterpillar.model._template import _DERIVE_CACHE
+
+A = TemplateTypeVar("A")
+
+
+@template(A)
+class Format:
+    value: A
+    values: A[2]
+
+
+def test_derive_template():
+    Format16 = derive(Format, uint16)
+    assert hasstruct(Format16)
+
+    obj = Format16(value=1, values=[2, 3])
+    data = pack(obj)
+    assert data == b"\x01\x00\x02\x00\x03\x00"
+    assert unpack(Format16, data) == obj
+
+
+def test_derive_cache():
+    Format16 = derive(Format, uint16)
+    assert derive(Format, uint16) is Format16
+    assert derive(Format, A=uint16) is not derive(Format, A=uint32)
+
+    clear_derive_cache()
+    assert derive(Format, uint16) is not Format16
+
+
+def test_derive_cache_across_modules():
+    module = types.ModuleType("_derive_test_module")
+    sys.modules[module.__name__] = module
+    try:
+        namespace = {
+            "__name__": module.__name__,
+            "derive": derive,
+            "Format": Format,
+            "uint16": uint16,
+        }
+        exec("Named = derive(Format, uint16, name='Named')", namespace)
+        # the class keeps the module of its first derivation
+        other = derive(Format, uint16, name="Named")
+        assert other is namespace["Named"]
+        assert other.__module__ == module.__name__
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_derive_cache_hit_skips_caller_lookup(monkeypatch):
+    Format16 = derive(Format, uint16)
+
+    def fail(frame=1):
+        raise AssertionError("caller module resolved on a cache hit")
+
+    monkeypatch.setattr(_template, "get_caller_module", fail)
+    assert derive(Format, uint16) is Format16
+
+
+def test_derive_cache_is_weak():
+    clear_derive_cache()
+    derived = weakref.ref(derive(Format, uint32))
+    gc.collect()
+    assert derived() is None
+    assert len(_DERIVE_CACHE) == 0
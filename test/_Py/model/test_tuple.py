@@ -0,0 +1,111 @@
+import pickle
+
+from caterpillar.model import Sequence, struct, bitfield, unpack
+from caterpillar.fields import uint8, uint16, CString
+from caterpillar.context import this
+from caterpillar.options import S_TUPLE_MODEL, O_TUPLE_MODEL, O_ARRAY_FACTORY
+from caterpillar.shortcuts import f
+from caterpillar.shared import getstruct
+from caterpillar import options as _options
+
+
+@struct
+class Point:
+    x: uint8
+    y: uint8
+
+
+@struct
+class Shape:
+    name: f[str, CString()]
+    count: uint8
+    points: f[list[Point], Point[this.count]]
+    raw: f[list[int], uint8[2]]
+
+
+@struct(options={S_TUPLE_MODEL})
+class Entry:
+    a: uint8
+    b: uint8
+
+
+DATA = b"abc\x00\x02\x01\x02\x03\x04\x05\x06"
+
+
+def test_tuple_model_option():
+    @struct(options={S_TUPLE_MODEL})
+    class Record:
+        a: uint8
+        b: uint16
+        point: Point
+
+    obj = unpack(Record, b"\x01\x02\x00\x03\x04")
+    assert isinstance(obj, tuple)
+    assert obj == (1, 2, Point(3, 4))
+    assert (obj.a, obj.b) == (1, 2)
+    # the tuple type is distinct from the model
+    assert type(obj).__name__ == "RecordTuple"
+    assert not isinstance(obj, Record)
+    # nested structs keep their own mode
+    assert isinstance(obj.point, Point)
+
+
+def test_unpack_as_tuple():
+    obj = unpack(Shape, DATA, as_tuple=True)
+    assert obj == ("abc", 2, ((1, 2), (3, 4)), (5, 6))
+    assert obj.points[1].y == 4
+    assert isinstance(obj.points, tuple) and isinstance(obj.raw, tuple)
+    assert hash(obj) == hash(unpack(Shape, DATA, as_tuple=True))
+    # the global state is restored afterward
+    assert O_TUPLE_MODEL.value is False
+    assert O_ARRAY_FACTORY.value is None
+    assert unpack(Shape, DATA).points == [Point(1, 2), Point(3, 4)]
+
+
+def test_unpack_as_tuple_sequence():
+    seq = Sequence({"a": uint8, "_": uint8})
+    obj = unpack(seq, b"\x01\x02", as_tuple=True)
+    assert obj == (1, 2)
+    # invalid names are replaced by their position
+    assert obj._fields == ("a", "_1")
+
+
+def test_unpack_as_tuple_bitfield():
+    @bitfield
+    class Flags:
+        a: 4
+        b: 4
+
+    obj = unpack(Flags, b"\x12", as_tuple=True)
+    assert obj == (1, 2)
+    assert (obj.a, obj.b) == (1, 2)
+
+
+def test_unpack_as_tuple_projection():
+    obj = unpack(Shape, DATA, fields={"raw"}, as_tuple=True)
+    assert obj.raw == (5, 6)
+    assert obj.points is None
+
+
+def test_unpack_as_tuple_keeps_type():
+    epoch = _options._OPTIONS_EPOCH
+    first = unpack(Shape, DATA, as_tuple=True)
+    second = unpack(Shape, DATA, as_tuple=True)
+    assert type(first) is type(second)
+    # the tuple mode is passed through the context
+    assert _options._OPTIONS_EPOCH == epoch
+    # the tuple type survives finalize() as long as the layout is the same
+    getstruct(Shape).finalize()
+    assert type(unpack(Shape, DATA, as_tuple=True)) is type(first)
+
+
+def test_tuple_pickle():
+    obj = unpack(Entry, b"\x01\x02")
+    assert type(obj).__qualname__ == "EntryTuple"
+    assert type(obj).__module__ == __name__
+    copy = pickle.loads(pickle.dumps(obj))
+    assert copy == obj and type(copy) is type(obj)
+
+    shape = unpack(Shape, DATA, as_tuple=True)
+    copy = pickle.loads(pickle.dumps(shape))
+    assert copy == shape and type(copy.points[0]) is type(shape.points[0])
@@ -0,0 +1,64 @@
+import pytest
+
+from caterpillar.model import union, BufferedUnionHook, pack, unpack
+from caterpillar.fields import Bytes
+from caterpillar.options import S_SLOTS
+from caterpillar.exception import InvalidValueError
+from caterpillar.shortcuts import f
+from caterpillar.types import uint16_t, uint32_t
+
+
+@union(hook_cls=BufferedUnionHook)
+class Value:
+    number: uint32_t
+    half: uint16_t
+    raw: f[bytes, Bytes(4)]
+
+
+def test_union_default_hook():
+    @union
+    class Format:
+        number: uint32_t
+        raw: f[bytes, Bytes(4)]
+
+    obj = Format()
+    obj.number = 0x01020304
+    assert obj.raw == b"\x04\x03\x02\x01"
+
+
+def test_buffered_union_lazy_members():
+    obj = Value()
+    assert obj.number is None
+    obj.number = 0x01020304
+    # other members are decoded on access only
+    assert "raw" not in vars(obj)
+    assert obj.raw == b"\x04\x03\x02\x01"
+    assert obj.half == 0x0304
+    assert obj == Value(0x01020304, 0x0304, b"\x04\x03\x02\x01")
+
+
+def test_buffered_union_write_in_place():
+    obj = Value()
+    obj.number = 0x01020304
+    # smaller members preserve the remaining bytes
+    obj.half = 0xAABB
+    assert obj.number == 0x0102AABB
+    assert obj.raw == b"\xbb\xaa\x02\x01"
+    hook = Value.__struct__._union_hook
+    assert hook.get_buffer(obj) == b"\xbb\xaa\x02\x01"
+
+
+def test_buffered_union_seed():
+    obj = unpack(Value, b"\x01\x02\x03\x04")
+    assert obj.number == 0x04030201
+    obj.half = 0
+    assert obj.raw == b"\x00\x00\x03\x04"
+    assert pack(obj) == b"\x00\x00\x03\x04"
+
+
+def test_buffered_union_slots():
+    with pytest.raises(InvalidValueError):
+
+        @union(hook_cls=BufferedUnionHook, options=[S_SLOTS])
+        class Format:
+            number: uint32_t
@@ -203,3 +203,26 @@ def test_dyn_byteorder_action():
     assert data.hex() == "1234bc9a7856"
 
 
+
+
+def test_dyn_byteorder_getch():
+    from caterpillar.byteorder import getch
+    from caterpillar.context import Context
+
+    context = Context(spec=1)
+    assert getch(BigEndian, context) == BigEndian.ch
+    assert BigEndian.getch(context) == BigEndian.ch
+    # dynamic byte orders resolve from the given context directly
+    assert getch(Dynamic(ctx.spec), context) == LittleEndian.ch
+    context.spec = 0
+    assert getch(Dynamic(ctx.spec), context) == BigEndian.ch
+
+
+def test_dyn_byteorder_field_unpack():
+    @struct(order=BigEndian, kw_only=True)
+    class Format:
+        spec: uint8_t = 0
+        a: f[int, Dynamic(this.spec) + uint16]
+
+    assert unpack(Format, b"\x00\x12\x34").a == 0x1234
+    assert unpack(Format, b"\x01\x12\x34").a == 0x3412
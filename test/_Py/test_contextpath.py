@@ -3,6 +3,7 @@ from types import SimpleNamespace
 import pytest
 
 from caterpillar.py import Context, ctx as context_path, f, parent, pack, root, struct, this, uint8, unpack
+from caterpillar.context import ContextLength as lenof, compile_expr, expr_paths
 
 
 def sample_context():
@@ -91,3 +92,65 @@ def test_indexing_context_path_is_immutable():
 
     assert first(context) == 10
     assert second(context) == 20
+
+
+def test_compiled_expression_matches_evaluation():
+    context = Context(
+        _obj=Context(length=3, entries=[1, 2, 3], keys=5),
+        _parent=Context(_obj=SimpleNamespace(x=2)),
+    )
+    for expr in (
+        this.length * 2 + 4,
+        (this.length + parent.x) // 2,
+        -this.entries[1],
+        lenof(this.entries) == this.length,
+        this.keys,
+    ):
+        compiled = compile_expr(expr)
+        assert compiled is compile_expr(expr)
+        assert compiled(context) == expr.__evaluate__(context)
+        assert expr(context) == expr.__evaluate__(context)
+
+
+def test_compiled_expression_precedence():
+    context = Context(_obj=Context(x=2, y=3))
+    for expr in (
+        (-2) ** this.x,
+        this.x ** -1,
+        -(this.x ** 2),
+        (this.x + 1) * this.y,
+        this.y - (this.x - 1),
+        ~(this.x | 1),
+    ):
+        assert compile_expr(expr)(context) == expr.__evaluate__(context)
+    assert compile_expr((-2) ** this.x)(context) == 4
+
+
+def test_path_named_like_internals():
+    assert this.evaluate.path == "_obj.evaluate"
+    assert this.evaluate_tokens.path == "_obj.evaluate_tokens"
+
+
+def test_compiled_expression_missing_key_raises_attribute_error():
+    context = Context(_obj=Context(a=1))
+    with pytest.raises(AttributeError):
+        compile_expr(this.b + 1)(context)
+
+
+def test_compile_expr_constants_and_callables():
+    assert compile_expr(3)(Context()) == 3
+    func = lambda context: 7
+    assert compile_expr(func) is func
+    assert compile_expr(this.a + func)(Context(_obj=Context(a=1))) == 8
+
+
+def test_expr_paths():
+    assert expr_paths(this.a) == {"_obj.a"}
+    assert expr_paths(this.a * 2 + parent.b) == {"_obj.a", "_parent._obj.b"}
+    assert expr_paths(-lenof(this.items)) == {"_obj.items"}
+    assert expr_paths(this.items[this.index]) == {"_obj.items", "_obj.index"}
+    assert expr_paths(3) == set()
+    assert expr_paths(lambda context: 1) is None
+    assert expr_paths(this.a + (lambda context: 1)) is None
+    # the whole context is used
+    assert expr_paths(context_path) is None
@@ -0,0 +1,64 @@
+import pytest
+
+from caterpillar.py import (
+    StructException,
+    ValidationError,
+    struct,
+    unpack,
+    uint8,
+    this,
+    f,
+    String,
+    Context,
+)
+from caterpillar.exception import error_context, set_error_context
+
+
+@struct
+class Item:
+    a: uint8
+    b: f[str, String(2, encoding="ascii")]
+
+
+@struct
+class Container:
+    count: uint8
+    items: Item[this.count]
+
+
+def test_error_is_wrapped_once_with_failing_path():
+    with pytest.raises(StructException) as info:
+        # second item is not valid ASCII
+        unpack(Container, b"\x02\x01ab\x02\xff\xff")
+
+    exc = info.value
+    assert isinstance(exc.__cause__, UnicodeDecodeError)
+    assert exc.context is not None
+    assert exc.context._path == "<root>.items.1.b"
+
+
+def test_validation_error_is_propagated():
+    with pytest.raises(ValidationError):
+        unpack(Container, b"\x02\x01")
+
+
+def test_field_default_is_used_on_error():
+    @struct
+    class Format:
+        a: uint8
+        b: f[str, String(2, encoding="ascii")] = "--"
+
+    assert unpack(Format, b"\x01\xff\xff") == Format(1, "--")
+
+
+def test_error_context_without_traceback():
+    exc = ValueError()
+    assert error_context(exc) is None
+
+
+def test_error_context_keeps_innermost():
+    exc = ValueError()
+    inner, outer = Context(_path="inner"), Context(_path="outer")
+    set_error_context(exc, inner)
+    set_error_context(exc, outer)
+    assert error_context(exc) is inner
@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+from caterpillar import options as _options
+from caterpillar.py import (
+    CString,
+    Field,
+    O_PROFILE,
+    Profiler,
+    pack,
+    profile,
+    struct,
+    this,
+    uint8,
+    uint16,
+    unpack,
+)
+
+
+@struct
+class Header:
+    magic: uint16
+    count: uint8
+
+
+@struct
+class Format:
+    header: Header
+    items: uint8[this.header.count]
+    name: CString()
+
+
+DATA = b"\x01\x00\x02\xaa\xbbabc\x00"
+
+
+def test_profile_records_paths():
+    original = Field.__unpack__
+    with profile() as p:
+        assert unpack(Format, DATA).items == [0xAA, 0xBB]
+        assert unpack(Format, DATA).name == "abc"
+
+    # instrumentation is removed afterwards
+    assert Field.__unpack__ is original
+    entries = p.entries
+    assert set(entries) == {
+        "<root>",
+        "<root>.header",
+        "<root>.header.magic",
+        "<root>.header.count",
+        "<root>.items",
+        "<root>.name",
+    }
+    assert entries["<root>"].calls == 2
+    assert entries["<root>"].nbytes == 2 * len(DATA)
+    assert entries["<root>.header"].nbytes == 6
+    assert entries["<root>.name"].nbytes == 8
+    root = entries["<root>"]
+    assert root.own_time <= root.total_time
+
+
+def test_profile_sequence_elements_share_entry():
+    with profile() as p:
+        _ = unpack(Header[3], b"\x00" * 9, as_field=True)
+    assert p.entries["<root>[].magic"].calls == 3
+
+
+def test_profile_option_and_export():
+    profiler = Profiler()
+    O_PROFILE.value = profiler
+    try:
+        assert pack(unpack(Format, DATA)) == DATA
+    finally:
+        O_PROFILE.value = None
+
+    assert profiler.entries["<root>.items"].calls == 2
+    table = profiler.report(limit=2)
+    assert table.splitlines()[0].startswith("path")
+    assert len(table.splitlines()) == 3
+    folded = profiler.flamegraph().splitlines()
+    assert any(line.startswith("<root>;header;magic ") for line in folded)
+
+
+def test_only_one_active_profiler():
+    with profile():
+        with pytest.raises(RuntimeError):
+            with profile():
+                pass
+
+
+def test_profile_option_installs_once():
+    original = Field.__unpack__
+    profiler = Profiler()
+    O_PROFILE.value = profiler
+    try:
+        assert Field.__unpack__ is not original
+        epoch = _options._OPTIONS_EPOCH
+        for _ in range(3):
+            _ = unpack(Format, DATA)
+        # no re-installation (and re-finalization) per call
+        assert _options._OPTIONS_EPOCH == epoch
+    finally:
+        O_PROFILE.value = None
+    assert Field.__unpack__ is original
+    assert profiler.entries["<root>"].calls == 3
+
+
+def test_profile_ignores_other_threads():
+    with profile() as p:
+        thread = threading.Thread(target=unpack, args=(Format, DATA))
+        thread.start()
+        thread.join()
+    assert p.entries == {}
@@ -55,3 +55,44 @@ def test_context_lambda_still_resolves_to_field():
     # Genuine context lambdas (plain callables) must keep resolving to a Field.
     s = registry.to_struct(lambda ctx: uint16)
     assert isinstance(s, Field)
+
+
+def test_registry_index_is_reset_on_change():
+    class Marker:
+        pass
+
+    with pytest.raises(ValidationError):
+        _ = registry.to_struct(Marker())
+
+    converter = registry.TypeConverter(Marker, lambda annotation, kwargs: uint32)
+    registry.annotation_registry.insert(0, converter)
+    try:
+        assert registry.to_struct(Marker()) is uint32
+    finally:
+        registry.annotation_registry.remove(converter)
+
+    with pytest.raises(ValidationError):
+        _ = registry.to_struct(Marker())
+
+
+def test_registry_custom_matches_checked_per_object():
+    class Tagged:
+        def __init__(self, tag: int) -> None:
+            self.tag = tag
+
+    class TagConverter(registry.TypeConverter):
+        def matches(self, annotation: object) -> bool:
+            return isinstance(annotation, Tagged) and annotation.tag == 1
+
+        def convert(self, annotation, kwargs):
+            return uint16
+
+    converter = TagConverter()
+    fallback = registry.TypeConverter(Tagged, lambda annotation, kwargs: uint32)
+    registry.annotation_registry.extend([converter, fallback])
+    try:
+        assert registry.to_struct(Tagged(1)) is uint16
+        assert registry.to_struct(Tagged(2)) is uint32
+    finally:
+        registry.annotation_registry.remove(converter)
+        registry.annotation_registry.remove(fallback)
@@ -0,0 +1,152 @@
+import io
+import mmap
+import os
+
+import pytest
+
+from caterpillar.py import (
+    CString,
+    ReadAheadStream,
+    Sequence,
+    iseof,
+    stream_size,
+    uint8,
+    uint16,
+    unpack,
+    vint,
+)
+
+
+class NonSeekable(io.RawIOBase):
+    def __init__(self, data):
+        self._data = data
+        self._pos = 0
+        self.reads = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def readinto(self, buffer):
+        self.reads += 1
+        chunk = self._data[self._pos : self._pos + min(len(buffer), 7)]
+        buffer[: len(chunk)] = chunk
+        self._pos += len(chunk)
+        return len(chunk)
+
+
+def test_readahead_read_peek_tell():
+    stream = ReadAheadStream(NonSeekable(bytes(range(32))), buffer_size=8)
+    assert stream.seekable()
+    assert stream.peek(2) == b"\x00\x01"
+    assert stream.tell() == 0
+    assert stream.read(3) == b"\x00\x01\x02"
+    assert stream.tell() == 3
+    assert not stream.iseof()
+    assert stream.read() == bytes(range(3, 32))
+    assert stream.iseof()
+    assert stream.read(1) == b""
+
+
+def test_readahead_bounded_seek():
+    stream = ReadAheadStream(NonSeekable(bytes(range(100))), buffer_size=8)
+    assert stream.seek(10) == 10
+    assert stream.read(2) == b"\x0a\x0b"
+    assert stream.seek(-4, io.SEEK_CUR) == 8
+    assert stream.read(1) == b"\x08"
+
+    _ = stream.seek(90)
+    with pytest.raises(io.UnsupportedOperation):
+        _ = stream.seek(0)
+
+    assert stream.seek(-1, io.SEEK_END) == 99
+    assert stream.read() == b"\x63"
+
+
+def test_unpack_wraps_non_seekable_input():
+    data = b"\x03\x00" + b"abc\x00" + b"\x01\x02\x03"
+    seq = Sequence({"count": uint16, "name": CString(), "rest": uint8[...]})
+    result = unpack(seq, NonSeekable(data))
+    assert result == {"count": 3, "name": "abc", "rest": [1, 2, 3]}
+
+
+def test_unpack_offset_on_non_seekable_input():
+    seq = Sequence({"a": uint8, "b": uint8 @ 4})
+    assert unpack(seq, NonSeekable(b"\x01\x00\x00\x00\x05")) == {"a": 1, "b": 5}
+
+
+def test_unpack_keeps_unread_data():
+    raw = NonSeekable(b"\x01\x02\x03\x04")
+    assert unpack(uint8, raw) == 1
+    assert raw.read() == b"\x02\x03\x04"
+
+    # buffered readers aren't wrapped
+    stream = io.BufferedReader(NonSeekable(b"\x01\x02\x03\x04"))
+    assert unpack(uint8, stream) == 1
+    assert stream.read() == b"\x02\x03\x04"
+
+
+def test_unpack_keeps_unread_data_after_scan():
+    # terminator scans must not read ahead on raw streams
+    raw = NonSeekable(b"abc\x00REST")
+    assert unpack(CString(), raw) == "abc"
+    assert raw.read() == b"REST"
+
+    raw = NonSeekable(b"\x81\x01REST")
+    assert unpack(vint, raw) == 129
+    assert raw.read() == b"REST"
+
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"abc\x00\x81\x01REST")
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb", buffering=0) as pipe:
+        assert unpack(CString(), pipe) == "abc"
+        assert unpack(vint, pipe) == 129
+        assert pipe.read() == b"REST"
+
+
+def test_readahead_detach():
+    raw = NonSeekable(b"\x01\x02\x03\x04")
+    stream = ReadAheadStream(raw)
+    assert unpack(uint8, stream) == 1
+    io_, rest = stream.detach()
+    assert io_ is raw
+    assert rest == b"\x02\x03\x04"
+
+
+def test_unpack_reuses_readahead_stream():
+    stream = ReadAheadStream(NonSeekable(b"\x01\x02\x03"))
+    assert unpack(uint8, stream) == 1
+    assert unpack(uint8, stream) == 2
+    assert unpack(uint8, stream) == 3
+
+
+def test_stream_size_known_sources(tmp_path):
+    assert stream_size(io.BytesIO(b"abc")) == 3
+
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"\x01\x02\x03\x04")
+    with open(path, "rb") as fp:
+        assert stream_size(fp) == 4
+        assert unpack(uint8[...], fp) == [1, 2, 3, 4]
+
+    with open(path, "r+b") as fp, mmap.mmap(fp.fileno(), 0) as view:
+        assert stream_size(view) == 4
+
+    assert stream_size(NonSeekable(b"abc")) is None
+
+
+def test_greedy_sequence_does_not_probe_stream():
+    class CountingBytesIO(io.BytesIO):
+        seeks = 0
+
+        def seek(self, *args):
+            CountingBytesIO.seeks += 1
+            return super().seek(*args)
+
+    stream = CountingBytesIO(bytes(range(100)))
+    assert unpack(uint8[...], stream) == list(range(100))
+    assert CountingBytesIO.seeks == 0
+    assert iseof(stream)